@@ -14,7 +14,13 @@ from pcluster.api.controllers.common import (
 )
 from pcluster.api.converters import api_node_type_to_cluster_node_type
 from pcluster.api.errors import BadRequestException, NotFoundException
-from pcluster.api.models import ClusterInstance, DescribeClusterInstancesResponseContent
+from pcluster.api.models import (
+    ClusterInstance,
+    ComputeResourceInstancesCount,
+    DescribeClusterInstancesResponseContent,
+    GetClusterInstancesSummaryResponseContent,
+    InstancesCount,
+)
 from pcluster.api.models import NodeType as ApiNodeType
 from pcluster.aws.common import StackNotFoundError
 from pcluster.models.cluster import Cluster, NodeType
@@ -101,3 +107,40 @@ def describe_cluster_instances(cluster_name, region=None, next_token=None, node_
             )
         )
     return DescribeClusterInstancesResponseContent(instances=ec2_instances, next_token=next_token)
+
+
+@configure_aws_region()
+@convert_errors()
+def get_cluster_instances_summary(cluster_name, region=None, node_type=None, queue_name=None):
+    """
+    Count the instances belonging to a given cluster by queue, compute resource, instance type and state.
+
+    :param cluster_name: Name of the cluster
+    :type cluster_name: str
+    :param region: AWS Region that the operation corresponds to.
+    :type region: str
+    :param node_type: Filter the instances by node type.
+    :type node_type: dict | bytes
+    :param queue_name: Filter the instances by queue name.
+    :type queue_name: str
+
+    :rtype: GetClusterInstancesSummaryResponseContent
+    """
+    cluster = Cluster(cluster_name)
+    summary = cluster.get_instances_summary(
+        node_type=api_node_type_to_cluster_node_type(node_type), queue_name=queue_name
+    )
+    return GetClusterInstancesSummaryResponseContent(
+        total_instances=summary.total,
+        queues=_to_instances_counts(summary.queues),
+        compute_resources=[
+            ComputeResourceInstancesCount(queue_name=queue, compute_resource_name=compute_resource, count=count)
+            for (queue, compute_resource), count in sorted(summary.compute_resources.items())
+        ],
+        instance_types=_to_instances_counts(summary.instance_types),
+        states=_to_instances_counts(summary.states),
+    )
+
+
+def _to_instances_counts(counter):
+    return [InstancesCount(name=name, count=count) for name, count in sorted(counter.items())]
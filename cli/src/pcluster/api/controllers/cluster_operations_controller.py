@@ -9,6 +9,9 @@
 # pylint: disable=W0613
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import Dict, List
 
 from pcluster.api.controllers.common import (
@@ -35,6 +38,8 @@ from pcluster.api.models import (
     Change,
     CloudFormationStackStatus,
     ClusterConfigurationStructure,
+    ClusterDescription,
+    ClusterDescriptionFailure,
     ClusterInfoSummary,
     ClusterStatus,
     CreateClusterBadRequestExceptionResponseContent,
@@ -42,6 +47,7 @@ from pcluster.api.models import (
     CreateClusterResponseContent,
     DeleteClusterResponseContent,
     DescribeClusterResponseContent,
+    DescribeClustersResponseContent,
     EC2Instance,
     Failure,
     InstanceState,
@@ -58,23 +64,30 @@ from pcluster.api.models import (
 )
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import StackNotFoundError
-from pcluster.config.config_patch import ConfigPatch
-from pcluster.config.update_policy import UpdatePolicy
+from pcluster.aws.common import AWSClientError, StackNotFoundError
+from pcluster.constants import PCLUSTER_CLUSTER_NAME_TAG, PCLUSTER_NODE_TYPE_TAG
 from pcluster.models.cluster import (
     Cluster,
     ClusterActionError,
     ClusterUpdateError,
     ConfigValidationError,
+    NodeType,
     NotFoundClusterActionError,
 )
-from pcluster.models.cluster_resources import ClusterStack
+from pcluster.models.cluster_inventory import ClusterInventory, InvalidNextTokenError
+from pcluster.models.cluster_resources import ClusterInstance, ClusterStack
+from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus
 from pcluster.models.login_nodes_status import LoginNodesPoolState
-from pcluster.utils import get_installed_version, to_utc_datetime
+from pcluster.utils import get_chunks, get_installed_version, to_utc_datetime
 from pcluster.validators.common import FailureLevel
 
 LOGGER = logging.getLogger(__name__)
 
+# Timeout of the lookups of describe_cluster, a slow lookup degrades only the related fields of the response
+DESCRIBE_CLUSTER_LOOKUP_TIMEOUT_SEC = 10
+# Maximum number of values of a DescribeInstances filter
+DESCRIBE_INSTANCES_MAX_FILTER_VALUES = 200
+
 
 @convert_errors()
 @http_success_status_code(202)
@@ -216,14 +229,20 @@ def describe_cluster(cluster_name, region=None):
     validate_cluster(cluster)
     cfn_stack = cluster.stack
 
-    fleet_status = cluster.compute_fleet_status
-
-    config_url = "NOT_AVAILABLE"
+    # Once the stack is known, the other lookups are independent: run them concurrently
+    executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="describe-cluster")
     try:
-        config_url = cluster.config_presigned_url
-    except ClusterActionError as e:
-        # Do not fail request when S3 bucket is not available
-        LOGGER.error(e)
+        deadline = time.monotonic() + DESCRIBE_CLUSTER_LOOKUP_TIMEOUT_SEC
+        fleet_status_future = executor.submit(lambda: cluster.compute_fleet_status)
+        config_url_future = executor.submit(_get_config_url, cluster)
+        nodes_future = executor.submit(_get_head_and_login_nodes, cluster)
+    finally:
+        # Do not wait for lookups that exceed the timeout
+        executor.shutdown(wait=False)
+
+    fleet_status = _get_lookup_result(fleet_status_future, "compute fleet status", deadline, ComputeFleetStatus.UNKNOWN)
+    config_url = _get_lookup_result(config_url_future, "configuration url", deadline, "NOT_AVAILABLE")
+    head_node, login_nodes = _get_lookup_result(nodes_future, "head and login nodes", deadline, (None, None))
 
     cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
     response = DescribeClusterResponseContent(
@@ -242,8 +261,7 @@ def describe_cluster(cluster_name, region=None):
         failures=_get_creation_failures(cluster_status, cfn_stack),
     )
 
-    try:
-        head_node = cluster.head_node_instance
+    if head_node:
         response.head_node = EC2Instance(
             instance_id=head_node.id,
             launch_time=to_utc_datetime(head_node.launch_time),
@@ -252,15 +270,38 @@ def describe_cluster(cluster_name, region=None):
             state=InstanceState.from_dict(head_node.state),
             private_ip_address=head_node.private_ip,
         )
-        login_nodes = _get_login_nodes(cluster)
         if login_nodes:
             response.login_nodes = login_nodes
+
+    return response
+
+
+def _get_lookup_result(future, description, deadline, default):
+    """Return the result of a describe_cluster lookup, or the default value if it does not complete in time."""
+    try:
+        return future.result(timeout=max(deadline - time.monotonic(), 0))
+    except FuturesTimeoutError:
+        LOGGER.warning("Timed out after %s seconds retrieving %s", DESCRIBE_CLUSTER_LOOKUP_TIMEOUT_SEC, description)
+        return default
+
+
+def _get_config_url(cluster):
+    try:
+        return cluster.config_presigned_url
+    except ClusterActionError as e:
+        # Do not fail request when S3 bucket is not available
+        LOGGER.error(e)
+        return "NOT_AVAILABLE"
+
+
+def _get_head_and_login_nodes(cluster):
+    try:
+        return cluster.head_node_instance, _get_login_nodes(cluster)
     except ClusterActionError as e:
         # This should not be treated as a failure cause head node and login node might not be running in some cases.
         # e.g. when the cluster is in DELETE_IN_PROGRESS
         LOGGER.info(e)
-
-    return response
+        return None, None
 
 
 def _get_login_nodes(cluster):
@@ -286,6 +327,166 @@ def _get_login_nodes(cluster):
     return None
 
 
+@configure_aws_region()
+@convert_errors()
+def describe_clusters(region=None, cluster_names=None, cluster_status=None):
+    """
+    Retrieve the description of multiple clusters with batched requests, reporting per-cluster failures.
+
+    :param region: AWS Region that the operation corresponds to.
+    :type region: str
+    :param cluster_names: Names of the clusters to describe. (Defaults to all clusters.)
+    :type cluster_names: List[str]
+    :param cluster_status: Filter by cluster status. (Defaults to all clusters.)
+    :type cluster_status: list | bytes
+
+    :rtype: DescribeClustersResponseContent
+    """
+    # A single describe_stacks sweep retrieves the stacks of all the clusters
+    stacks = {}
+    next_token = None
+    while True:
+        page, next_token = AWSApi.instance().cfn.list_pcluster_stacks(next_token=next_token)
+        stacks.update({stack["StackName"]: ClusterStack(stack) for stack in page})
+        if not next_token:
+            break
+
+    failures = []
+    clusters = []
+    for cluster_name in cluster_names or sorted(stacks):
+        if cluster_name not in stacks:
+            failures.append(
+                ClusterDescriptionFailure(
+                    cluster_name=cluster_name,
+                    message=f"Cluster '{cluster_name}' does not exist or belongs to an incompatible ParallelCluster "
+                    "major version.",
+                )
+            )
+            continue
+        cluster = Cluster(cluster_name, stack=stacks[cluster_name])
+        if not check_cluster_version(cluster):
+            failures.append(
+                ClusterDescriptionFailure(
+                    cluster_name=cluster_name,
+                    message=f"Cluster '{cluster_name}' belongs to an incompatible ParallelCluster major version.",
+                )
+            )
+        elif not cluster_status or cloud_formation_status_to_cluster_status(cluster.stack.status) in cluster_status:
+            clusters.append(cluster)
+
+    fleet_statuses = _get_compute_fleet_statuses(clusters)
+    head_nodes = _get_head_nodes(clusters)
+
+    descriptions = []
+    for cluster in clusters:
+        cfn_stack = cluster.stack
+        description = ClusterDescription(
+            cluster_name=cluster.name,
+            region=os.environ.get("AWS_DEFAULT_REGION"),
+            version=cfn_stack.version,
+            cloudformation_stack_arn=cfn_stack.id,
+            cloudformation_stack_status=cfn_stack.status,
+            cluster_status=cloud_formation_status_to_cluster_status(cfn_stack.status),
+            scheduler=Scheduler(type=cfn_stack.scheduler),
+            compute_fleet_status=fleet_statuses.get(cluster.name, ComputeFleetStatus.UNKNOWN).value,
+            creation_time=to_utc_datetime(cfn_stack.creation_time),
+            last_updated_time=to_utc_datetime(cfn_stack.last_updated_time),
+        )
+        head_node = head_nodes.get(cluster.name)
+        if head_node:
+            description.head_node = EC2Instance(
+                instance_id=head_node.id,
+                launch_time=to_utc_datetime(head_node.launch_time),
+                public_ip_address=head_node.public_ip,
+                instance_type=head_node.instance_type,
+                state=InstanceState.from_dict(head_node.state),
+                private_ip_address=head_node.private_ip,
+            )
+        descriptions.append(description)
+
+    return DescribeClustersResponseContent(clusters=descriptions, failures=failures)
+
+
+def _get_compute_fleet_statuses(clusters):
+    """Retrieve the compute fleet status of multiple clusters with batched requests."""
+    status_managers = {}
+    batch_compute_environments = {}
+    for cluster in clusters:
+        if not (cluster.stack.is_working_status or cluster.stack.status == "UPDATE_IN_PROGRESS"):
+            continue
+        if cluster.stack.scheduler == "awsbatch":
+            batch_compute_environments[cluster.name] = cluster.stack.batch_compute_environment
+        else:
+            status_managers[cluster.name] = cluster.compute_fleet_status_manager
+
+    statuses = {}
+    if status_managers:
+        statuses.update(_get_dynamodb_compute_fleet_statuses(status_managers))
+    if batch_compute_environments:
+        statuses.update(_get_batch_compute_fleet_statuses(batch_compute_environments))
+    return statuses
+
+
+def _get_dynamodb_compute_fleet_statuses(status_managers):
+    """Retrieve the compute fleet statuses stored in the DynamoDB tables of the clusters with BatchGetItem."""
+    try:
+        items = AWSApi.instance().ddb_resource.batch_get_items(
+            {manager.table_name: [manager.status_item_key] for manager in status_managers.values()}
+        )
+    except AWSClientError as e:
+        # e.g. a table has been deleted in the meantime, the status of each cluster is retrieved separately
+        LOGGER.warning("Failed when retrieving fleet statuses from DynamoDB with error %s", e)
+        return {cluster_name: manager.get_status() for cluster_name, manager in status_managers.items()}
+    return {
+        cluster_name: manager.get_status_from_item(next(iter(items.get(manager.table_name, [])), None))
+        for cluster_name, manager in status_managers.items()
+    }
+
+
+def _get_batch_compute_fleet_statuses(batch_compute_environments):
+    """Retrieve the state of the AWS Batch compute environments of the clusters."""
+    try:
+        states = AWSApi.instance().batch.get_compute_environments_states(list(batch_compute_environments.values()))
+    except AWSClientError as e:
+        LOGGER.warning("Failed when retrieving compute environments states with error %s", e)
+        states = {}
+    return {
+        cluster_name: (
+            ComputeFleetStatus(states[compute_environment])
+            if compute_environment in states
+            else ComputeFleetStatus.UNKNOWN
+        )
+        for cluster_name, compute_environment in batch_compute_environments.items()
+    }
+
+
+def _get_head_nodes(clusters):
+    """Retrieve the head node of multiple clusters with DescribeInstances filtered on all the cluster names."""
+    head_nodes = {}
+    try:
+        for cluster_names in get_chunks([cluster.name for cluster in clusters], DESCRIBE_INSTANCES_MAX_FILTER_VALUES):
+            filters = [
+                {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": cluster_names},
+                {"Name": f"tag:{PCLUSTER_NODE_TYPE_TAG}", "Values": [NodeType.HEAD_NODE.value]},
+                {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
+            ]
+            next_token = None
+            while True:
+                instances, next_token = AWSApi.instance().ec2.describe_instances(filters, next_token)
+                for instance in instances:
+                    cluster_name = next(
+                        (tag["Value"] for tag in instance.get("Tags", []) if tag["Key"] == PCLUSTER_CLUSTER_NAME_TAG),
+                        None,
+                    )
+                    head_nodes.setdefault(cluster_name, ClusterInstance(instance))
+                if not next_token:
+                    break
+    except AWSClientError as e:
+        # Do not fail request when head nodes are not available
+        LOGGER.warning("Failed when retrieving head nodes with error %s", e)
+    return head_nodes
+
+
 @configure_aws_region()
 @convert_errors()
 def list_clusters(region=None, next_token=None, cluster_status=None):
@@ -301,7 +502,18 @@ def list_clusters(region=None, next_token=None, cluster_status=None):
 
     :rtype: ListClustersResponseContent
     """
-    stacks, next_token = AWSApi.instance().cfn.list_pcluster_stacks(next_token=next_token)
+    if ClusterInventory.is_enabled():
+        # The status filter is applied by the inventory before paginating, so that pages are full
+        try:
+            stacks, next_token = ClusterInventory.instance().list_cluster_stacks(
+                next_token=next_token,
+                stack_filter=lambda stack: not cluster_status
+                or cloud_formation_status_to_cluster_status(stack["StackStatus"]) in cluster_status,
+            )
+        except InvalidNextTokenError as e:
+            raise BadRequestException(str(e))
+    else:
+        stacks, next_token = AWSApi.instance().cfn.list_pcluster_stacks(next_token=next_token)
     stacks = [ClusterStack(stack) for stack in stacks]
 
     clusters = []
@@ -442,6 +654,9 @@ def _handle_cluster_update_error(e):
 
 def _cluster_update_change_succeded(check_result):
     """Describe if check_result represents successful individual change within a larger cluster update."""
+    # The update policies pull in the cluster configuration and its validators, load them only on update failures
+    from pcluster.config.update_policy import UpdatePolicy  # pylint: disable=import-outside-toplevel
+
     return check_result == UpdatePolicy.CheckResult.SUCCEEDED
 
 
@@ -449,6 +664,8 @@ def _analyze_changes(changes):
     if changes is None or len(changes) <= 1:
         return [], []
 
+    from pcluster.config.config_patch import ConfigPatch  # pylint: disable=import-outside-toplevel
+
     change_set = []
     errors = []
     key_indexes = {key: index for index, key in enumerate(changes[0])}
@@ -34,10 +34,12 @@ from pcluster.api.models import (
     BuildImageRequestContent,
     BuildImageResponseContent,
     CloudFormationStackStatus,
+    DeleteImagesResponseContent,
     DescribeImageResponseContent,
     Ec2AmiInfo,
     Ec2AmiInfoSummary,
     ImageConfigurationStructure,
+    ImageDeletionFailure,
     ImageInfoSummary,
     ImageStatusFilteringOption,
     ListImagesResponseContent,
@@ -56,6 +58,7 @@ from pcluster.models.imagebuilder import (
     BadRequestImageBuilderActionError,
     ConfigValidationError,
     ImageBuilder,
+    ImagesDeletion,
     NonExistingImageError,
 )
 from pcluster.models.imagebuilder_resources import ImageBuilderStack, NonExistingStackError
@@ -179,6 +182,55 @@ def delete_image(image_id, region=None, force=None):
     )
 
 
+@configure_aws_region()
+@http_success_status_code(202)
+@convert_errors()
+def delete_images(image_ids, region=None, force=None, dryrun=None):
+    """
+    Initiate the deletion of multiple custom images with batched safety checks, reporting per-image failures.
+
+    :param image_ids: Ids of the images to delete.
+    :type image_ids: List[str]
+    :param region: AWS Region that the operation corresponds to.
+    :type region: str
+    :param force: Force deletion in case there are instances using the AMIs or in case the AMIs are shared.
+    (Defaults to &#39;false&#39;.)
+    :type force: bool
+    :param dryrun: Only perform the safety checks without deleting any image, reporting the images that would be
+    deleted. (Defaults to &#39;false&#39;.)
+    :type dryrun: bool
+
+    :rtype: DeleteImagesResponseContent
+    """
+    assert_supported_operation(operation=Operation.DELETE_IMAGES, region=region)
+    deletion = ImagesDeletion(image_ids, force=force or False)
+    deleted_image_ids = deletion.delete(dryrun=dryrun or False)
+
+    images = []
+    for image_id in deleted_image_ids:
+        image = deletion.images.get(image_id)
+        stack = deletion.stacks.get(image_id)
+        if dryrun:
+            images.append(
+                _image_info_to_image_info_summary(image) if image else _imagebuilder_stack_to_image_info_summary(stack)
+            )
+        else:
+            images.append(
+                ImageInfoSummary(
+                    image_id=image_id,
+                    image_build_status=ImageBuildStatus.DELETE_IN_PROGRESS,
+                    cloudformation_stack_status=None if image else CloudFormationStackStatus.DELETE_IN_PROGRESS,
+                    cloudformation_stack_arn=None if image else stack.id,
+                    region=os_lib.environ.get("AWS_DEFAULT_REGION"),
+                    version=image.version if image else stack.version,
+                )
+            )
+    failures = [
+        ImageDeletionFailure(image_id=image_id, message=message) for image_id, message in deletion.failures.items()
+    ]
+    return DeleteImagesResponseContent(images=images, failures=failures)
+
+
 def _get_underlying_image_or_stack(imagebuilder):
     image = None
     stack = None
@@ -317,7 +369,7 @@ def _image_info_to_ami_info(image):
 
 @configure_aws_region()
 @convert_errors()
-def list_images(image_status, region=None, next_token=None):
+def list_images(image_status, region=None, next_token=None, max_results=None):
     """
     Retrieve the list of existing custom images.
 
@@ -327,15 +379,17 @@ def list_images(image_status, region=None, next_token=None):
     :type region: str
     :param next_token: Token to use for paginated requests.
     :type next_token: str
+    :param max_results: Maximum number of images returned in a page when listing available images.
+    :type max_results: int
 
     :rtype: ListImagesResponseContent
     """
     assert_supported_operation(operation=Operation.LIST_IMAGES, region=region)
     if image_status == ImageStatusFilteringOption.AVAILABLE:
-        return ListImagesResponseContent(images=_get_available_images())
+        images, next_token = _get_available_images(next_token, max_results)
     else:
         images, next_token = _get_images_in_progress(image_status, next_token)
-        return ListImagesResponseContent(images=images, next_token=next_token)
+    return ListImagesResponseContent(images=images, next_token=next_token)
 
 
 def _handle_config_validation_error(e: ConfigValidationError) -> BuildImageBadRequestException:
@@ -347,14 +401,17 @@ def _handle_config_validation_error(e: ConfigValidationError) -> BuildImageBadRe
     )
 
 
-def _get_available_images():
-    return [_image_info_to_image_info_summary(image) for image in AWSApi.instance().ec2.get_images()]
+def _get_available_images(next_token, max_results):
+    images, next_token = AWSApi.instance().ec2.list_images(next_token=next_token, max_results=max_results)
+    return [_image_info_to_image_info_summary(image) for image in images], next_token
 
 
 def _get_images_in_progress(image_status, next_token):
-    stacks, next_token = AWSApi.instance().cfn.get_imagebuilder_stacks(next_token=next_token)
-    imagebuilder_stacks = [ImageBuilderStack(stack) for stack in stacks]
     cloudformation_states = _image_status_to_cloudformation_status(image_status)
+    stacks, next_token = AWSApi.instance().cfn.get_imagebuilder_stacks_by_status(
+        sorted(cloudformation_states), next_token=next_token
+    )
+    imagebuilder_stacks = [ImageBuilderStack(stack) for stack in stacks]
     summaries = [
         _imagebuilder_stack_to_image_info_summary(stack)
         for stack in imagebuilder_stacks
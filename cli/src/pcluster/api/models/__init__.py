@@ -23,11 +23,14 @@ from pcluster.api.models.change import Change
 from pcluster.api.models.cloud_formation_resource_status import CloudFormationResourceStatus
 from pcluster.api.models.cloud_formation_stack_status import CloudFormationStackStatus
 from pcluster.api.models.cluster_configuration_structure import ClusterConfigurationStructure
+from pcluster.api.models.cluster_description import ClusterDescription
+from pcluster.api.models.cluster_description_failure import ClusterDescriptionFailure
 from pcluster.api.models.cluster_info_summary import ClusterInfoSummary
 from pcluster.api.models.cluster_instance import ClusterInstance
 from pcluster.api.models.cluster_status import ClusterStatus
 from pcluster.api.models.cluster_status_filtering_option import ClusterStatusFilteringOption
 from pcluster.api.models.compute_fleet_status import ComputeFleetStatus
+from pcluster.api.models.compute_resource_instances_count import ComputeResourceInstancesCount
 from pcluster.api.models.config_validation_message import ConfigValidationMessage
 from pcluster.api.models.conflict_exception_response_content import ConflictExceptionResponseContent
 from pcluster.api.models.create_cluster_bad_request_exception_response_content import (
@@ -37,8 +40,10 @@ from pcluster.api.models.create_cluster_request_content import CreateClusterRequ
 from pcluster.api.models.create_cluster_response_content import CreateClusterResponseContent
 from pcluster.api.models.delete_cluster_response_content import DeleteClusterResponseContent
 from pcluster.api.models.delete_image_response_content import DeleteImageResponseContent
+from pcluster.api.models.delete_images_response_content import DeleteImagesResponseContent
 from pcluster.api.models.describe_cluster_instances_response_content import DescribeClusterInstancesResponseContent
 from pcluster.api.models.describe_cluster_response_content import DescribeClusterResponseContent
+from pcluster.api.models.describe_clusters_response_content import DescribeClustersResponseContent
 from pcluster.api.models.describe_compute_fleet_response_content import DescribeComputeFleetResponseContent
 from pcluster.api.models.describe_image_response_content import DescribeImageResponseContent
 from pcluster.api.models.dryrun_operation_exception_response_content import DryrunOperationExceptionResponseContent
@@ -47,6 +52,7 @@ from pcluster.api.models.ec2_ami_info_summary import Ec2AmiInfoSummary
 from pcluster.api.models.ec2_ami_state import Ec2AmiState
 from pcluster.api.models.ec2_instance import EC2Instance
 from pcluster.api.models.failure import Failure
+from pcluster.api.models.get_cluster_instances_summary_response_content import GetClusterInstancesSummaryResponseContent
 from pcluster.api.models.get_cluster_log_events_response_content import GetClusterLogEventsResponseContent
 from pcluster.api.models.get_cluster_stack_events_response_content import GetClusterStackEventsResponseContent
 from pcluster.api.models.get_image_log_events_response_content import GetImageLogEventsResponseContent
@@ -54,9 +60,11 @@ from pcluster.api.models.get_image_stack_events_response_content import GetImage
 from pcluster.api.models.image_build_status import ImageBuildStatus
 from pcluster.api.models.image_builder_image_status import ImageBuilderImageStatus
 from pcluster.api.models.image_configuration_structure import ImageConfigurationStructure
+from pcluster.api.models.image_deletion_failure import ImageDeletionFailure
 from pcluster.api.models.image_info_summary import ImageInfoSummary
 from pcluster.api.models.image_status_filtering_option import ImageStatusFilteringOption
 from pcluster.api.models.instance_state import InstanceState
+from pcluster.api.models.instances_count import InstancesCount
 from pcluster.api.models.internal_service_exception_response_content import InternalServiceExceptionResponseContent
 from pcluster.api.models.limit_exceeded_exception_response_content import LimitExceededExceptionResponseContent
 from pcluster.api.models.list_cluster_log_streams_response_content import ListClusterLogStreamsResponseContent
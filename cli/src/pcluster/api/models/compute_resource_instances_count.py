@@ -0,0 +1,122 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=R0801
+
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+
+
+class ComputeResourceInstancesCount(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, queue_name=None, compute_resource_name=None, count=None):
+        """ComputeResourceInstancesCount - a model defined in OpenAPI
+
+        :param queue_name: The queue_name of this ComputeResourceInstancesCount.
+        :type queue_name: str
+        :param compute_resource_name: The compute_resource_name of this ComputeResourceInstancesCount.
+        :type compute_resource_name: str
+        :param count: The count of this ComputeResourceInstancesCount.
+        :type count: int
+        """
+        self.openapi_types = {"queue_name": str, "compute_resource_name": str, "count": int}
+
+        self.attribute_map = {
+            "queue_name": "queueName",
+            "compute_resource_name": "computeResourceName",
+            "count": "count",
+        }
+
+        self._queue_name = queue_name
+        self._compute_resource_name = compute_resource_name
+        self._count = count
+
+    @classmethod
+    def from_dict(cls, dikt) -> "ComputeResourceInstancesCount":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The ComputeResourceInstancesCount of this ComputeResourceInstancesCount.
+        :rtype: ComputeResourceInstancesCount
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def queue_name(self):
+        """Gets the queue_name of this ComputeResourceInstancesCount.
+
+
+        :return: The queue_name of this ComputeResourceInstancesCount.
+        :rtype: str
+        """
+        return self._queue_name
+
+    @queue_name.setter
+    def queue_name(self, queue_name):
+        """Sets the queue_name of this ComputeResourceInstancesCount.
+
+
+        :param queue_name: The queue_name of this ComputeResourceInstancesCount.
+        :type queue_name: str
+        """
+        if queue_name is None:
+            raise ValueError("Invalid value for `queue_name`, must not be `None`")
+
+        self._queue_name = queue_name
+
+    @property
+    def compute_resource_name(self):
+        """Gets the compute_resource_name of this ComputeResourceInstancesCount.
+
+
+        :return: The compute_resource_name of this ComputeResourceInstancesCount.
+        :rtype: str
+        """
+        return self._compute_resource_name
+
+    @compute_resource_name.setter
+    def compute_resource_name(self, compute_resource_name):
+        """Sets the compute_resource_name of this ComputeResourceInstancesCount.
+
+
+        :param compute_resource_name: The compute_resource_name of this ComputeResourceInstancesCount.
+        :type compute_resource_name: str
+        """
+        if compute_resource_name is None:
+            raise ValueError("Invalid value for `compute_resource_name`, must not be `None`")
+
+        self._compute_resource_name = compute_resource_name
+
+    @property
+    def count(self):
+        """Gets the count of this ComputeResourceInstancesCount.
+
+
+        :return: The count of this ComputeResourceInstancesCount.
+        :rtype: int
+        """
+        return self._count
+
+    @count.setter
+    def count(self, count):
+        """Sets the count of this ComputeResourceInstancesCount.
+
+
+        :param count: The count of this ComputeResourceInstancesCount.
+        :type count: int
+        """
+        if count is None:
+            raise ValueError("Invalid value for `count`, must not be `None`")
+
+        self._count = count
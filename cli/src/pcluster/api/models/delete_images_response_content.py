@@ -0,0 +1,100 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=R0801
+
+
+from typing import List
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+from pcluster.api.models.image_deletion_failure import ImageDeletionFailure
+from pcluster.api.models.image_info_summary import ImageInfoSummary
+
+
+class DeleteImagesResponseContent(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, images=None, failures=None):
+        """DeleteImagesResponseContent - a model defined in OpenAPI
+
+        :param images: The images of this DeleteImagesResponseContent.
+        :type images: List[ImageInfoSummary]
+        :param failures: The failures of this DeleteImagesResponseContent.
+        :type failures: List[ImageDeletionFailure]
+        """
+        self.openapi_types = {"images": List[ImageInfoSummary], "failures": List[ImageDeletionFailure]}
+
+        self.attribute_map = {"images": "images", "failures": "failures"}
+
+        self._images = images
+        self._failures = failures
+
+    @classmethod
+    def from_dict(cls, dikt) -> "DeleteImagesResponseContent":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The DeleteImagesResponseContent of this DeleteImagesResponseContent.
+        :rtype: DeleteImagesResponseContent
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def images(self):
+        """Gets the images of this DeleteImagesResponseContent.
+
+        Images being deleted, or that would be deleted when dryrun is set
+
+
+        :return: The images of this DeleteImagesResponseContent.
+        :rtype: List[ImageInfoSummary]
+        """
+        return self._images
+
+    @images.setter
+    def images(self, images):
+        """Sets the images of this DeleteImagesResponseContent.
+
+        Images being deleted, or that would be deleted when dryrun is set
+
+
+        :param images: The images of this DeleteImagesResponseContent.
+        :type images: List[ImageInfoSummary]
+        """
+        if images is None:
+            raise ValueError("Invalid value for `images`, must not be `None`")
+
+        self._images = images
+
+    @property
+    def failures(self):
+        """Gets the failures of this DeleteImagesResponseContent.
+
+        Images that cannot be deleted
+
+        :return: The failures of this DeleteImagesResponseContent.
+        :rtype: List[ImageDeletionFailure]
+        """
+        return self._failures
+
+    @failures.setter
+    def failures(self, failures):
+        """Sets the failures of this DeleteImagesResponseContent.
+
+        Images that cannot be deleted
+
+        :param failures: The failures of this DeleteImagesResponseContent.
+        :type failures: List[ImageDeletionFailure]
+        """
+
+        self._failures = failures
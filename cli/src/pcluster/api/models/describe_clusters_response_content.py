@@ -0,0 +1,96 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=R0801
+
+
+from typing import List
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+from pcluster.api.models.cluster_description import ClusterDescription
+from pcluster.api.models.cluster_description_failure import ClusterDescriptionFailure
+
+
+class DescribeClustersResponseContent(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, clusters=None, failures=None):
+        """DescribeClustersResponseContent - a model defined in OpenAPI
+
+        :param clusters: The clusters of this DescribeClustersResponseContent.
+        :type clusters: List[ClusterDescription]
+        :param failures: The failures of this DescribeClustersResponseContent.
+        :type failures: List[ClusterDescriptionFailure]
+        """
+        self.openapi_types = {"clusters": List[ClusterDescription], "failures": List[ClusterDescriptionFailure]}
+
+        self.attribute_map = {"clusters": "clusters", "failures": "failures"}
+
+        self._clusters = clusters
+        self._failures = failures
+
+    @classmethod
+    def from_dict(cls, dikt) -> "DescribeClustersResponseContent":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The DescribeClustersResponseContent of this DescribeClustersResponseContent.
+        :rtype: DescribeClustersResponseContent
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def clusters(self):
+        """Gets the clusters of this DescribeClustersResponseContent.
+
+
+        :return: The clusters of this DescribeClustersResponseContent.
+        :rtype: List[ClusterDescription]
+        """
+        return self._clusters
+
+    @clusters.setter
+    def clusters(self, clusters):
+        """Sets the clusters of this DescribeClustersResponseContent.
+
+
+        :param clusters: The clusters of this DescribeClustersResponseContent.
+        :type clusters: List[ClusterDescription]
+        """
+        if clusters is None:
+            raise ValueError("Invalid value for `clusters`, must not be `None`")
+
+        self._clusters = clusters
+
+    @property
+    def failures(self):
+        """Gets the failures of this DescribeClustersResponseContent.
+
+        Clusters that could not be described
+
+        :return: The failures of this DescribeClustersResponseContent.
+        :rtype: List[ClusterDescriptionFailure]
+        """
+        return self._failures
+
+    @failures.setter
+    def failures(self, failures):
+        """Sets the failures of this DescribeClustersResponseContent.
+
+        Clusters that could not be described
+
+        :param failures: The failures of this DescribeClustersResponseContent.
+        :type failures: List[ClusterDescriptionFailure]
+        """
+
+        self._failures = failures
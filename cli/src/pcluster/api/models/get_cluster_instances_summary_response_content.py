@@ -0,0 +1,188 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=R0801
+
+
+from typing import List
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+from pcluster.api.models.compute_resource_instances_count import ComputeResourceInstancesCount
+from pcluster.api.models.instances_count import InstancesCount
+
+
+class GetClusterInstancesSummaryResponseContent(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, total_instances=None, queues=None, compute_resources=None, instance_types=None, states=None):
+        """GetClusterInstancesSummaryResponseContent - a model defined in OpenAPI
+
+        :param total_instances: The total_instances of this GetClusterInstancesSummaryResponseContent.
+        :type total_instances: int
+        :param queues: The queues of this GetClusterInstancesSummaryResponseContent.
+        :type queues: List[InstancesCount]
+        :param compute_resources: The compute_resources of this GetClusterInstancesSummaryResponseContent.
+        :type compute_resources: List[ComputeResourceInstancesCount]
+        :param instance_types: The instance_types of this GetClusterInstancesSummaryResponseContent.
+        :type instance_types: List[InstancesCount]
+        :param states: The states of this GetClusterInstancesSummaryResponseContent.
+        :type states: List[InstancesCount]
+        """
+        self.openapi_types = {
+            "total_instances": int,
+            "queues": List[InstancesCount],
+            "compute_resources": List[ComputeResourceInstancesCount],
+            "instance_types": List[InstancesCount],
+            "states": List[InstancesCount],
+        }
+
+        self.attribute_map = {
+            "total_instances": "totalInstances",
+            "queues": "queues",
+            "compute_resources": "computeResources",
+            "instance_types": "instanceTypes",
+            "states": "states",
+        }
+
+        self._total_instances = total_instances
+        self._queues = queues
+        self._compute_resources = compute_resources
+        self._instance_types = instance_types
+        self._states = states
+
+    @classmethod
+    def from_dict(cls, dikt) -> "GetClusterInstancesSummaryResponseContent":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The GetClusterInstancesSummaryResponseContent of this GetClusterInstancesSummaryResponseContent.
+        :rtype: GetClusterInstancesSummaryResponseContent
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def total_instances(self):
+        """Gets the total_instances of this GetClusterInstancesSummaryResponseContent.
+
+        Number of instances matching the filters
+
+        :return: The total_instances of this GetClusterInstancesSummaryResponseContent.
+        :rtype: int
+        """
+        return self._total_instances
+
+    @total_instances.setter
+    def total_instances(self, total_instances):
+        """Sets the total_instances of this GetClusterInstancesSummaryResponseContent.
+
+        Number of instances matching the filters
+
+        :param total_instances: The total_instances of this GetClusterInstancesSummaryResponseContent.
+        :type total_instances: int
+        """
+        if total_instances is None:
+            raise ValueError("Invalid value for `total_instances`, must not be `None`")
+
+        self._total_instances = total_instances
+
+    @property
+    def queues(self):
+        """Gets the queues of this GetClusterInstancesSummaryResponseContent.
+
+        Number of instances per queue
+
+        :return: The queues of this GetClusterInstancesSummaryResponseContent.
+        :rtype: List[InstancesCount]
+        """
+        return self._queues
+
+    @queues.setter
+    def queues(self, queues):
+        """Sets the queues of this GetClusterInstancesSummaryResponseContent.
+
+        Number of instances per queue
+
+        :param queues: The queues of this GetClusterInstancesSummaryResponseContent.
+        :type queues: List[InstancesCount]
+        """
+
+        self._queues = queues
+
+    @property
+    def compute_resources(self):
+        """Gets the compute_resources of this GetClusterInstancesSummaryResponseContent.
+
+        Number of instances per compute resource
+
+        :return: The compute_resources of this GetClusterInstancesSummaryResponseContent.
+        :rtype: List[ComputeResourceInstancesCount]
+        """
+        return self._compute_resources
+
+    @compute_resources.setter
+    def compute_resources(self, compute_resources):
+        """Sets the compute_resources of this GetClusterInstancesSummaryResponseContent.
+
+        Number of instances per compute resource
+
+        :param compute_resources: The compute_resources of this GetClusterInstancesSummaryResponseContent.
+        :type compute_resources: List[ComputeResourceInstancesCount]
+        """
+
+        self._compute_resources = compute_resources
+
+    @property
+    def instance_types(self):
+        """Gets the instance_types of this GetClusterInstancesSummaryResponseContent.
+
+        Number of instances per instance type
+
+        :return: The instance_types of this GetClusterInstancesSummaryResponseContent.
+        :rtype: List[InstancesCount]
+        """
+        return self._instance_types
+
+    @instance_types.setter
+    def instance_types(self, instance_types):
+        """Sets the instance_types of this GetClusterInstancesSummaryResponseContent.
+
+        Number of instances per instance type
+
+        :param instance_types: The instance_types of this GetClusterInstancesSummaryResponseContent.
+        :type instance_types: List[InstancesCount]
+        """
+
+        self._instance_types = instance_types
+
+    @property
+    def states(self):
+        """Gets the states of this GetClusterInstancesSummaryResponseContent.
+
+        Number of instances per instance state
+
+        :return: The states of this GetClusterInstancesSummaryResponseContent.
+        :rtype: List[InstancesCount]
+        """
+        return self._states
+
+    @states.setter
+    def states(self, states):
+        """Sets the states of this GetClusterInstancesSummaryResponseContent.
+
+        Number of instances per instance state
+
+        :param states: The states of this GetClusterInstancesSummaryResponseContent.
+        :type states: List[InstancesCount]
+        """
+
+        self._states = states
@@ -0,0 +1,96 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=R0801
+
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+
+
+class ImageDeletionFailure(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, image_id=None, message=None):
+        """ImageDeletionFailure - a model defined in OpenAPI
+
+        :param image_id: The image_id of this ImageDeletionFailure.
+        :type image_id: str
+        :param message: The message of this ImageDeletionFailure.
+        :type message: str
+        """
+        self.openapi_types = {"image_id": str, "message": str}
+
+        self.attribute_map = {"image_id": "imageId", "message": "message"}
+
+        self._image_id = image_id
+        self._message = message
+
+    @classmethod
+    def from_dict(cls, dikt) -> "ImageDeletionFailure":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The ImageDeletionFailure of this ImageDeletionFailure.
+        :rtype: ImageDeletionFailure
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def image_id(self):
+        """Gets the image_id of this ImageDeletionFailure.
+
+        Id of the image
+
+        :return: The image_id of this ImageDeletionFailure.
+        :rtype: str
+        """
+        return self._image_id
+
+    @image_id.setter
+    def image_id(self, image_id):
+        """Sets the image_id of this ImageDeletionFailure.
+
+        Id of the image
+
+        :param image_id: The image_id of this ImageDeletionFailure.
+        :type image_id: str
+        """
+        if image_id is None:
+            raise ValueError("Invalid value for `image_id`, must not be `None`")
+
+        self._image_id = image_id
+
+    @property
+    def message(self):
+        """Gets the message of this ImageDeletionFailure.
+
+        Reason why the image cannot be deleted
+
+        :return: The message of this ImageDeletionFailure.
+        :rtype: str
+        """
+        return self._message
+
+    @message.setter
+    def message(self, message):
+        """Sets the message of this ImageDeletionFailure.
+
+        Reason why the image cannot be deleted
+
+        :param message: The message of this ImageDeletionFailure.
+        :type message: str
+        """
+        if message is None:
+            raise ValueError("Invalid value for `message`, must not be `None`")
+
+        self._message = message
@@ -0,0 +1,92 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=R0801
+
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+
+
+class InstancesCount(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, name=None, count=None):
+        """InstancesCount - a model defined in OpenAPI
+
+        :param name: The name of this InstancesCount.
+        :type name: str
+        :param count: The count of this InstancesCount.
+        :type count: int
+        """
+        self.openapi_types = {"name": str, "count": int}
+
+        self.attribute_map = {"name": "name", "count": "count"}
+
+        self._name = name
+        self._count = count
+
+    @classmethod
+    def from_dict(cls, dikt) -> "InstancesCount":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The InstancesCount of this InstancesCount.
+        :rtype: InstancesCount
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def name(self):
+        """Gets the name of this InstancesCount.
+
+
+        :return: The name of this InstancesCount.
+        :rtype: str
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """Sets the name of this InstancesCount.
+
+
+        :param name: The name of this InstancesCount.
+        :type name: str
+        """
+        if name is None:
+            raise ValueError("Invalid value for `name`, must not be `None`")
+
+        self._name = name
+
+    @property
+    def count(self):
+        """Gets the count of this InstancesCount.
+
+
+        :return: The count of this InstancesCount.
+        :rtype: int
+        """
+        return self._count
+
+    @count.setter
+    def count(self, count):
+        """Sets the count of this InstancesCount.
+
+
+        :param count: The count of this InstancesCount.
+        :type count: int
+        """
+        if count is None:
+            raise ValueError("Invalid value for `count`, must not be `None`")
+
+        self._count = count
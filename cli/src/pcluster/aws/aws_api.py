@@ -8,27 +8,9 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+# pylint: disable=import-outside-toplevel
 import os
 
-from pcluster.aws.batch import BatchClient
-from pcluster.aws.cfn import CfnClient
-from pcluster.aws.dynamo import DynamoResource
-from pcluster.aws.ec2 import Ec2Client
-from pcluster.aws.efs import EfsClient
-from pcluster.aws.elb import ElbClient
-from pcluster.aws.fsx import FSxClient
-from pcluster.aws.iam import IamClient
-from pcluster.aws.imagebuilder import ImageBuilderClient
-from pcluster.aws.kms import KmsClient
-from pcluster.aws.logs import LogsClient
-from pcluster.aws.resource_groups import ResourceGroupsClient
-from pcluster.aws.route53 import Route53Client
-from pcluster.aws.s3 import S3Client
-from pcluster.aws.s3_resource import S3Resource
-from pcluster.aws.secretsmanager import SecretsManagerClient
-from pcluster.aws.ssm import SsmClient
-from pcluster.aws.sts import StsClient
-
 
 class AWSApi:
     """
@@ -37,6 +19,7 @@ class AWSApi:
     A singleton instance can be retrieved from everywhere in the code by calling AWSApi.instance().
     Specific API client wrappers are provided through properties of this instance; for instance AWSApi.instance().ec2
     will return the client wrapper for EC2 service.
+    Client wrapper modules are imported on first access, so that importing this module stays cheap.
     """
 
     _instance = None
@@ -68,6 +51,8 @@ class AWSApi:
     def cfn(self):
         """CloudFormation client."""  # noqa: D403
         if not self._cfn:
+            from pcluster.aws.cfn import CfnClient
+
             self._cfn = CfnClient()
         return self._cfn
 
@@ -75,6 +60,8 @@ class AWSApi:
     def batch(self):
         """AWS Batch client."""
         if not self._batch:
+            from pcluster.aws.batch import BatchClient
+
             self._batch = BatchClient()
         return self._batch
 
@@ -82,6 +69,8 @@ class AWSApi:
     def ec2(self):
         """EC2 client."""
         if not self._ec2:
+            from pcluster.aws.ec2 import Ec2Client
+
             self._ec2 = Ec2Client()
         return self._ec2
 
@@ -89,6 +78,8 @@ class AWSApi:
     def efs(self):
         """EFS client."""
         if not self._efs:
+            from pcluster.aws.efs import EfsClient
+
             self._efs = EfsClient(ec2_client=self.ec2)
         return self._efs
 
@@ -96,6 +87,8 @@ class AWSApi:
     def elb(self):
         """ELB client."""
         if not self._elb:
+            from pcluster.aws.elb import ElbClient
+
             self._elb = ElbClient()
         return self._elb
 
@@ -103,6 +96,8 @@ class AWSApi:
     def fsx(self):
         """FSX client."""
         if not self._fsx:
+            from pcluster.aws.fsx import FSxClient
+
             self._fsx = FSxClient()
         return self._fsx
 
@@ -110,6 +105,8 @@ class AWSApi:
     def s3(self):  # pylint: disable=C0103
         """S3 client."""
         if not self._s3:
+            from pcluster.aws.s3 import S3Client
+
             self._s3 = S3Client()
         return self._s3
 
@@ -117,6 +114,8 @@ class AWSApi:
     def kms(self):
         """KMS client."""
         if not self._kms:
+            from pcluster.aws.kms import KmsClient
+
             self._kms = KmsClient()
         return self._kms
 
@@ -124,6 +123,8 @@ class AWSApi:
     def imagebuilder(self):
         """ImageBuilder client."""  # noqa: D403
         if not self._imagebuilder:
+            from pcluster.aws.imagebuilder import ImageBuilderClient
+
             self._imagebuilder = ImageBuilderClient()
         return self._imagebuilder
 
@@ -131,6 +132,8 @@ class AWSApi:
     def sts(self):
         """STS client."""
         if not self._sts:
+            from pcluster.aws.sts import StsClient
+
             self._sts = StsClient()
         return self._sts
 
@@ -138,6 +141,8 @@ class AWSApi:
     def s3_resource(self):
         """S3Resource client."""
         if not self._s3_resource:
+            from pcluster.aws.s3_resource import S3Resource
+
             self._s3_resource = S3Resource()
         return self._s3_resource
 
@@ -145,6 +150,8 @@ class AWSApi:
     def iam(self):
         """IAM client."""
         if not self._iam:
+            from pcluster.aws.iam import IamClient
+
             self._iam = IamClient()
         return self._iam
 
@@ -152,6 +159,8 @@ class AWSApi:
     def ddb_resource(self):
         """DynamoResource client."""  # noqa: D403
         if not self._ddb_resource:
+            from pcluster.aws.dynamo import DynamoResource
+
             self._ddb_resource = DynamoResource()
         return self._ddb_resource
 
@@ -159,6 +168,8 @@ class AWSApi:
     def logs(self):
         """Log client."""
         if not self._logs:
+            from pcluster.aws.logs import LogsClient
+
             self._logs = LogsClient()
         return self._logs
 
@@ -166,6 +177,8 @@ class AWSApi:
     def route53(self):
         """Route53 client."""
         if not self._route53:
+            from pcluster.aws.route53 import Route53Client
+
             self._route53 = Route53Client()
         return self._route53
 
@@ -173,6 +186,8 @@ class AWSApi:
     def secretsmanager(self):
         """Secrets Manager client."""
         if not self._secretsmanager:
+            from pcluster.aws.secretsmanager import SecretsManagerClient
+
             self._secretsmanager = SecretsManagerClient()
         return self._secretsmanager
 
@@ -180,6 +195,8 @@ class AWSApi:
     def ssm(self):
         """SSM client."""
         if not self._ssm:
+            from pcluster.aws.ssm import SsmClient
+
             self._ssm = SsmClient()
         return self._ssm
 
@@ -187,6 +204,8 @@ class AWSApi:
     def resource_groups(self):
         """Resource Groups client."""
         if not self._resource_groups:
+            from pcluster.aws.resource_groups import ResourceGroupsClient
+
             self._resource_groups = ResourceGroupsClient()
         return self._resource_groups
 
@@ -11,6 +11,7 @@
 from pcluster.constants import (
     LUSTRE,
     OPENZFS,
+    PCLUSTER_COMPUTE_RESOURCE_NAME_TAG,
     PCLUSTER_IMAGE_BUILD_LOG_TAG,
     PCLUSTER_IMAGE_CONFIG_TAG,
     PCLUSTER_IMAGE_ID_TAG,
@@ -118,7 +119,7 @@ class InstanceInfo:
 
     def __init__(self, instance_data: dict):
         self._instance_data = instance_data
-        self._tags = self._instance_data.get("Tags", [])
+        self._tags = self._instance_data.get("Tags") or []
 
     @property
     def id(self) -> str:
@@ -170,6 +171,11 @@ class InstanceInfo:
         """Return queue name of the instance."""
         return self._get_tag(PCLUSTER_QUEUE_NAME_TAG)
 
+    @property
+    def compute_resource_name(self) -> str:
+        """Return compute resource name of the instance."""
+        return self._get_tag(PCLUSTER_COMPUTE_RESOURCE_NAME_TAG)
+
     @property
     def pool_name(self) -> str:
         """Return pool name of the instance."""
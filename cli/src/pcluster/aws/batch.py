@@ -10,10 +10,12 @@
 # limitations under the License.
 import logging
 import re
+from typing import List
 
 from botocore.exceptions import ClientError, EndpointConnectionError
 
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client, get_region
+from pcluster.utils import get_chunks
 
 LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +51,17 @@ class BatchClient(Boto3Client):
             "state"
         ]
 
+    @AWSExceptionHandler.handle_client_exception
+    def get_compute_environments_states(self, ce_names: List[str]):
+        """Get the state (ENABLED/DISABLED) of multiple compute environments, by compute environment ARN."""
+        states = {}
+        for chunk in get_chunks(ce_names, 100):
+            for compute_environment in self._paginate_results(
+                self._client.describe_compute_environments, computeEnvironments=chunk
+            ):
+                states[compute_environment["computeEnvironmentArn"]] = compute_environment["state"]
+        return states
+
     @AWSExceptionHandler.handle_client_exception
     def get_compute_environment_capacity(self, ce_name: str):
         """Describe compute environment and return ."""
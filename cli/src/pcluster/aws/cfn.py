@@ -10,6 +10,7 @@
 # limitations under the License.
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from botocore.exceptions import ClientError
 
@@ -20,6 +21,36 @@ from pcluster.utils import remove_none_values
 
 LOGGER = logging.getLogger(__name__)
 
+# All the stack statuses, but DELETE_COMPLETE, to be used with list_stacks
+STACK_STATUSES_NOT_DELETED = [
+    "CREATE_IN_PROGRESS",
+    "CREATE_FAILED",
+    "CREATE_COMPLETE",
+    "ROLLBACK_IN_PROGRESS",
+    "ROLLBACK_FAILED",
+    "ROLLBACK_COMPLETE",
+    "DELETE_IN_PROGRESS",
+    "DELETE_FAILED",
+    "UPDATE_IN_PROGRESS",
+    "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_COMPLETE",
+    "UPDATE_FAILED",
+    "UPDATE_ROLLBACK_IN_PROGRESS",
+    "UPDATE_ROLLBACK_FAILED",
+    "UPDATE_ROLLBACK_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_ROLLBACK_COMPLETE",
+    "REVIEW_IN_PROGRESS",
+    "IMPORT_IN_PROGRESS",
+    "IMPORT_COMPLETE",
+    "IMPORT_ROLLBACK_IN_PROGRESS",
+    "IMPORT_ROLLBACK_FAILED",
+    "IMPORT_ROLLBACK_COMPLETE",
+]
+
+
+# Maximum number of stacks described concurrently
+DESCRIBE_STACKS_MAX_WORKERS = 8
+
 
 class CfnClient(Boto3Client):
     """Implement CFN Boto3 client."""
@@ -153,6 +184,11 @@ class CfnClient(Boto3Client):
         # Only return stacks without image-id tag, which means they are cluster stacks.
         return [stack for stack in stacks if StackInfo(stack).get_tag(PCLUSTER_IMAGE_ID_TAG) is None], result_token
 
+    @AWSExceptionHandler.handle_client_exception
+    def list_stack_summaries(self):
+        """List the summaries of all the existing stacks, deleted stacks excluded."""
+        return list(self._paginate_results(self._client.list_stacks, StackStatusFilter=STACK_STATUSES_NOT_DELETED))
+
     def describe_stack_resource(self, stack_name: str, logic_resource_id: str):
         """Get stack resource information."""
         try:
@@ -173,6 +209,31 @@ class CfnClient(Boto3Client):
         """List existing imagebuilder stacks."""
         return self._list_parentless_stacks_with_tag(PCLUSTER_IMAGE_ID_TAG, next_token)
 
+    @AWSExceptionHandler.handle_client_exception
+    def get_imagebuilder_stacks_by_status(self, statuses, next_token=None):
+        """
+        List existing imagebuilder stacks in the given statuses.
+
+        The stacks are filtered by ListStacks and only the matching ones are described, concurrently. Unlike
+        get_imagebuilder_stacks, the given and returned tokens are ListStacks tokens.
+        """
+        list_stacks_kwargs = {"StackStatusFilter": list(statuses)}
+        if next_token:
+            list_stacks_kwargs["NextToken"] = next_token
+        result = self._client.list_stacks(**list_stacks_kwargs)
+        stack_ids = [summary["StackId"] for summary in result.get("StackSummaries", []) if not summary.get("ParentId")]
+        with ThreadPoolExecutor(max_workers=DESCRIBE_STACKS_MAX_WORKERS) as executor:
+            stacks = list(executor.map(self._describe_stack_if_exists, stack_ids))
+        return [stack for stack in stacks if stack and StackInfo(stack).get_tag(PCLUSTER_IMAGE_ID_TAG)], result.get(
+            "NextToken"
+        )
+
+    def _describe_stack_if_exists(self, stack_name):
+        try:
+            return self.describe_stack(stack_name)
+        except StackNotFoundError:
+            return None
+
     def _list_parentless_stacks_with_tag(self, tag, next_token=None):
         describe_stacks_kwargs = {}
         if next_token:
@@ -9,11 +9,20 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import contextvars
 import functools
+import hashlib
+import inspect
+import json
 import logging
 import os
+import random
+import shutil
+import tempfile
 import threading
 import time
+from collections import OrderedDict
 from enum import Enum
 from typing import Dict
 
@@ -23,6 +32,11 @@ from botocore.exceptions import BotoCoreError, ClientError, ParamValidationError
 
 LOGGER = logging.getLogger(__name__)
 
+# Throttled boto3 calls are retried with backoff for up to 5 minutes
+THROTTLING_RETRY_MIN_DELAY_SEC = 1
+THROTTLING_RETRY_MAX_DELAY_SEC = 20
+THROTTLING_RETRY_MAX_WAIT_SEC = 5 * 60
+
 
 class AWSClientError(Exception):
     """Error during execution of some AWS calls."""
@@ -33,12 +47,13 @@ class AWSClientError(Exception):
         VALIDATION_ERROR = "ValidationError"
         REQUEST_LIMIT_EXCEEDED = "RequestLimitExceeded"
         THROTTLING_EXCEPTION = "ThrottlingException"
+        THROTTLING = "Throttling"
         CONDITIONAL_CHECK_FAILED_EXCEPTION = "ConditionalCheckFailedException"
 
         @classmethod
         def throttling_error_codes(cls):
             """Return a set of error codes returned when service rate limits are exceeded."""
-            return {cls.REQUEST_LIMIT_EXCEEDED.value, cls.THROTTLING_EXCEPTION.value}
+            return {cls.REQUEST_LIMIT_EXCEEDED.value, cls.THROTTLING_EXCEPTION.value, cls.THROTTLING.value}
 
     def __init__(self, function_name: str, message: str, error_code: str = None):
         super().__init__(message)
@@ -80,54 +95,243 @@ class AWSExceptionHandler:
 
     @staticmethod
     def handle_client_exception(func):
-        """Handle Boto3 errors, can be used as a decorator."""
+        """Handle Boto3 errors, can be used as a decorator, also of generator functions."""
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                try:
+                    yield from func(*args, **kwargs)
+                except (BotoCoreError, ClientError) as e:
+                    raise AWSExceptionHandler._convert_error(func.__name__, e)
+
+            return generator_wrapper
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
-            except ParamValidationError as validation_error:
-                error = BadRequestError(
-                    func.__name__,
-                    "Error validating parameter. Failed with exception: {0}".format(str(validation_error)),
-                )
-            except BotoCoreError as e:
-                error = AWSClientError(func.__name__, str(e))
-            except ClientError as e:
-                # add request id
-                message = e.response["Error"]["Message"]
-                error_code = e.response["Error"]["Code"]
-
-                if error_code in AWSClientError.ErrorCode.throttling_error_codes():
-                    error = LimitExceededError(func.__name__, message, error_code)
-                elif error_code == AWSClientError.ErrorCode.VALIDATION_ERROR:
-                    error = BadRequestError(func.__name__, message, error_code)
-                else:
-                    error = AWSClientError(func.__name__, message, error_code)
-            LOGGER.error("Encountered error when performing boto3 call in %s: %s", error.function_name, error.message)
-            raise error
+            except (BotoCoreError, ClientError) as e:
+                raise AWSExceptionHandler._convert_error(func.__name__, e)
 
         return wrapper
 
+    @staticmethod
+    def _convert_error(function_name, e):
+        """Convert a Boto3 error into the corresponding AWSClientError."""
+        if isinstance(e, ParamValidationError):
+            error = BadRequestError(
+                function_name,
+                "Error validating parameter. Failed with exception: {0}".format(str(e)),
+            )
+        elif isinstance(e, BotoCoreError):
+            error = AWSClientError(function_name, str(e))
+        else:
+            # add request id
+            message = e.response["Error"]["Message"]
+            error_code = e.response["Error"]["Code"]
+
+            if error_code in AWSClientError.ErrorCode.throttling_error_codes():
+                error = LimitExceededError(function_name, message, error_code)
+            elif error_code == AWSClientError.ErrorCode.VALIDATION_ERROR:
+                error = BadRequestError(function_name, message, error_code)
+            else:
+                error = AWSClientError(function_name, message, error_code)
+        LOGGER.error("Encountered error when performing boto3 call in %s: %s", error.function_name, error.message)
+        return error
+
     @staticmethod
     def retry_on_boto3_throttling(func):
-        """Retry boto3 calls on throttling, can be used as a decorator."""
+        """Retry boto3 calls on throttling with backoff, up to a deadline, can be used as a decorator."""
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            while True:
-                try:
-                    return func(*args, **kwargs)
-                except ClientError as e:
-                    if e.response["Error"]["Code"] != "Throttling":
-                        raise
-                    LOGGER.debug("Throttling when calling %s function. Will retry in %d seconds.", func.__name__, 5)
-                    time.sleep(5)
+            waiter = Waiter(
+                func.__name__,
+                min_delay=THROTTLING_RETRY_MIN_DELAY_SEC,
+                max_delay=THROTTLING_RETRY_MAX_DELAY_SEC,
+                max_wait=THROTTLING_RETRY_MAX_WAIT_SEC,
+            )
+            return waiter.wait(lambda: func(*args, **kwargs))
 
         return wrapper
 
 
+class WaiterTimeoutError(TimeoutError):
+    """Error raised when the condition of a Waiter is not met before its deadline."""
+
+
+class Waiter:
+    """
+    Poll a function until a condition is met, sleeping with jittered exponential backoff between the attempts.
+
+    The delay starts from min_delay and is doubled after every attempt, up to max_delay. Every sleep lasts between half
+    and the whole of the current delay, so that concurrent waiters do not poll in lockstep. A throttled attempt doubles
+    the delay once more and is retried, the other errors are raised. The waiter gives up when the next attempt would
+    start after max_wait seconds, by raising a WaiterTimeoutError, or the throttling error of the last attempt.
+    The attempts made, the throttled ones and the time slept are kept to observe the waiter.
+    """
+
+    def __init__(self, name: str, min_delay: float = 1, max_delay: float = 30, max_wait: float = None):
+        self._name = name
+        self._min_delay = min_delay
+        self._max_delay = max(min_delay, max_delay)
+        self._max_wait = max_wait
+        self.attempts = 0
+        self.throttled_attempts = 0
+        self.slept_time = 0
+
+    def wait(self, poll, until=None):
+        """
+        Call poll until the until condition is true for its result, and return the result.
+
+        :param poll: function called at every attempt
+        :param until: condition on the result of poll, by default the first result that is not throttled is returned
+        """
+        deadline = time.monotonic() + self._max_wait if self._max_wait is not None else None
+        delay = self._min_delay
+        while True:
+            self.attempts += 1
+            throttling_error = None
+            try:
+                result = poll()
+            except (AWSClientError, ClientError) as e:
+                if not _is_throttling_error(e):
+                    raise
+                self.throttled_attempts += 1
+                throttling_error = e
+                delay = min(delay * 2, self._max_delay)
+            else:
+                if until is None or until(result):
+                    LOGGER.debug(
+                        "Completed waiting for %s after %d attempts (%d throttled) and %.1f seconds.",
+                        self._name,
+                        self.attempts,
+                        self.throttled_attempts,
+                        self.slept_time,
+                    )
+                    return result
+
+            sleep_time = random.uniform(delay / 2, delay)  # nosec B311
+            if deadline is not None and time.monotonic() + sleep_time > deadline:
+                if throttling_error:
+                    raise throttling_error
+                raise WaiterTimeoutError(f"Timeout expired while waiting for {self._name}.")
+            LOGGER.debug(
+                "%s when waiting for %s, attempt %d, retrying in %.1f seconds.",
+                "Throttling" if throttling_error else "Condition not met",
+                self._name,
+                self.attempts,
+                sleep_time,
+            )
+            time.sleep(sleep_time)
+            self.slept_time += sleep_time
+            delay = min(delay * 2, self._max_delay)
+
+
+def _is_throttling_error(error):
+    if isinstance(error, ClientError):
+        return error.response["Error"]["Code"] in AWSClientError.ErrorCode.throttling_error_codes()
+    return isinstance(error, LimitExceededError)
+
+
+class AdaptiveRateLimiter:
+    """
+    Rate limiter shared by the threads calling the same AWS API, with adaptive backoff on throttling.
+
+    Calls are spaced to stay under the current rate. The rate is halved every time a call is throttled, down to
+    min_rate, and is increased back towards max_rate by every successful call.
+    """
+
+    def __init__(self, max_rate: float, min_rate: float = 0.5, max_attempts: int = 5, max_backoff: float = 20):
+        self._max_rate = max_rate
+        self._min_rate = min(min_rate, max_rate)
+        self._rate = max_rate
+        self._max_attempts = max_attempts
+        self._max_backoff = max_backoff
+        self._next_call_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        """Return the current rate, in calls per second."""
+        return self._rate
+
+    def call(self, func, *args, **kwargs):
+        """Call the given function when the rate allows it, retrying with exponential backoff when throttled."""
+        attempt = 1
+        while True:
+            self._wait_for_slot()
+            try:
+                result = func(*args, **kwargs)
+            except LimitExceededError:
+                self._decrease_rate()
+                if attempt >= self._max_attempts:
+                    raise
+                backoff = min(2**attempt / self._rate, self._max_backoff)
+                LOGGER.debug(
+                    "Throttling when calling %s, retrying in %.1f seconds.", getattr(func, "__name__", func), backoff
+                )
+                time.sleep(backoff)
+                attempt += 1
+            else:
+                self._increase_rate()
+                return result
+
+    def _wait_for_slot(self):
+        with self._lock:
+            now = time.monotonic()
+            call_time = max(now, self._next_call_time)
+            self._next_call_time = call_time + 1 / self._rate
+        if call_time > now:
+            time.sleep(call_time - now)
+
+    def _decrease_rate(self):
+        with self._lock:
+            self._rate = max(self._rate / 2, self._min_rate)
+
+    def _increase_rate(self):
+        with self._lock:
+            self._rate = min(self._rate + self._min_rate, self._max_rate)
+
+
+class AWSCallsCounter:
+    """Count the AWS calls and the cache hits made in the current context."""
+
+    _current = contextvars.ContextVar("aws_calls_counter", default=None)
+
+    def __init__(self):
+        self.aws_calls = 0
+        self.cache_hits = 0
+
+    @staticmethod
+    @contextlib.contextmanager
+    def count():
+        """Return a context manager counting the calls made within it, in the current thread or task."""
+        counter = AWSCallsCounter()
+        token = AWSCallsCounter._current.set(counter)
+        try:
+            yield counter
+        finally:
+            AWSCallsCounter._current.reset(token)
+
+    @staticmethod
+    def record_aws_call():
+        """Count an AWS call in the active counter, if any."""
+        counter = AWSCallsCounter._current.get()
+        if counter:
+            counter.aws_calls += 1
+
+    @staticmethod
+    def record_cache_hit():
+        """Count a cache hit in the active counter, if any."""
+        counter = AWSCallsCounter._current.get()
+        if counter:
+            counter.cache_hits += 1
+
+
 def _log_boto3_calls(params, **kwargs):
+    AWSCallsCounter.record_aws_call()
     service = kwargs["event_name"].split(".")[-2]
     operation = kwargs["event_name"].split(".")[-1]
     region = kwargs["context"].get("client_region", boto3.session.Session().region_name)
@@ -136,13 +340,18 @@ def _log_boto3_calls(params, **kwargs):
     )
 
 
+# The boto3 default session is not thread-safe, clients and resources are created under this lock
+_BOTO3_CREATION_LOCK = threading.Lock()
+
+
 class Boto3Client:
     """Boto3 client Class."""
 
     def __init__(self, client_name: str, botocore_config_kwargs: Dict = None):
-        self._client = boto3.client(
-            client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None
-        )
+        with _BOTO3_CREATION_LOCK:
+            self._client = boto3.client(
+                client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None
+            )
         self._client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
 
     def _paginate_results(self, method, **kwargs):
@@ -163,12 +372,269 @@ class Boto3Resource:
     """Boto3 resource Class."""
 
     def __init__(self, resource_name: str):
-        self._resource = boto3.resource(resource_name)
+        with _BOTO3_CREATION_LOCK:
+            self._resource = boto3.resource(resource_name)
         self._resource.meta.client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
 
 
+class CacheStats:
+    """Snapshot of the counters of a single function cache."""
+
+    def __init__(self, name, size, max_size, ttl, hits, misses, evictions, expirations, waits):
+        self.name = name
+        self.size = size
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.expirations = expirations
+        self.waits = waits
+
+    def to_dict(self):
+        """Return the stats as a dict, e.g. to export them as metrics."""
+        return dict(self.__dict__)
+
+
+class _KeyLock:
+    """Per-key mutex, reference counted so that it can be dropped once nobody is using it."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class _FunctionCache:
+    """Bounded LRU store with optional TTL used by a single function decorated with Cache.cached."""
+
+    def __init__(self, name: str, max_size: int = None, ttl: float = None):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.waits = 0
+
+    def clear(self):
+        """Drop all the cached values and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._reset_counters()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self._lookup(key, count=False)[0]
+
+    def stats(self):
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                name=self.name,
+                size=len(self._entries),
+                max_size=self.max_size,
+                ttl=self.ttl,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                expirations=self.expirations,
+                waits=self.waits,
+            )
+
+    def get(self, key):
+        """Return a (found, value) tuple for the given key, refreshing its LRU position."""
+        return self._lookup(key, count=True)
+
+    def put(self, key, value):
+        """Store the value, evicting the least recently used entries if the cache is full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while self.max_size is not None and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _lookup(self, key, count):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    if count:
+                        self.hits += 1
+                    return True, value
+                del self._entries[key]
+                if count:
+                    self.expirations += 1
+            if count:
+                self.misses += 1
+            return False, None
+
+    def get_or_compute(self, key, function, *args, **kwargs):
+        """
+        Return the cached value for key, computing it with function on a miss.
+
+        Only a single invocation for a given key executes at a given time, concurrent callers wait for it
+        and then reuse its result.
+        """
+        with self._lock:
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = self._key_locks[key] = _KeyLock()
+            key_lock.users += 1
+        try:
+            if not key_lock.lock.acquire(blocking=False):
+                with self._lock:
+                    self.waits += 1
+                key_lock.lock.acquire()
+            try:
+                enabled = Cache.is_enabled()
+                if enabled:
+                    found, value = self.get(key)
+                    if found:
+                        AWSCallsCounter.record_cache_hit()
+                        return value
+                value = function(*args, **kwargs)
+                if enabled:
+                    self.put(key, value)
+                return value
+            finally:
+                key_lock.lock.release()
+        finally:
+            with self._lock:
+                key_lock.users -= 1
+                if not key_lock.users:
+                    del self._key_locks[key]
+
+
+class PersistentCache:
+    """
+    Opt-in file-backed cache used to share slow-changing AWS metadata across CLI invocations.
+
+    It is enabled by setting the PCLUSTER_PERSISTENT_CACHE_ENABLED environment variable. Entries are stored as JSON
+    files under PCLUSTER_PERSISTENT_CACHE_DIR (default ~/.parallelcluster/cache), namespaced by account and region,
+    and expire after the TTL given by the caller.
+    """
+
+    _account_ids = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled():
+        """Tell if the persistent cache is enabled."""
+        return Cache.is_enabled() and os.environ.get("PCLUSTER_PERSISTENT_CACHE_ENABLED", "false").lower() in [
+            "true",
+            "1",
+            "yes",
+        ]
+
+    @staticmethod
+    def get_cache_dir():
+        """Return the root directory of the persistent cache."""
+        default_cache_dir = os.path.expanduser(os.path.join("~", ".parallelcluster", "cache"))
+        return os.environ.get("PCLUSTER_PERSISTENT_CACHE_DIR", default=default_cache_dir)
+
+    @staticmethod
+    def _get_account_id(region):
+        with PersistentCache._lock:
+            if region not in PersistentCache._account_ids:
+                PersistentCache._account_ids[region] = (
+                    boto3.client("sts", region_name=region).get_caller_identity().get("Account")
+                )
+            return PersistentCache._account_ids[region]
+
+    @staticmethod
+    def _get_entry_path(kind, params):
+        region = get_region()
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return os.path.join(
+            PersistentCache.get_cache_dir(), PersistentCache._get_account_id(region), region, kind, f"{digest}.json"
+        )
+
+    @staticmethod
+    def get(kind: str, params):
+        """
+        Return a (found, value) tuple for the entry of the given kind and params.
+
+        Any error reading the entry (missing, expired or corrupted file, missing credentials) is treated as a miss.
+        """
+        try:
+            path = PersistentCache._get_entry_path(kind, params)
+            with open(path, "r", encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+            if entry["expires_at"] > time.time():
+                AWSCallsCounter.record_cache_hit()
+                return True, entry["value"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            LOGGER.debug("Unable to read persistent cache entry for %s: %s", kind, e)
+        return False, None
+
+    @staticmethod
+    def put(kind: str, params, value, ttl: float):
+        """Store the value for the given kind and params, atomically replacing any existing entry."""
+        try:
+            path = PersistentCache._get_entry_path(kind, params)
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=os.path.dirname(path), suffix=".tmp", delete=False
+            ) as entry_file:
+                json.dump({"expires_at": time.time() + ttl, "value": value}, entry_file, default=str)
+            os.replace(entry_file.name, path)
+        except Exception as e:
+            LOGGER.debug("Unable to write persistent cache entry for %s: %s", kind, e)
+
+    @staticmethod
+    def clear():
+        """Remove all the persisted entries."""
+        shutil.rmtree(PersistentCache.get_cache_dir(), ignore_errors=True)
+
+    @staticmethod
+    def wrap(function, ttl: float):
+        """
+        Wrap a function returning JSON serializable data so that its results are read from and written to disk.
+
+        The first argument is not part of the key when it is a bound instance (i.e. the function is a method).
+        """
+        kind = function.__qualname__
+        is_method = next(iter(inspect.signature(function).parameters), None) == "self"
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not PersistentCache.is_enabled():
+                return function(*args, **kwargs)
+            params = [list(args[1:] if is_method else args), kwargs]
+            found, value = PersistentCache.get(kind, params)
+            if found:
+                return value
+            value = function(*args, **kwargs)
+            PersistentCache.put(kind, params, value, ttl)
+            return value
+
+        return wrapper
+
+
 class Cache:
-    """Simple utility class providing a cache mechanism for expensive functions."""
+    """
+    Utility class providing a cache mechanism for expensive functions.
+
+    Every decorated function gets its own bounded LRU cache. Entries can optionally expire after a TTL.
+    Default limits can be overridden with the PCLUSTER_CACHE_MAX_SIZE and PCLUSTER_CACHE_TTL environment variables.
+    """
+
+    DEFAULT_MAX_SIZE = 1024
 
     _caches = []
 
@@ -183,6 +649,21 @@ class Cache:
         for cache in Cache._caches:
             cache.clear()
 
+    @staticmethod
+    def get_stats():
+        """Return the stats of all the caches, keyed by the qualified name of the decorated function."""
+        return {cache.name: cache.stats() for cache in Cache._caches}
+
+    @staticmethod
+    def _default_max_size():
+        max_size = os.environ.get("PCLUSTER_CACHE_MAX_SIZE")
+        return int(max_size) if max_size else Cache.DEFAULT_MAX_SIZE
+
+    @staticmethod
+    def _default_ttl():
+        ttl = os.environ.get("PCLUSTER_CACHE_TTL")
+        return float(ttl) if ttl else None
+
     @staticmethod
     def _make_key(val):
         if isinstance(val, list):
@@ -196,35 +677,38 @@ class Cache:
         return key
 
     @staticmethod
-    def cached(function):
+    def cached(function=None, max_size: int = None, ttl: float = None, persistent_ttl: float = None):
         """
         Decorate a function to make it use a results cache based on passed arguments.
 
+        Can be used either as @Cache.cached or as @Cache.cached(max_size=..., ttl=...).
+        max_size bounds the number of cached results (least recently used ones are evicted first),
+        ttl is the number of seconds after which a cached result is discarded.
+        When persistent_ttl is set, in-memory misses are served by the PersistentCache (if enabled) and
+        results are persisted for persistent_ttl seconds. Results must then be JSON serializable.
+
         Note: for threaded invocations, only a single instance for a given set of arguments
         will execute at a given time.
         """
-        cache = {}
-        mutexes = {}
-        lock = threading.Lock()
-        Cache._caches.append(cache)
 
-        @functools.wraps(function)
-        def wrapper(*args, **kwargs):
-            cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
-            with lock:
-                if cache_key not in mutexes:
-                    mutexes[cache_key] = threading.Lock()
-
-            with mutexes[cache_key]:
-                if Cache.is_enabled() and cache_key in cache:
-                    return_value = cache[cache_key]
-                else:
-                    return_value = function(*args, **kwargs)
-                if Cache.is_enabled():
-                    cache[cache_key] = return_value
-                return return_value
+        def decorator(func):
+            cache = _FunctionCache(
+                name=func.__qualname__,
+                max_size=max_size if max_size is not None else Cache._default_max_size(),
+                ttl=ttl if ttl is not None else Cache._default_ttl(),
+            )
+            Cache._caches.append(cache)
+            compute = PersistentCache.wrap(func, persistent_ttl) if persistent_ttl is not None else func
 
-        return wrapper
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
+                return cache.get_or_compute(cache_key, compute, *args, **kwargs)
+
+            wrapper.cache = cache
+            return wrapper
+
+        return decorator(function) if function is not None else decorator
 
 
 def get_region():
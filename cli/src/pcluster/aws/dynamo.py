@@ -8,7 +8,17 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
+import time
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Resource
+from pcluster.utils import get_chunks
+
+LOGGER = logging.getLogger(__name__)
+
+# Maximum number of keys accepted by a single BatchGetItem request
+BATCH_GET_ITEM_MAX_KEYS = 100
+BATCH_GET_ITEM_MAX_ATTEMPTS = 5
 
 
 class DynamoResource(Boto3Resource):
@@ -51,3 +61,32 @@ class DynamoResource(Boto3Resource):
         if condition_expression:
             optional_args["ConditionExpression"] = condition_expression
         self._resource.Table(table_name).update_item(Key=key, **optional_args)
+
+    @AWSExceptionHandler.handle_client_exception
+    def batch_get_items(self, keys_by_table):
+        """
+        Get items from multiple DynamoDB tables with the minimum number of BatchGetItem requests.
+
+        Unprocessed keys are retried with exponential backoff, keys still unprocessed after the last attempt are
+        reported as missing.
+        :param keys_by_table: dict of table name -> list of keys to retrieve
+        :return: dict of table name -> list of the items found
+        """
+        items = {table_name: [] for table_name in keys_by_table}
+        requested_keys = [(table_name, key) for table_name, keys in keys_by_table.items() for key in keys]
+        for chunk in get_chunks(requested_keys, BATCH_GET_ITEM_MAX_KEYS):
+            request_items = {}
+            for table_name, key in chunk:
+                request_items.setdefault(table_name, {"Keys": [], "ConsistentRead": True})["Keys"].append(key)
+            for attempt in range(BATCH_GET_ITEM_MAX_ATTEMPTS):
+                if attempt:
+                    time.sleep(0.1 * 2**attempt)
+                response = self._resource.batch_get_item(RequestItems=request_items)
+                for table_name, table_items in response.get("Responses", {}).items():
+                    items[table_name].extend(table_items)
+                request_items = response.get("UnprocessedKeys")
+                if not request_items:
+                    break
+            else:
+                LOGGER.warning("Unable to retrieve items from DynamoDB tables %s", ", ".join(request_items))
+        return items
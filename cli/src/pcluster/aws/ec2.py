@@ -9,15 +9,28 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
+import logging
+import os
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Any, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
+import jmespath
 from botocore.exceptions import ClientError
 
 from pcluster import utils
 from pcluster.aws.aws_resources import CapacityReservationInfo, ImageInfo, InstanceTypeInfo
-from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, Cache, ImageNotFoundError, get_region
+from pcluster.aws.common import (
+    AdaptiveRateLimiter,
+    AWSClientError,
+    AWSExceptionHandler,
+    Boto3Client,
+    Cache,
+    ImageNotFoundError,
+    PersistentCache,
+    get_region,
+)
 from pcluster.constants import (
     IMAGE_NAME_PART_TO_OS_MAP,
     IMAGEBUILDER_ARN_TAG,
@@ -26,7 +39,41 @@ from pcluster.constants import (
     PCLUSTER_IMAGE_BUILD_STATUS_TAG,
     PCLUSTER_IMAGE_ID_TAG,
 )
-from pcluster.utils import get_partition
+from pcluster.utils import get_partition, grouper
+
+LOGGER = logging.getLogger(__name__)
+
+# Images can change state (e.g. pending -> available, deprecation) so their description must not be cached forever
+IMAGES_CACHE_TTL = 300
+# Time to live of the entries of the PersistentCache, for data that rarely changes
+INSTANCE_TYPES_PERSISTENT_CACHE_TTL = 24 * 60 * 60
+OFFICIAL_IMAGES_PERSISTENT_CACHE_TTL = 60 * 60
+SUBNETS_PERSISTENT_CACHE_TTL = 60 * 60
+# DescribeInstanceTypes accepts at most 100 instance types per request
+DESCRIBE_INSTANCE_TYPES_BATCH_SIZE = 100
+MAX_CONCURRENT_REQUESTS = 8
+# Maximum page size of DescribeInstances
+INSTANCES_PAGE_SIZE = 1000
+# Fields of the instances used by ParallelCluster, with the tags restricted to the ParallelCluster ones
+INSTANCE_PROJECTION = (
+    "Reservations[].Instances[].{InstanceId: InstanceId, InstanceType: InstanceType, LaunchTime: LaunchTime, "
+    "State: State, PrivateIpAddress: PrivateIpAddress, PublicIpAddress: PublicIpAddress, "
+    "PrivateDnsName: PrivateDnsName, Tags: Tags[?starts_with(Key, 'parallelcluster:')]}"
+)
+# Fields of the images needed to summarize them, with the tags restricted to the ParallelCluster ones
+IMAGE_SUMMARY_PROJECTION = (
+    "Images[].{ImageId: ImageId, Name: Name, Tags: Tags[?starts_with(Key, 'parallelcluster:')] || `[]`}"
+)
+# The available images are listed again after a short time, because they are built and deleted by other processes.
+# They are not kept in the persistent cache, which would serve deleted images and miss new ones across invocations.
+IMAGES_LIST_CACHE_TTL = 30
+# TerminateInstances requests are sent concurrently, in batches of instances and under a rate limit (requests per
+# second) that can be overridden with the PCLUSTER_TERMINATE_INSTANCES_RATE_LIMIT environment variable
+TERMINATE_INSTANCES_BATCH_SIZE = 100
+TERMINATE_INSTANCES_MAX_WORKERS = 4
+TERMINATE_INSTANCES_DEFAULT_RATE_LIMIT = 5
+# Maximum number of values of a DescribeInstances or DescribeImages filter
+DESCRIBE_MAX_FILTER_VALUES = 200
 
 
 class Ec2Client(Boto3Client):
@@ -38,6 +85,8 @@ class Ec2Client(Boto3Client):
         self.security_groups_cache = {}
         self.subnets_cache = {}
         self.capacity_reservations_cache = {}
+        self.instance_types_cache = {}
+        self.supported_azs_cache = {}
 
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
@@ -48,6 +97,7 @@ class Ec2Client(Boto3Client):
         )
 
     @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(persistent_ttl=INSTANCE_TYPES_PERSISTENT_CACHE_TTL)
     def describe_instance_type_offerings(self, filters=None, location_type=None):
         """Return a list of instance types."""
         kwargs = {"Filters": filters} if filters else {}
@@ -73,16 +123,27 @@ class Ec2Client(Boto3Client):
         """Return a list of subnets."""
         result = []
         missed_subnets = []
-        for subnet_id in subnet_ids:
+        for subnet_id in dict.fromkeys(subnet_ids):
             cached_data = self.subnets_cache.get(subnet_id)
             if cached_data:
                 result.append(cached_data)
             else:
                 missed_subnets.append(subnet_id)
+        if missed_subnets and PersistentCache.is_enabled():
+            for subnet_id in list(missed_subnets):
+                found, subnet = PersistentCache.get("Ec2Client.describe_subnets", subnet_id)
+                if found:
+                    self.subnets_cache[subnet_id] = subnet
+                    result.append(subnet)
+                    missed_subnets.remove(subnet_id)
         if missed_subnets:
             response = list(self._paginate_results(self._client.describe_subnets, SubnetIds=missed_subnets))
             for subnet in response:
                 self.subnets_cache[subnet.get("SubnetId")] = subnet
+                if PersistentCache.is_enabled():
+                    PersistentCache.put(
+                        "Ec2Client.describe_subnets", subnet.get("SubnetId"), subnet, SUBNETS_PERSISTENT_CACHE_TTL
+                    )
                 result.append(subnet)
         return result
 
@@ -120,7 +181,12 @@ class Ec2Client(Boto3Client):
         raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
 
     def get_subnets_az_mapping(self, subnet_ids):
-        """Return a dictionary mapping the input subnet_ids to their respective availability zones."""
+        """
+        Return a dictionary mapping the input subnet_ids to their respective availability zones.
+
+        All the subnets not yet in cache are described with a single call.
+        """
+        self.describe_subnets(subnet_ids)
         return {subnet_id: self.get_subnet_avail_zone(subnet_id) for subnet_id in subnet_ids}
 
     @AWSExceptionHandler.handle_client_exception
@@ -142,7 +208,7 @@ class Ec2Client(Boto3Client):
         raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=IMAGES_CACHE_TTL)
     def _describe_images_with_pagination(self, **kwargs):
         """Use paginator to describe images and handle pagination."""
         paginator = self._client.get_paginator("describe_images")
@@ -153,7 +219,7 @@ class Ec2Client(Boto3Client):
         return images
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=IMAGES_CACHE_TTL)
     def describe_image(self, ami_id):
         """Describe image by image id, return an object of ImageInfo."""
         images = self._describe_images_with_pagination(ImageIds=[ami_id])
@@ -162,7 +228,7 @@ class Ec2Client(Boto3Client):
         raise AWSClientError(function_name="describe_images", message=f"Image {ami_id} not found")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=IMAGES_CACHE_TTL)
     def describe_images(self, ami_ids, filters, owners):
         """Return a list of objects of ImageInfo."""
         images = self._describe_images_with_pagination(ImageIds=ami_ids, Filters=filters, Owners=owners)
@@ -227,6 +293,41 @@ class Ec2Client(Boto3Client):
             for instance in result.get("Instances")
         ]
 
+    @AWSExceptionHandler.handle_client_exception
+    def get_instance_ids_by_ami_ids(self, image_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Get the instance ids using each of the given amis, when status is not terminated nor shutting-down.
+
+        The instances are retrieved with a single DescribeInstances sweep filtered on all the amis.
+        """
+        instance_ids = {image_id: [] for image_id in image_ids}
+        paginator = self._client.get_paginator("describe_instances")
+        for ami_ids in grouper(image_ids, DESCRIBE_MAX_FILTER_VALUES):
+            for instance in paginator.paginate(
+                Filters=[
+                    {"Name": "image-id", "Values": list(ami_ids)},
+                    {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
+                ],
+                PaginationConfig={"PageSize": INSTANCES_PAGE_SIZE},
+            ).search("Reservations[].Instances[].{InstanceId: InstanceId, ImageId: ImageId}"):
+                instance_ids.setdefault(instance["ImageId"], []).append(instance["InstanceId"])
+        return instance_ids
+
+    @AWSExceptionHandler.handle_client_exception
+    def describe_images_by_id_tags(self, image_ids: List[str]) -> List[ImageInfo]:
+        """Return the available images with any of the given image id tags, with one request per batch of ids."""
+        images = []
+        for pcluster_image_ids in grouper(image_ids, DESCRIBE_MAX_FILTER_VALUES):
+            filters = [
+                {"Name": "tag:" + PCLUSTER_IMAGE_ID_TAG, "Values": list(pcluster_image_ids)},
+                {"Name": "tag:" + PCLUSTER_IMAGE_BUILD_STATUS_TAG, "Values": ["available"]},
+            ]
+            images.extend(
+                ImageInfo(image)
+                for image in self._describe_images_with_pagination(ImageIds=[], Filters=filters, Owners=["self"])
+            )
+        return images
+
     @AWSExceptionHandler.handle_client_exception
     def get_image_shared_account_ids(self, image_id):
         """Get account ids that image is shared with."""
@@ -237,17 +338,36 @@ class Ec2Client(Boto3Client):
             )
         ]
 
-    def get_images(self):
-        """Return existing pcluster images by pcluster image name tag."""
-        try:
-            filters = [
+    def list_images(self, next_token=None, max_results=None) -> Tuple[List[ImageInfo], str]:
+        """
+        Return a page of the existing pcluster images and the token of the next page.
+
+        Images are projected on the fields needed to summarize them. All the images are returned in a single page
+        when neither next_token nor max_results are provided.
+        """
+        page = self._list_images_page(next_token=next_token, max_results=max_results)
+        return [ImageInfo(image) for image in page["Images"]], page["NextToken"]
+
+    @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(ttl=IMAGES_LIST_CACHE_TTL)
+    def _list_images_page(self, next_token=None, max_results=None):
+        kwargs = {
+            "Filters": [
                 {"Name": "tag-key", "Values": [PCLUSTER_IMAGE_ID_TAG]},
                 {"Name": f"tag:{PCLUSTER_IMAGE_BUILD_STATUS_TAG}", "Values": ["available"]},
-            ]
-            owners = ["self"]
-            return self.describe_images(ami_ids=[], filters=filters, owners=owners)
-        except ImageNotFoundError:
-            return []
+            ],
+            "Owners": ["self"],
+        }
+        if not next_token and not max_results:
+            paginator = self._client.get_paginator("describe_images")
+            return {"Images": list(paginator.paginate(**kwargs).search(IMAGE_SUMMARY_PROJECTION)), "NextToken": None}
+
+        if next_token:
+            kwargs["NextToken"] = next_token
+        if max_results:
+            kwargs["MaxResults"] = max_results
+        response = self._client.describe_images(**kwargs)
+        return {"Images": jmespath.search(IMAGE_SUMMARY_PROJECTION, response), "NextToken": response.get("NextToken")}
 
     @AWSExceptionHandler.handle_client_exception
     def describe_key_pair(self, key_name):
@@ -284,9 +404,73 @@ class Ec2Client(Boto3Client):
     @Cache.cached
     def get_instance_type_info(self, instance_type):
         """Return the results of calling EC2's DescribeInstanceTypes API for the given instance type."""
-        return InstanceTypeInfo(
-            self.additional_instance_types_data.get(instance_type)
-            or self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
+        instance_type_data = self.additional_instance_types_data.get(instance_type)
+        if not instance_type_data:
+            instance_types_data = self.describe_instance_types([instance_type])
+            if not instance_types_data:
+                raise AWSClientError(
+                    function_name="describe_instance_types", message=f"Instance type {instance_type} not found"
+                )
+            instance_type_data = instance_types_data[0]
+        return InstanceTypeInfo(instance_type_data)
+
+    @AWSExceptionHandler.handle_client_exception
+    def describe_instance_types(self, instance_types: List[str]) -> List[dict]:
+        """
+        Return the raw results of EC2's DescribeInstanceTypes API for the given instance types.
+
+        Results are cached per instance type. Missing instance types are described in batches of
+        DESCRIBE_INSTANCE_TYPES_BATCH_SIZE, with the batches executed concurrently.
+        """
+        missed_instance_types = [
+            instance_type
+            for instance_type in dict.fromkeys(instance_types)
+            if instance_type not in self.instance_types_cache
+        ]
+        if missed_instance_types and PersistentCache.is_enabled():
+            for instance_type in list(missed_instance_types):
+                found, instance_type_data = PersistentCache.get("Ec2Client.describe_instance_types", instance_type)
+                if found:
+                    self.instance_types_cache[instance_type] = instance_type_data
+                    missed_instance_types.remove(instance_type)
+        if missed_instance_types:
+            batches = list(utils.grouper(missed_instance_types, DESCRIBE_INSTANCE_TYPES_BATCH_SIZE))
+            with ThreadPoolExecutor(max_workers=min(len(batches), MAX_CONCURRENT_REQUESTS)) as executor:
+                responses = executor.map(
+                    lambda batch: list(
+                        self._paginate_results(self._client.describe_instance_types, InstanceTypes=list(batch))
+                    ),
+                    batches,
+                )
+                for response in responses:
+                    for instance_type_data in response:
+                        instance_type = instance_type_data.get("InstanceType")
+                        self.instance_types_cache[instance_type] = instance_type_data
+                        if PersistentCache.is_enabled():
+                            PersistentCache.put(
+                                "Ec2Client.describe_instance_types",
+                                instance_type,
+                                instance_type_data,
+                                INSTANCE_TYPES_PERSISTENT_CACHE_TTL,
+                            )
+        return [
+            self.instance_types_cache[instance_type]
+            for instance_type in instance_types
+            if instance_type in self.instance_types_cache
+        ]
+
+    def prefetch_instance_types_info(self, instance_types: List[str]):
+        """
+        Populate the cache of DescribeInstanceTypes results for all the given instance types with batched calls.
+
+        Instance types defined in additional_instance_types_data are skipped.
+        """
+        self.describe_instance_types(
+            [
+                instance_type
+                for instance_type in instance_types
+                if instance_type and instance_type not in self.additional_instance_types_data
+            ]
         )
 
     @AWSExceptionHandler.handle_client_exception
@@ -304,7 +488,7 @@ class Ec2Client(Boto3Client):
         return max(images, key=lambda image: ("0" if self._is_image_deprecated(image) else "1") + image["CreationDate"])
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=IMAGES_CACHE_TTL)
     def get_official_image_id(self, os, architecture, filters=None):
         """Return the id of the current official image, for the provided os-architecture combination."""
         owner = filters.owner if filters and filters.owner else "amazon"
@@ -312,19 +496,24 @@ class Ec2Client(Boto3Client):
 
         filters = [{"Name": "name", "Values": ["{0}*".format(self._get_official_image_name_prefix(os, architecture))]}]
         filters.extend([{"Name": f"tag:{tag.key}", "Values": [tag.value]} for tag in tags])
-        images = self._describe_images_with_pagination(Owners=[owner], Filters=filters, IncludeDeprecated=True)
+        images = self._describe_official_images(owners=[owner], filters=filters)
         if not images:
             raise AWSClientError(function_name="describe_images", message="Cannot find official ParallelCluster AMI")
         return self._find_valid_official_image(images).get("ImageId")
 
+    @Cache.cached(ttl=IMAGES_CACHE_TTL, persistent_ttl=OFFICIAL_IMAGES_PERSISTENT_CACHE_TTL)
+    def _describe_official_images(self, owners, filters):
+        """Return the raw description of the official images matching the given owners and filters."""
+        return self._describe_images_with_pagination(Owners=owners, Filters=filters, IncludeDeprecated=True)
+
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=IMAGES_CACHE_TTL)
     def get_official_images(self, os=None, architecture=None):
         """Get the list of official images, optionally filtered by os and architecture."""
         owners = ["amazon"]
         name = f"{self._get_official_image_name_prefix(os, architecture)}*"
         filters = [{"Name": "name", "Values": [name]}]
-        images = self._describe_images_with_pagination(Owners=owners, Filters=filters, IncludeDeprecated=True)
+        images = self._describe_official_images(owners=owners, filters=filters)
         return [
             ImageInfo(self._find_valid_official_image(images_os_arch))
             for _, images_os_arch in itertools.groupby(
@@ -360,6 +549,41 @@ class Ec2Client(Boto3Client):
         """Terminate list of EC2 instances."""
         return self._client.terminate_instances(InstanceIds=instance_ids)
 
+    def terminate_instances_in_batches(self, instance_ids: Iterable[str]) -> Tuple[int, Dict[str, str]]:
+        """
+        Terminate the given instances with concurrent batched requests, sent while the instance ids are retrieved.
+
+        A failed batch does not stop the termination of the other ones.
+
+        :param instance_ids: iterable of instance ids, consumed lazily
+        :return: the number of terminated instances and the failure reason by instance id
+        """
+        rate_limiter = AdaptiveRateLimiter(
+            float(os.environ.get("PCLUSTER_TERMINATE_INSTANCES_RATE_LIMIT") or TERMINATE_INSTANCES_DEFAULT_RATE_LIMIT)
+        )
+        terminated = 0
+        failures = {}
+        in_flight = {}
+
+        def _collect(done):
+            nonlocal terminated
+            for future in done:
+                batch = in_flight.pop(future)
+                try:
+                    future.result()
+                    terminated += len(batch)
+                except AWSClientError as e:
+                    failures.update({instance_id: str(e) for instance_id in batch})
+            LOGGER.info("Terminated %d instances, %d instances failed to terminate", terminated, len(failures))
+
+        with ThreadPoolExecutor(max_workers=TERMINATE_INSTANCES_MAX_WORKERS) as executor:
+            for batch in grouper(instance_ids, TERMINATE_INSTANCES_BATCH_SIZE):
+                if len(in_flight) >= TERMINATE_INSTANCES_MAX_WORKERS:
+                    _collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+                in_flight[executor.submit(rate_limiter.call, self.terminate_instances, list(batch))] = batch
+            _collect(wait(in_flight).done)
+        return terminated, failures
+
     @AWSExceptionHandler.handle_client_exception
     def list_instance_ids(self, filters):
         """Retrieve a filtered list of instance ids."""
@@ -369,6 +593,19 @@ class Ec2Client(Boto3Client):
             for instance in result.get("Instances")
         ]
 
+    @AWSExceptionHandler.handle_client_exception
+    def iter_instances(self, filters) -> Iterator[Dict]:
+        """
+        Return a generator over a filtered list of instances, retrieving all the result pages lazily.
+
+        Instances are projected on the fields used by ParallelCluster, so that only a page of full responses is held
+        in memory at any time.
+        """
+        paginator = self._client.get_paginator("describe_instances")
+        yield from paginator.paginate(Filters=filters, PaginationConfig={"PageSize": INSTANCES_PAGE_SIZE}).search(
+            INSTANCE_PROJECTION
+        )
+
     @AWSExceptionHandler.handle_client_exception
     def describe_instances(self, filters, next_token=None) -> Tuple[List[Any], str]:
         """Retrieve a filtered list of instances."""
@@ -413,15 +650,22 @@ class Ec2Client(Boto3Client):
         }
         """
         # first looks for info in cache, then using only one API call for all infos that is not inside the cache
-        result = {}
-        offerings = self.describe_instance_type_offerings(
-            filters=[{"Name": "instance-type", "Values": instance_types}], location_type="availability-zone"
-        )
-        for instance_type in instance_types:
-            result[instance_type] = tuple(
-                offering["Location"] for offering in offerings if offering["InstanceType"] == instance_type
+        missed_instance_types = [
+            instance_type
+            for instance_type in dict.fromkeys(instance_types)
+            if instance_type not in self.supported_azs_cache
+        ]
+        if missed_instance_types:
+            supported_azs = {instance_type: [] for instance_type in missed_instance_types}
+            offerings = self.describe_instance_type_offerings(
+                filters=[{"Name": "instance-type", "Values": missed_instance_types}],
+                location_type="availability-zone",
             )
-        return result
+            for offering in offerings:
+                supported_azs.setdefault(offering["InstanceType"], []).append(offering["Location"])
+            for instance_type, availability_zones in supported_azs.items():
+                self.supported_azs_cache[instance_type] = tuple(availability_zones)
+        return {instance_type: self.supported_azs_cache[instance_type] for instance_type in instance_types}
 
     @AWSExceptionHandler.handle_client_exception
     def deregister_image(self, image_id):
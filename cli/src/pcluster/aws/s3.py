@@ -51,8 +51,10 @@ class S3Client(Boto3Client):
             )
 
     @AWSExceptionHandler.handle_client_exception
-    def put_object(self, bucket_name, body, key):
+    def put_object(self, bucket_name, body, key, metadata=None):
         """Upload object content to s3."""
+        if metadata:
+            return self._client.put_object(Bucket=bucket_name, Body=body, Key=key, Metadata=metadata)
         return self._client.put_object(Bucket=bucket_name, Body=body, Key=key)
 
     @AWSExceptionHandler.handle_client_exception
@@ -114,15 +116,40 @@ class S3Client(Boto3Client):
         self._client.put_bucket_policy(Bucket=bucket_name, Policy=policy)
 
     @AWSExceptionHandler.handle_client_exception
-    def upload_fileobj(self, bucket_name, file_obj, key):
+    def upload_fileobj(self, bucket_name, file_obj, key, metadata=None):
         """Upload file-like object to S3 bucket."""
-        self._client.upload_fileobj(Fileobj=file_obj, Bucket=bucket_name, Key=key)
+        extra_args = {"ExtraArgs": {"Metadata": metadata}} if metadata else {}
+        self._client.upload_fileobj(Fileobj=file_obj, Bucket=bucket_name, Key=key, **extra_args)
 
     @AWSExceptionHandler.handle_client_exception
     def upload_file(self, bucket_name, file_path, key):
         """Upload file to S3 bucket."""
         self._client.upload_file(Filename=file_path, Bucket=bucket_name, Key=key)
 
+    @AWSExceptionHandler.handle_client_exception
+    def create_multipart_upload(self, bucket_name, key):
+        """Start a multipart upload and return its upload id."""
+        return self._client.create_multipart_upload(Bucket=bucket_name, Key=key)["UploadId"]
+
+    @AWSExceptionHandler.handle_client_exception
+    def upload_part(self, bucket_name, key, upload_id, part_number, body):
+        """Upload a part of a multipart upload and return its ETag."""
+        return self._client.upload_part(
+            Bucket=bucket_name, Key=key, UploadId=upload_id, PartNumber=part_number, Body=body
+        )["ETag"]
+
+    @AWSExceptionHandler.handle_client_exception
+    def complete_multipart_upload(self, bucket_name, key, upload_id, parts):
+        """Complete a multipart upload, parts is a list of dicts with ETag and PartNumber."""
+        self._client.complete_multipart_upload(
+            Bucket=bucket_name, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+
+    @AWSExceptionHandler.handle_client_exception
+    def abort_multipart_upload(self, bucket_name, key, upload_id):
+        """Abort a multipart upload, removing the parts already uploaded."""
+        self._client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
+
     @AWSExceptionHandler.handle_client_exception
     def create_presigned_url(self, bucket_name, object_name, version_id=None, expiration=3600):
         """Generate a pre-signed URL to share an S3 object."""
@@ -9,6 +9,7 @@
 
 import logging
 import re
+import sys
 from typing import List
 
 from argparse import ArgumentParser, ArgumentTypeError, Namespace
@@ -16,7 +17,6 @@ from argparse import ArgumentParser, ArgumentTypeError, Namespace
 from pcluster import utils
 from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
 from pcluster.constants import PCLUSTER_BUCKET_PROTECTED_PREFIX
-from pcluster.models.cluster import Cluster
 
 LOGGER = logging.getLogger(__name__)
 
@@ -87,6 +87,8 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
     @staticmethod
     def _export_cluster_logs(args: Namespace, output_file: str = None):
         """Export the logs associated to the cluster."""
+        from pcluster.models.cluster import Cluster
+
         LOGGER.debug("Beginning export of logs for the cluster: %s", args.cluster_name)
         cluster = Cluster(args.cluster_name)
         url = cluster.export_logs(
@@ -98,11 +100,18 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
             end_time=args.end_time,
             filters=args.filters,
             output_file=output_file,
+            progress_callback=_print_export_progress,
         )
         LOGGER.debug("Cluster's logs exported correctly to %s", url)
         return {"path": output_file} if output_file is not None else {"url": url}
 
 
+def _print_export_progress(completed_windows: int, total_windows: int):
+    """Print the progress of the CloudWatch logs export to stderr, to not interfere with the command output."""
+    if total_windows > 1:
+        print(f"Exported CloudWatch logs for {completed_windows} of {total_windows} time windows", file=sys.stderr)
+
+
 class _FiltersArg:
     """Class to implement regex parsing for filters parameter."""
 
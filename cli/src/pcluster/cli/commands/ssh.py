@@ -25,7 +25,6 @@ from argparse import ArgumentParser, Namespace, RawDescriptionHelpFormatter
 
 from pcluster import utils
 from pcluster.cli.commands.common import CliCommand, to_bool
-from pcluster.models.cluster import Cluster
 
 LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +42,8 @@ def _ssh(args, extra_args):
     except ImportError:
         from pipes import quote as cmd_quote
 
+    from pcluster.models.cluster import Cluster
+
     try:
         head_node = Cluster(args.cluster_name).head_node_instance
     except Exception as e:
@@ -78,15 +79,13 @@ class SshCommand(CliCommand):
         "Run ssh command with the cluster username and IP address pre-populated. "
         "Arbitrary arguments are appended to the end of the ssh command."
     )
-    epilog = textwrap.dedent(
-        """Example:
+    epilog = textwrap.dedent("""Example:
 
   pcluster ssh --cluster-name mycluster -i ~/.ssh/id_rsa
 
 Returns an ssh command with the cluster username and IP address pre-populated:
 
-  ssh ec2-user@1.1.1.1 -i ~/.ssh/id_rsa"""
-    )
+  ssh ec2-user@1.1.1.1 -i ~/.ssh/id_rsa""")
 
     def __init__(self, subparsers):
         super().__init__(
@@ -28,16 +28,10 @@ os.environ["JSII_SILENCE_WARNING_KNOWN_BROKEN_NODE_VERSION"] = "1"
 os.environ["JSII_SILENCE_WARNING_UNTESTED_NODE_VERSION"] = "1"
 os.environ["JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION"] = "1"
 
-# Controllers
-import pcluster.api.controllers.cluster_compute_fleet_controller  # noqa: E402
-import pcluster.api.controllers.cluster_instances_controller  # noqa: E402
-import pcluster.api.controllers.cluster_operations_controller  # noqa: E402
-import pcluster.api.controllers.image_operations_controller  # noqa: E402
-import pcluster.api.errors  # noqa: E402
+# API controllers are imported on demand by pcluster.cli.model.call, to keep the CLI startup fast
 import pcluster.cli.commands.commands as cli_commands  # noqa: E402
 import pcluster.cli.logger as pcluster_logging  # noqa: E402
 import pcluster.cli.model  # noqa: E402
-from pcluster.api import encoder  # noqa: E402
 from pcluster.cli.commands.common import CliCommand, exit_msg, to_bool, to_int, to_number  # noqa: E402
 from pcluster.cli.exceptions import APIOperationException, ParameterException  # noqa: E402
 from pcluster.cli.logger import redirect_stdouterr_to_logger  # noqa: E402
@@ -203,6 +197,15 @@ def add_cli_commands(parser_map):
     add_additional_args(parser_map)
 
 
+def _to_api_operation_exception(error):
+    """Format exception messages in the same manner as the api."""
+    from pcluster.api import encoder, errors  # pylint: disable=import-outside-toplevel
+
+    message = errors.exception_message(error)
+    error_encoded = encoder.JSONEncoder().encode(message)
+    return APIOperationException(json.loads(error_encoded))
+
+
 def _run_operation(model, args, extra_args):
     if args.operation in model:
         try:
@@ -215,25 +218,20 @@ def _run_operation(model, args, extra_args):
         except ParameterException as e:
             raise e
         except Exception as e:
-            # format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
-            error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
+            raise _to_api_operation_exception(e)
     else:
         try:
             return args.func(args, extra_args)
-        except pcluster.api.errors.ParallelClusterApiException as e:
-            # Format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
-            error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
         except Exception as e:
+            from pcluster.api.errors import ParallelClusterApiException  # pylint: disable=import-outside-toplevel
+
+            if isinstance(e, ParallelClusterApiException):
+                raise _to_api_operation_exception(e)
             raise e
 
 
 def run(sys_args, model=None):
-    spec = pcluster.cli.model.package_spec()
-    model = model or pcluster.cli.model.load_model(spec)
+    model = model or pcluster.cli.model.load_precompiled_model()
     parser, parser_map = gen_parser(model)
     add_cli_commands(parser_map)
     args, extra_args = parser.parse_known_args(sys_args)
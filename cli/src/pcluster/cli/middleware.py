@@ -22,15 +22,20 @@ provided.
 import logging
 
 import argparse
-import boto3
 import jmespath
 from botocore.exceptions import WaiterError
 
 import pcluster.cli.model
 from pcluster.cli.exceptions import APIOperationException, ParameterException
+from pcluster.validators.common import ValidatorsProfiler
 
 LOGGER = logging.getLogger(__name__)
 
+# Cluster stacks are polled for up to 1 hour when waiting for the completion of an operation
+STACK_WAIT_MIN_DELAY_SEC = 5
+STACK_WAIT_MAX_DELAY_SEC = 30
+STACK_WAIT_MAX_WAIT_SEC = 60 * 60
+
 
 def _cluster_status(cluster_name):
     controller = "cluster_operations_controller"
@@ -39,6 +44,36 @@ def _cluster_status(cluster_name):
     return pcluster.cli.model.call(full_func_name, cluster_name=cluster_name)
 
 
+def _wait_for_stack(stack_name, complete_status):
+    """Wait for the given stack to leave the in progress statuses, raise a WaiterError if not in complete_status."""
+    from pcluster.aws.aws_api import AWSApi
+    from pcluster.aws.common import AWSClientError, StackNotFoundError, Waiter, WaiterTimeoutError
+
+    def _get_stack_status():
+        try:
+            return AWSApi.instance().cfn.describe_stack(stack_name)["StackStatus"]
+        except StackNotFoundError:
+            return "DELETE_COMPLETE"
+
+    waiter_name = f"stack {stack_name}"
+    waiter = Waiter(
+        waiter_name,
+        min_delay=STACK_WAIT_MIN_DELAY_SEC,
+        max_delay=STACK_WAIT_MAX_DELAY_SEC,
+        max_wait=STACK_WAIT_MAX_WAIT_SEC,
+    )
+    try:
+        status = waiter.wait(_get_stack_status, until=lambda status: not status.endswith("_IN_PROGRESS"))
+    except (AWSClientError, WaiterTimeoutError) as e:
+        raise WaiterError(name=waiter_name, reason=str(e), last_response={})
+    if status != complete_status:
+        raise WaiterError(
+            name=waiter_name,
+            reason=f"Stack status is {status}, expected {complete_status}",
+            last_response={"StackStatus": status},
+        )
+
+
 def add_additional_args(parser_map):
     """Add any additional arguments to parsers for individual operations.
 
@@ -49,6 +84,12 @@ def add_additional_args(parser_map):
     parser_map["create-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
     parser_map["delete-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
     parser_map["update-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
+    for operation in ["create-cluster", "update-cluster", "build-image"]:
+        parser_map[operation].add_argument(
+            "--validators-timing",
+            action="store_true",
+            help="Add to the output the time spent by each configuration validator, slowest first.",
+        )
 
 
 def middleware_hooks():
@@ -56,7 +97,12 @@ def middleware_hooks():
 
     The map has operation names as the keys and functions as values.
     """
-    return {"create-cluster": create_cluster, "delete-cluster": delete_cluster, "update-cluster": update_cluster}
+    return {
+        "build-image": build_image,
+        "create-cluster": create_cluster,
+        "delete-cluster": delete_cluster,
+        "update-cluster": update_cluster,
+    }
 
 
 def queryable(func):
@@ -71,15 +117,37 @@ def queryable(func):
     return wrapper
 
 
+def profilable(func):
+    def wrapper(dest_func, body, kwargs):
+        if not kwargs.pop("validators_timing", False):
+            return func(dest_func, body, kwargs)
+        with ValidatorsProfiler.profile() as profiler:
+            try:
+                ret = func(dest_func, body, kwargs)
+            except APIOperationException as e:
+                if isinstance(e.data, dict):
+                    e.data["validatorsTiming"] = profiler.report()
+                raise
+        ret["validatorsTiming"] = profiler.report()
+        return ret
+
+    return wrapper
+
+
+@queryable
+@profilable
+def build_image(func, _body, kwargs):
+    return func(**kwargs)
+
+
 @queryable
+@profilable
 def update_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_update_complete")
         try:
-            waiter.wait(StackName=kwargs["cluster_name"])
+            _wait_for_stack(kwargs["cluster_name"], "UPDATE_COMPLETE")
         except WaiterError as e:
             LOGGER.error("Failed when waiting for cluster update with error: %s", e)
             raise APIOperationException(_cluster_status(kwargs["cluster_name"]))
@@ -88,14 +156,13 @@ def update_cluster(func, _body, kwargs):
 
 
 @queryable
+@profilable
 def create_cluster(func, body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_create_complete")
         try:
-            waiter.wait(StackName=body["clusterName"])
+            _wait_for_stack(body["clusterName"], "CREATE_COMPLETE")
         except WaiterError as e:
             LOGGER.error("Failed when waiting for cluster creation with error: %s", e)
             raise APIOperationException(_cluster_status(body["clusterName"]))
@@ -108,10 +175,8 @@ def delete_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait:
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_delete_complete")
         try:
-            waiter.wait(StackName=kwargs["cluster_name"])
+            _wait_for_stack(kwargs["cluster_name"], "DELETE_COMPLETE")
         except WaiterError as e:
             LOGGER.error("Failed when waiting for cluster deletion with error: %s", e)
             raise APIOperationException({"message": f"Failed when deleting cluster '{kwargs['cluster_name']}'."})
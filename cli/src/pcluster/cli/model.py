@@ -13,10 +13,11 @@
 import functools
 import importlib
 import json
+import os
 
 import jmespath
 
-from pcluster.api import encoder, openapi
+from pcluster.api import openapi
 from pcluster.cli.exceptions import APIOperationException
 from pcluster.utils import to_kebab_case, to_snake_case, yaml_load
 
@@ -26,6 +27,9 @@ try:
 except ImportError:
     import importlib_resources as pkg_resources
 
+# Model precompiled from the OpenAPI specification, regenerated with "python -m pcluster.cli.model"
+PRECOMPILED_MODEL = "cli-model.json"
+
 
 def _param_overrides(operation, param):
     """Provide updates to the model that are specific to the CLI."""
@@ -150,6 +154,27 @@ def load_model(spec):
     return model
 
 
+def load_precompiled_model():
+    """
+    Load the model precompiled from the OpenAPI specification of the package.
+
+    This avoids parsing the whole specification at every CLI invocation. The model is loaded from the specification
+    when the precompiled one is not available.
+    """
+    try:
+        with pkg_resources.open_text(openapi, PRECOMPILED_MODEL) as model_file:  # pylint: disable=deprecated-method
+            return json.load(model_file)
+    except FileNotFoundError:
+        return load_model(package_spec())
+
+
+def write_precompiled_model(path):
+    """Precompile the model from the OpenAPI specification of the package and write it to the given path."""
+    with open(path, "w", encoding="utf-8") as model_file:
+        json.dump(load_model(package_spec()), model_file, indent=2)
+        model_file.write("\n")
+
+
 def get_function_from_name(function_name):
     """
     Get function by fully qualified name (e.g. "mymodule.myobj.myfunc").
@@ -206,7 +231,10 @@ def call(func_str, *args, **kwargs):
     tuple (instead of an object). Also uses the flask json-ifier to ensure data
     is converted the same as the API.
     """
+    from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
     query = kwargs.pop("query", None)
+    # Controller modules are imported only when one of their operations is called
     func = get_function_from_name(func_str)
     ret = func(*args, **kwargs)
     if isinstance(ret, tuple):
@@ -216,3 +244,7 @@ def call(func_str, *args, **kwargs):
             raise APIOperationException(data)
     data = json.loads(encoder.JSONEncoder().encode(ret))
     return jmespath.search(query, data) if query else data
+
+
+if __name__ == "__main__":
+    write_precompiled_model(os.path.join(os.path.dirname(openapi.__file__), PRECOMPILED_MODEL))
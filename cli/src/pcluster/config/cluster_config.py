@@ -18,8 +18,6 @@ from collections import defaultdict
 from enum import Enum
 from typing import Dict, List, Union
 
-import pkg_resources
-
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceTypeInfo
 from pcluster.aws.common import AWSClientError, get_region
@@ -1823,6 +1821,51 @@ class BaseClusterConfig(Resource):
             storage_count=ebs_count,
         )
 
+    def _get_referenced_instance_types(self) -> List[str]:
+        """Return the list of the instance types referenced in the configuration."""
+        return [self.head_node.instance_type]
+
+    def prefetch_instance_types_info(self):
+        """
+        Describe all the instance types referenced in the configuration with batched calls.
+
+        Validators and template builders will then be served from the cache instead of issuing one call per type.
+        Since this is only an optimization, AWSClientErrors (e.g. an invalid instance type in the batch)
+        are logged and the information is retrieved again per instance type when needed.
+        """
+        try:
+            AWSApi.instance().ec2.prefetch_instance_types_info(self._get_referenced_instance_types())
+        except AWSClientError:
+            logging.warning("Unable to cache describe_instance_types results for all instance types.")
+
+    def _get_referenced_subnet_ids(self) -> List[str]:
+        """Return the list of the subnets referenced by head node, queues and existing FSx file systems."""
+        subnet_ids = [self.head_node.networking.subnet_id] + self.compute_subnet_ids
+        existing_fsx = [
+            storage
+            for storage in self.shared_storage or []
+            if isinstance(storage, BaseSharedFsx) and storage.is_unmanaged
+        ]
+        if existing_fsx:
+            AWSApi.instance().fsx.get_file_systems_info([storage.file_system_id for storage in existing_fsx])
+            for storage in existing_fsx:
+                subnet_ids.extend(storage.file_system_subnets)
+        return subnet_ids
+
+    def prefetch_subnets_info(self):
+        """
+        Describe all the subnets referenced in the configuration with a single call.
+
+        Subnet, VPC and CIDR lookups will then be served from the cache. As for instance types,
+        AWSClientErrors are logged and the information is retrieved again per subnet when needed.
+        An IndexError is raised by the FSx lookup when an existing file system is not found, it is reported
+        by the validators in the same way.
+        """
+        try:
+            AWSApi.instance().ec2.describe_subnets(list(dict.fromkeys(self._get_referenced_subnet_ids())))
+        except (AWSClientError, IndexError):
+            logging.warning("Unable to cache describe_subnets results for all subnet ids.")
+
     def _cache_describe_volume(self):
         volume_ids = []
         for storage in self.shared_storage:
@@ -1914,8 +1957,10 @@ class BaseClusterConfig(Resource):
     def availability_zones_subnets_mapping(self):
         """Retrieve the mapping of availability zone and cluster subnets."""
         mapping = {self.head_node.networking.availability_zone: {self.head_node.networking.subnet_id}}
-        for subnet_id in self.compute_subnet_ids:
-            mapping.setdefault(AWSApi.instance().ec2.get_subnet_avail_zone(subnet_id), set()).add(subnet_id)
+        for subnet_id, availability_zone in (
+            AWSApi.instance().ec2.get_subnets_az_mapping(self.compute_subnet_ids).items()
+        ):
+            mapping.setdefault(availability_zone, set()).add(subnet_id)
         return mapping
 
     @property
@@ -2189,6 +2234,8 @@ class AwsBatchClusterConfig(BaseClusterConfig):
     @property
     def scheduler_resources(self):
         """Return scheduler specific resources."""
+        import pkg_resources  # pylint: disable=import-outside-toplevel
+
         return pkg_resources.resource_filename(__name__, "../resources/batch")
 
 
@@ -3239,6 +3286,23 @@ class SlurmClusterConfig(BaseClusterConfig):
                 result.add(capacity_reservation_target.capacity_reservation_resource_group_arn)
         return list(result)
 
+    def _get_referenced_subnet_ids(self) -> List[str]:
+        """Return the list of the subnets referenced by head node, queues, login nodes and storage."""
+        subnet_ids = super()._get_referenced_subnet_ids()
+        if self.login_nodes:
+            subnet_ids.extend(self.login_nodes_subnet_ids)
+        return subnet_ids
+
+    def _get_referenced_instance_types(self) -> List[str]:
+        """Return the list of the instance types referenced by head node, queues and login nodes."""
+        instance_types = super()._get_referenced_instance_types()
+        for queue in self.scheduling.queues:
+            for compute_resource in queue.compute_resources:
+                instance_types.extend(compute_resource.instance_types)
+        if self.login_nodes:
+            instance_types.extend(pool.instance_type for pool in self.login_nodes.pools)
+        return list(dict.fromkeys(instance_types))
+
     @property
     def all_relevant_capacity_reservation_ids(self):
         """Return a list of capacity reservation ids specified in the config or used by resource groups."""
@@ -13,14 +13,28 @@
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
 import asyncio
+import functools
 import itertools
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from enum import Enum
 from typing import List, Set
 
-from pcluster.validators.common import AsyncValidator, FailureLevel, ValidationResult, Validator, ValidatorContext
+from pcluster.validators.common import (
+    VALIDATION_DEADLINE_SEC,
+    VALIDATOR_TIMEOUT_SEC,
+    VALIDATORS_MAX_WORKERS,
+    AsyncValidator,
+    FailureLevel,
+    ValidationResult,
+    Validator,
+    ValidatorContext,
+    ValidatorsProfiler,
+)
 from pcluster.validators.iam_validators import AdditionalIamPolicyValidator
 from pcluster.validators.networking_validators import LambdaFunctionsVpcConfigValidator
 from pcluster.validators.s3_validators import UrlValidator
@@ -134,7 +148,7 @@ class Resource:
         # Parameters registry
         self.__params = {}
         self._validation_futures = []
-        self._validation_failures: List[ValidationResult] = []
+        self._sync_validations = []
         self._validators: List = []
         self.implied = implied
 
@@ -188,6 +202,9 @@ class Resource:
             return None
 
         LOGGER.debug("Executing validator %s", validator_class.__name__)
+        profiler = ValidatorsProfiler.active()
+        if profiler:
+            return profiler.execute(validator, validation_executor, validator_args)
         return validation_executor(validator_args, validator)
 
     @staticmethod
@@ -200,19 +217,111 @@ class Resource:
 
     @staticmethod
     def _validator_execute_async(validator_args, validator):
-        return validator.execute_async(**validator_args)
+        return validator.type, validator.execute_async(**validator_args)
 
-    def _await_async_validators(self):
-        # here could be a good spot to add a cascading timeout for the async validators
-        # if they are taking too long to execute for a resource and its children since the use of
-        # get_async_timed_validator_type_for allows to decorate only on single validator at a time and
-        # does not cascade to child resources
+    @staticmethod
+    def _timeout_failure(validator_type, timeout):
+        """
+        Return the failure of a validator that timed out.
+
+        It is an error, so that a configuration whose check could not complete is not deployed with the default
+        validation failure level. The validator can be suppressed to proceed anyway.
+        """
+        return [
+            ValidationResult(
+                f"Validation timed out after {round(timeout, 1)} seconds. "
+                f"It can be skipped with --suppress-validators type:{validator_type}",
+                FailureLevel.ERROR,
+                validator_type,
+            )
+        ]
+
+    @staticmethod
+    async def _await_async_validator(validator_type, coroutine, timeout):
+        try:
+            return await asyncio.wait_for(coroutine, timeout=max(timeout, 0))
+        except asyncio.TimeoutError:
+            LOGGER.debug("Validator %s timed out after %s seconds", validator_type, timeout)
+            return Resource._timeout_failure(validator_type, timeout)
+        except Exception as e:
+            LOGGER.debug("Validator %s unexpected failure: %s", validator_type, e)
+            return [ValidationResult(str(e), FailureLevel.ERROR, validator_type)]
+
+    def _await_async_validators(self, deadline: float = None):
+        """Run all the async validators on the event loop, each one bounded by the validator timeout and deadline."""
+        deadline = deadline or time.monotonic() + VALIDATION_DEADLINE_SEC
+        timeout = min(VALIDATOR_TIMEOUT_SEC, deadline - time.monotonic())
         return list(
             itertools.chain.from_iterable(
-                asyncio.get_event_loop().run_until_complete(asyncio.gather(*self._validation_futures))
+                asyncio.get_event_loop().run_until_complete(
+                    asyncio.gather(
+                        *(
+                            self._await_async_validator(validator_type, coroutine, timeout)
+                            for validator_type, coroutine in self._validation_futures
+                        )
+                    )
+                )
             )
         )
 
+    @staticmethod
+    def _run_sync_validation(validation, started_at):
+        started_at.append(time.monotonic())
+        return validation()
+
+    @staticmethod
+    def _wait_sync_validation(validation, future, started_at, deadline):
+        """
+        Wait for a sync validation submitted to the thread pool.
+
+        The validator timeout is counted from the moment the validator starts running, so that validators queued
+        behind others are not penalized. The overall deadline applies regardless.
+        """
+        while not future.done():
+            now = time.monotonic()
+            limit = min(deadline, started_at[0] + VALIDATOR_TIMEOUT_SEC) if started_at else deadline
+            if now >= limit:
+                future.cancel()
+                validator_type = validation.args[0].__name__
+                LOGGER.debug("Validator %s timed out", validator_type)
+                return Resource._timeout_failure(
+                    validator_type, now - started_at[0] if started_at else VALIDATION_DEADLINE_SEC
+                )
+            # While the validator is waiting for a worker, poll to detect when it starts running
+            wait_futures([future], timeout=(limit - now) if started_at else min(limit - now, 0.1))
+        return future.result() or []
+
+    def _execute_validators(self):
+        """
+        Execute all the collected validators concurrently and return their failures in a deterministic order.
+
+        Validators are independent of each other: sync ones are executed in a bounded thread pool while async
+        ones run on the event loop. Failures are returned in registration order, sync validators first.
+
+        The timeouts bound the time waited for the validation results, not the command: a sync validator that timed
+        out cannot be interrupted and keeps running in its worker thread, which the interpreter waits for at exit.
+        """
+        deadline = time.monotonic() + VALIDATION_DEADLINE_SEC
+        executor = ThreadPoolExecutor(max_workers=VALIDATORS_MAX_WORKERS, thread_name_prefix="validator")
+        try:
+            scheduled_validations = []
+            for validation in self._sync_validations:
+                started_at = []
+                scheduled_validations.append(
+                    (validation, executor.submit(self._run_sync_validation, validation, started_at), started_at)
+                )
+            async_failures = self._await_async_validators(deadline)
+            failures = list(
+                itertools.chain.from_iterable(
+                    self._wait_sync_validation(validation, future, started_at, deadline)
+                    for validation, future, started_at in scheduled_validations
+                )
+            )
+        finally:
+            # Do not wait for validators that exceeded their timeout, the running ones still complete in background
+            executor.shutdown(wait=False, cancel_futures=True)
+        return failures + async_failures
+
     def _nested_resources(self):
         nested_resources = []
         for _, value in self.__dict__.items():
@@ -231,31 +340,30 @@ class Resource:
         The "nested" parameter is used only for internal recursive calls to distinguish those from the top level
         one where the async validators results should be awaited for.
         """
-        # this validation logic is a responsibility that could be completely separated from the resource tree
-        # also until we need to support both sync and async validation this logic will be unnecessarily complex
-        # embracing async validation completely is possible and will greatly simplify this
+        # Validators of the whole resource tree are collected first (nested resources before their parent)
+        # and then executed concurrently only at the top level.
         self._validation_futures.clear()
-        self._validation_failures.clear()
+        self._sync_validations.clear()
 
         try:
             self._validate_nested_resources(context, suppressors)
             self._validate_self(context, suppressors)
         finally:
             if nested:
-                result = self._validation_failures, self._validation_futures.copy()
+                result = self._sync_validations.copy(), self._validation_futures.copy()
             else:
-                self._validation_failures.extend(self._await_async_validators())
-                result = self._validation_failures
+                result = self._execute_validators()
             self._validation_futures.clear()
+            self._sync_validations.clear()
 
         return result
 
     def _validate_nested_resources(self, context, suppressors):
-        # Call validators for nested resources
+        # Collect validators for nested resources
         for nested_resource in self._nested_resources():
-            failures, futures = nested_resource.validate(suppressors, context, nested=True)
+            sync_validations, futures = nested_resource.validate(suppressors, context, nested=True)
             self._validation_futures.extend(futures)
-            self._validation_failures.extend(failures)
+            self._sync_validations.extend(sync_validations)
 
     def _validate_self(self, context, suppressors):
         self._validators.clear()
@@ -266,8 +374,8 @@ class Resource:
                 if result:
                     self._validation_futures.extend([result])
             else:
-                self._validation_failures.extend(
-                    self._validator_execute(*validator, suppressors, self._validator_execute_sync) or []
+                self._sync_validations.append(
+                    functools.partial(self._validator_execute, *validator, suppressors, self._validator_execute_sync)
                 )
 
     def _register_validators(self, context: ValidatorContext = None):
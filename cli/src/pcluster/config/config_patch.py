@@ -8,12 +8,9 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
-import copy
 import logging
-import re
-import sys
 from collections import namedtuple
-from typing import List
+from typing import Tuple
 
 from pcluster.config.update_policy import UpdatePolicy
 from pcluster.schemas.cluster_schema import ClusterSchema
@@ -22,12 +19,6 @@ from pcluster.schemas.common_schema import BaseSchema
 # Represents a single parameter change in a ConfigPatch instance
 Change = namedtuple("Change", ["path", "key", "old_value", "new_value", "update_policy", "is_list"])
 
-# Patch for deepcopy bug - Issue10076 in Python < 3.7
-# see https://bugs.python.org/issue10076
-# see https://docs.python.org/3/whatsnew/3.7.html#re
-if sys.version_info <= (3, 7):
-    copy._deepcopy_dispatch[type(re.compile(""))] = lambda r, _: r  # pylint: disable=protected-access
-
 LOGGER = logging.getLogger(__name__)
 
 
@@ -56,6 +47,8 @@ class ConfigPatch:
         """
         Create a ConfigPatch.
 
+        The configurations are never modified, so they are not copied.
+
         :param base_config: The base configuration, f.i. from S3 bucket
         :param target_config: The target configuration, f.i. as loaded from configuration file
         """
@@ -63,9 +56,8 @@ class ConfigPatch:
         # Cached condition results
         self.condition_results = {}
 
-        # Make a deep copy of the basic and target configurations to avoid changing the original ones
-        self.base_config = copy.deepcopy(base_config)
-        self.target_config = copy.deepcopy(target_config)
+        self.base_config = base_config
+        self.target_config = target_config
 
         self.cluster_schema = ClusterSchema(cluster_name=cluster.name)
         self.changes = []
@@ -88,16 +80,19 @@ class ConfigPatch:
         All detected changes are added to the internal changes list, ready to be checked  through the public check()
         method.
         """
-        self._compare_section(self.base_config, self.target_config, self.cluster_schema, param_path=[])
+        self._compare_section(self.base_config, self.target_config, self.cluster_schema, param_path=())
 
-    def _compare_section(self, base_section: dict, target_section: dict, section_schema: BaseSchema, param_path: List):
+    def _compare_section(
+        self, base_section: dict, target_section: dict, section_schema: BaseSchema, param_path: Tuple[str, ...]
+    ):
         """
         Compare the provided base and target sections and append the detected changes to the internal changes list.
 
         :param base_section: The section in the base configuration
         :param target_section: The corresponding section in the target configuration
         :param section_schema: schema corresponding to the section to be analyzed (contains all the resources/params)
-        :param param_path: A list on which the items correspond to the path of the param in the configuration schema
+        :param param_path: A tuple on which the items correspond to the path of the param in the configuration schema.
+            It is shared by the nested sections, the changes get their own list copy of it.
         """
         for _, field_obj in section_schema.declared_fields.items():
             data_key = field_obj.data_key
@@ -127,7 +122,7 @@ class ConfigPatch:
                             # Add section change information
                             self.changes.append(
                                 Change(
-                                    param_path,
+                                    list(param_path),
                                     data_key,
                                     base_value if base_value else "-",
                                     target_value if target_value else "-",
@@ -139,9 +134,10 @@ class ConfigPatch:
                 # Simple param
                 target_value, target_data_key = self._get_value_from_section(data_key, target_section)
                 base_value, base_data_key = self._get_value_from_section(data_key, base_section)
+                change_path = param_path
                 if target_data_key != base_data_key:
                     # So far, this only happens when custom actions scripts are changed across simple and sequence.
-                    data_key = param_path.pop()
+                    change_path, data_key = param_path[:-1], param_path[-1]
                     base_value = {base_data_key: base_value}
                     target_value = {target_data_key: target_value}
                 else:
@@ -152,7 +148,9 @@ class ConfigPatch:
                 if target_value != base_value:
                     # Add param change information
                     self.changes.append(
-                        Change(param_path, data_key, base_value, target_value, change_update_policy, is_list=False)
+                        Change(
+                            list(change_path), data_key, base_value, target_value, change_update_policy, is_list=False
+                        )
                     )
 
     def _get_value_from_section(self, data_key, section):
@@ -169,9 +167,7 @@ class ConfigPatch:
 
     def _compare_nested_section(self, param_path, data_key, base_value, target_value, field_obj):
         # Compare nested sections and params
-        nested_path = copy.deepcopy(param_path)
-        nested_path.append(data_key)
-        self._compare_section(base_value, target_value, field_obj.schema, nested_path)
+        self._compare_section(base_value, target_value, field_obj.schema, param_path + (data_key,))
 
     def _compare_list(self, base_section, target_section, param_path, data_key, field_obj, change_update_policy):
         """
@@ -180,28 +176,30 @@ class ConfigPatch:
         If update_key is not set we're considering Name as identifier.
         """
         update_key = field_obj.metadata.get("update_key")
+        base_nested_sections = base_section.get(data_key, []) if base_section else []
+
+        # Index the base sections by update_key value, the first one wins in case of duplicated values
+        base_sections_by_key = {}
+        for base_nested_section in base_nested_sections:
+            base_sections_by_key.setdefault(base_nested_section.get(update_key), base_nested_section)
 
-        # Compare items in the list by searching the right item to compare through update_key value
-        # First, compare all sections from target vs base config and mark visited base sections.
+        # First, compare all sections from target vs base config and keep track of the matched base sections.
+        matched_base_sections = set()
         for target_nested_section in target_section.get(data_key, []):
             update_key_value = target_nested_section.get(update_key)
-            base_nested_section = next(
-                (
-                    nested_section
-                    for nested_section in base_section.get(data_key, [])
-                    if nested_section.get(update_key) == update_key_value
-                ),
-                None,
-            )
+            base_nested_section = base_sections_by_key.get(update_key_value)
             if base_nested_section:
-                nested_path = copy.deepcopy(param_path)
-                nested_path.append(f"{data_key}[{update_key_value}]")
-                self._compare_section(base_nested_section, target_nested_section, field_obj.schema, nested_path)
-                base_nested_section["visited"] = True
+                self._compare_section(
+                    base_nested_section,
+                    target_nested_section,
+                    field_obj.schema,
+                    param_path + (f"{data_key}[{update_key_value}]",),
+                )
+                matched_base_sections.add(id(base_nested_section))
             else:
                 self.changes.append(
                     Change(
-                        param_path,
+                        list(param_path),
                         data_key,
                         None,
                         target_nested_section,
@@ -209,20 +207,19 @@ class ConfigPatch:
                         is_list=True,
                     )
                 )
-        # Then, compare all non visited base sections vs target config.
-        if base_section:
-            for base_nested_section in base_section.get(data_key, []):
-                if not base_nested_section.get("visited", False):
-                    self.changes.append(
-                        Change(
-                            param_path,
-                            data_key,
-                            base_nested_section,
-                            None,
-                            change_update_policy,
-                            is_list=True,
-                        )
+        # Then, compare all non matched base sections vs target config.
+        for base_nested_section in base_nested_sections:
+            if id(base_nested_section) not in matched_base_sections:
+                self.changes.append(
+                    Change(
+                        list(param_path),
+                        data_key,
+                        base_nested_section,
+                        None,
+                        change_update_policy,
+                        is_list=True,
                     )
+                )
 
     @property
     def update_policy_level(self):
@@ -255,6 +252,10 @@ class ConfigPatch:
 
         patch_allowed = True
 
+        if self.changes:
+            # The runtime state of the cluster is retrieved once and shared by the checks of all the changes
+            self.cluster.load_runtime_state()
+
         for change in self.changes:
             check_result, reason, action_needed, print_change = change.update_policy.check(change, self)
 
@@ -275,6 +275,7 @@ class Operation(Enum):
     DELETE_CLUSTER = "delete-cluster"
     DELETE_CLUSTER_INSTANCES = "delete-cluster-instances"
     DELETE_IMAGE = "delete-image"
+    DELETE_IMAGES = "delete-images"
     DESCRIBE_CLUSTER = "describe-cluster"
     DESCRIBE_CLUSTER_INSTANCES = "describe-cluster-instances"
     DESCRIBE_COMPUTE_FLEET = "describe-compute-fleet"
@@ -16,20 +16,24 @@ import json
 import logging
 import os
 import tempfile
-import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Set, Tuple
 
-import pkg_resources
 from marshmallow import ValidationError
 
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import AWSClientError, BadRequestError, LimitExceededError, StackNotFoundError, get_region
-from pcluster.config.cluster_config import BaseClusterConfig, Tag
+from pcluster.aws.common import (
+    AWSClientError,
+    BadRequestError,
+    LimitExceededError,
+    StackNotFoundError,
+    Waiter,
+    get_region,
+)
 from pcluster.config.common import ValidatorSuppressor
-from pcluster.config.config_patch import ConfigPatch
 from pcluster.constants import (
     PCLUSTER_CLUSTER_NAME_TAG,
     PCLUSTER_NODE_TYPE_TAG,
@@ -40,6 +44,7 @@ from pcluster.constants import (
 )
 from pcluster.models.cluster_resources import (
     ClusterInstance,
+    ClusterInstancesSummary,
     ClusterStack,
     ExportClusterLogsFiltersParser,
     ListClusterLogsFiltersParser,
@@ -55,24 +60,20 @@ from pcluster.models.common import (
     create_logs_archive,
     export_stack_events,
     parse_config,
-    upload_archive,
+    upload_logs_archive,
 )
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus, ComputeFleetStatusManager
 from pcluster.models.login_nodes_status import LoginNodesStatus
 from pcluster.models.s3_bucket import S3Bucket, S3BucketFactory, S3FileFormat, create_s3_presigned_url
-from pcluster.schemas.cluster_schema import ClusterSchema
-from pcluster.templates.cdk_builder import CDKTemplateBuilder
-from pcluster.templates.import_cdk import start as start_cdk_import
-from pcluster.utils import (
-    datetime_to_epoch,
-    generate_random_name_with_prefix,
-    get_installed_version,
-    grouper,
-    yaml_load,
-)
+from pcluster.utils import datetime_to_epoch, generate_random_name_with_prefix, get_installed_version, yaml_load
 from pcluster.validators.common import FailureLevel, ValidationResult, ValidatorContext
 
-# pylint: disable=C0302
+if TYPE_CHECKING:
+    from pcluster.config.cluster_config import BaseClusterConfig
+
+# The cluster configuration, with its schema and validators, and the CDK templates are imported only by the
+# operations using them, so that the commands working on the cluster stack and instances start faster.
+# pylint: disable=C0302,import-outside-toplevel
 
 LOGGER = logging.getLogger(__name__)
 
@@ -141,6 +142,12 @@ class NotFoundClusterActionError(ClusterActionError, NotFound):
         super().__init__(message)
 
 
+def _has_running_login_nodes(login_nodes_status, pool_name):
+    healthy_nodes = login_nodes_status.get_healthy_nodes(pool_name=pool_name)
+    unhealthy_nodes = login_nodes_status.get_unhealthy_nodes(pool_name=pool_name)
+    return healthy_nodes is not None and unhealthy_nodes is not None and healthy_nodes + unhealthy_nodes != 0
+
+
 def _cluster_error_mapper(error, message=None):
     if message is None:
         message = str(error)
@@ -172,7 +179,8 @@ class Cluster:
         self.__official_ami = None
         self.__has_running_capacity = None
         self.__running_capacity = None
-        self.__has_running_login_nodes = None
+        # Pool name, or None for all the pools -> True if the pool has running login nodes
+        self.__running_login_nodes = None
 
     @property
     def stack(self):
@@ -253,7 +261,7 @@ class Cluster:
             raise _cluster_error_mapper(e, f"Unable to access bucket associated to the cluster.\n{e}")
 
     @property
-    def config(self) -> BaseClusterConfig:
+    def config(self) -> "BaseClusterConfig":
         """Return ClusterConfig object."""
         if not self.__config:
             try:
@@ -359,6 +367,8 @@ class Cluster:
         raises ClusterActionError: in case of generic error
         raises ConfigValidationError: if configuration is invalid
         """
+        from pcluster.templates.import_cdk import start as start_cdk_import
+
         start_cdk_import()
         creation_result = None
         artifact_dir_generated = False
@@ -378,6 +388,8 @@ class Cluster:
             # Create template if not provided by the user
             assets_metadata = None
             if not (self.config.dev_settings and self.config.dev_settings.cluster_template):
+                from pcluster.templates.cdk_builder import CDKTemplateBuilder
+
                 self.template_body, assets_metadata = CDKTemplateBuilder().build_cluster_template(
                     cluster_config=self.config, bucket=self.bucket, stack_name=self.stack_name
                 )
@@ -450,8 +462,10 @@ class Cluster:
             else []
         )
 
-    def _load_config(self, cluster_config: dict) -> BaseClusterConfig:
+    def _load_config(self, cluster_config: dict) -> "BaseClusterConfig":
         """Load the config and catch / translate any errors that occur during loading."""
+        from pcluster.schemas.cluster_schema import ClusterSchema
+
         try:
             return ClusterSchema(cluster_name=self.name).load(cluster_config)
         except ValidationError as e:
@@ -489,6 +503,8 @@ class Cluster:
             Cluster._load_additional_instance_type_data(cluster_config_dict)
             config = self._load_config(cluster_config_dict)
             config.official_ami = self.__official_ami
+            config.prefetch_instance_types_info()
+            config.prefetch_subnets_info()
             if context.during_update:
                 config.managed_head_node_security_group = self.stack.get_resource_physical_id("HeadNodeSecurityGroup")
                 config.managed_compute_security_group = self.stack.get_resource_physical_id("ComputeSecurityGroup")
@@ -514,6 +530,8 @@ class Cluster:
 
     def _upload_config(self):
         """Upload source config and save config version."""
+        from pcluster.schemas.cluster_schema import ClusterSchema
+
         self._check_bucket_existence()
         try:
             # Upload config with default values and sections
@@ -559,6 +577,8 @@ class Cluster:
 
     def _upload_change_set(self, changes=None):
         """Upload change set."""
+        from pcluster.config.config_patch import ConfigPatch
+
         if changes:
             self._check_bucket_existence()
             try:
@@ -586,6 +606,8 @@ class Cluster:
         LOGGER.info("Uploading cluster artifacts to S3...")
         self._check_bucket_existence()
         try:
+            import pkg_resources
+
             resources = pkg_resources.resource_filename(__name__, "../resources/custom_resources")
             self.bucket.upload_resources(
                 resource_dir=resources, custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name")
@@ -668,10 +690,10 @@ class Cluster:
 
     def _wait_for_stack_update(self):
         """Wait for the given stack to be finished updating."""
-        while self._get_updated_stack_status() == "UPDATE_IN_PROGRESS":
-            time.sleep(5)
-        while self._get_updated_stack_status() == "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS":
-            time.sleep(2)
+        Waiter("cluster stack update", min_delay=2, max_delay=15).wait(
+            self._get_updated_stack_status,
+            until=lambda status: status not in ("UPDATE_IN_PROGRESS", "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS"),
+        )
 
     def _get_stack_template(self):
         """Return the template body of the stack."""
@@ -681,27 +703,32 @@ class Cluster:
             raise _cluster_error_mapper(e, f"Unable to retrieve template for stack {self.stack_name}. {e}")
 
     def terminate_nodes(self):
-        """Terminate all compute nodes of a cluster."""
+        """Terminate all compute nodes of a cluster, terminating the instances while they are being listed."""
         try:
             LOGGER.info("\nChecking if there are running compute nodes that require termination...")
-            filters = self._get_instance_filters(node_type=NodeType.COMPUTE)
-            instances = AWSApi.instance().ec2.list_instance_ids(filters)
-
-            for instance_ids in grouper(instances, 100):
-                LOGGER.info("Terminating following instances: %s", instance_ids)
-                if instance_ids:
-                    AWSApi.instance().ec2.terminate_instances(instance_ids)
-
-            LOGGER.info("Compute fleet cleaned up.")
+            instance_ids = (instance.id for instance in self.iter_instances(node_type=NodeType.COMPUTE))
+            terminated, failures = AWSApi.instance().ec2.terminate_instances_in_batches(instance_ids)
         except Exception as e:
             LOGGER.error("Failed when checking for running EC2 instances with error: %s", str(e))
             raise _cluster_error_mapper(e, f"Unable to delete running EC2 instances with error: {e}")
 
+        if failures:
+            instance_ids_by_reason = {}
+            for instance_id, reason in failures.items():
+                instance_ids_by_reason.setdefault(reason, []).append(instance_id)
+            message = "; ".join(
+                f"{', '.join(instance_ids)}: {reason}" for reason, instance_ids in instance_ids_by_reason.items()
+            )
+            LOGGER.error(
+                "Failed to terminate %d of %d compute nodes. %s", len(failures), terminated + len(failures), message
+            )
+            raise ClusterActionError(f"Unable to delete {len(failures)} running EC2 instances with error: {message}")
+        LOGGER.info("Compute fleet cleaned up, %d instances terminated.", terminated)
+
     @property
     def compute_instances(self) -> List[ClusterInstance]:
         """Get compute instances."""
-        instances, _ = self.describe_instances(node_type=NodeType.COMPUTE)
-        return instances
+        return list(self.iter_instances(node_type=NodeType.COMPUTE))
 
     @property
     def head_node_instance(self) -> ClusterInstance:
@@ -715,7 +742,7 @@ class Cluster:
     @property
     def login_node_instances(self) -> List[ClusterInstance]:
         """Get login node instances."""
-        instances, _ = self.describe_instances(node_type=NodeType.LOGIN_NODE)
+        instances = list(self.iter_instances(node_type=NodeType.LOGIN_NODE))
         if instances:
             return instances
         else:
@@ -743,6 +770,19 @@ class Cluster:
         except AWSClientError as e:
             raise _cluster_error_mapper(e, f"Failed to retrieve cluster instances. {e}")
 
+    def iter_instances(self, node_type: NodeType = None, queue_name: str = None) -> Iterator[ClusterInstance]:
+        """Return a generator over all the cluster instances filtered by node type, retrieving the pages lazily."""
+        try:
+            filters = self._get_instance_filters(node_type, queue_name)
+            for instance in AWSApi.instance().ec2.iter_instances(filters):
+                yield ClusterInstance(instance)
+        except AWSClientError as e:
+            raise _cluster_error_mapper(e, f"Failed to retrieve cluster instances. {e}")
+
+    def get_instances_summary(self, node_type: NodeType = None, queue_name: str = None) -> ClusterInstancesSummary:
+        """Return the counts of the cluster instances, computed in one pass over all the instances."""
+        return ClusterInstancesSummary(self.iter_instances(node_type=node_type, queue_name=queue_name))
+
     def has_running_capacity(self, updated_value: bool = False) -> bool:
         """Return True if the cluster has running capacity. Note: the value will be cached."""
         if self.__has_running_capacity is None or updated_value:
@@ -758,28 +798,52 @@ class Cluster:
         """
         Return True if the cluster has running login nodes, or a specific pool if a pool name is provided.
 
-        Note: the value will be cached.
+        Note: the status of all the pools is retrieved once and cached.
         """
-        healthy_nodes = self.login_nodes_status.get_healthy_nodes(pool_name=pool_name)
-        unhealthy_nodes = self.login_nodes_status.get_unhealthy_nodes(pool_name=pool_name)
-
-        if self.__has_running_login_nodes is None or updated_value:
-            self.__has_running_login_nodes = (
-                healthy_nodes is not None and unhealthy_nodes is not None and healthy_nodes + unhealthy_nodes != 0
-            )
-        return self.__has_running_login_nodes
+        if self.__running_login_nodes is None or updated_value:
+            login_nodes_status = self.login_nodes_status
+            self.__running_login_nodes = {
+                name: _has_running_login_nodes(login_nodes_status, name)
+                for name in [None, *login_nodes_status.get_pool_status_dict()]
+            }
+        return self.__running_login_nodes.get(pool_name, False)
 
     def get_running_capacity(self, updated_value: bool = False):
         """Return the number of instances or desired capacity. Note: the value will be cached."""
         if self.__running_capacity is None or updated_value:
             if self.stack.scheduler == "slurm":
-                self.__running_capacity = len(self.compute_instances)
+                self.__running_capacity = sum(1 for _ in self.iter_instances(node_type=NodeType.COMPUTE))
             elif self.stack.scheduler == "awsbatch":
                 self.__running_capacity = AWSApi.instance().batch.get_compute_environment_capacity(
                     ce_name=self.stack.batch_compute_environment
                 )
         return self.__running_capacity
 
+    def load_runtime_state(self):
+        """
+        Retrieve concurrently the runtime state checked by the update policies and cache it.
+
+        Only the state read by the checks of the scheduler is retrieved: the running capacity for AWS Batch, the compute
+        fleet status and the login nodes status for Slurm. The following has_running_capacity, get_running_capacity and
+        has_running_login_nodes calls do not query AWS. A value that cannot be retrieved is left to be retrieved on
+        demand, so that the error is raised by the check needing it.
+        """
+        # The stack is loaded before starting the threads, all the loaders depend on it
+        if self.stack.scheduler == "awsbatch":
+            # For AWS Batch the running capacity tells if the cluster has running capacity
+            loaders = [self.get_running_capacity]
+        else:
+            # The Slurm checks do not need the running capacity, which requires listing all the compute instances
+            loaders = [self.has_running_capacity]
+            if self.stack.scheduler == "slurm":
+                loaders.append(self.has_running_login_nodes)
+
+        with ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="runtime-state") as executor:
+            futures = {loader.__name__: executor.submit(loader, updated_value=True) for loader in loaders}
+        for name, future in futures.items():
+            if future.exception():
+                LOGGER.debug("Unable to retrieve %s of cluster %s: %s", name, self.name, future.exception())
+
     def start(self):
         """Start the cluster."""
         try:
@@ -878,6 +942,8 @@ class Cluster:
         return target_config, changes, ignored_validation_failures
 
     def _validate_patch(self, force, target_config):
+        from pcluster.config.config_patch import ConfigPatch
+
         patch = ConfigPatch(
             cluster=self, base_config=self.config.source_config, target_config=target_config.source_config
         )
@@ -911,6 +977,8 @@ class Cluster:
         raises ConfigValidationError: if configuration is invalid
         raises ClusterUpdateError: if update is not allowed
         """
+        from pcluster.templates.import_cdk import start as start_cdk_import
+
         start_cdk_import()
         try:
             target_config, changes, ignored_validation_failures = self.validate_update_request(
@@ -928,6 +996,8 @@ class Cluster:
             # Create template if not provided by the user
             assets_metadata = None
             if not (self.config.dev_settings and self.config.dev_settings.cluster_template):
+                from pcluster.templates.cdk_builder import CDKTemplateBuilder
+
                 self.template_body, assets_metadata = CDKTemplateBuilder().build_cluster_template(
                     cluster_config=self.config,
                     bucket=self.bucket,
@@ -980,6 +1050,8 @@ class Cluster:
         self.config.tags = [tag for tag in self.config.tags if tag.key not in tags]
 
         # Add the tags
+        from pcluster.config.cluster_config import Tag
+
         self.config.tags += [Tag(key=tag_key, value=tag_value) for tag_key, tag_value in tags.items()]
 
     def _get_cfn_tags(self):
@@ -996,6 +1068,7 @@ class Cluster:
         end_time: datetime = None,
         filters: List[str] = None,
         output_file: str = None,
+        progress_callback: Callable[[int, int], None] = None,
     ):
         """
         Export cluster's logs in the given output path, by using given bucket as a temporary folder.
@@ -1009,6 +1082,7 @@ class Cluster:
         :param end_time: End time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
         :param filters: Filters in the format ["Name=name,Values=value1,value2"]
                Accepted filters are: private_dns_name, node_type==HeadNode
+        :param progress_callback: Function called with the number of completed and total CloudWatch export windows
         """
         # check stack
         if not AWSApi.instance().cfn.stack_exists(self.stack_name):
@@ -1031,6 +1105,7 @@ class Cluster:
                         output_dir=root_archive_dir,
                         bucket_prefix=bucket_prefix,
                         keep_s3_objects=keep_s3_objects,
+                        progress_callback=progress_callback,
                     )
                     logs_exporter.execute(
                         log_stream_prefix=export_logs_filters.log_stream_prefix,
@@ -1047,11 +1122,11 @@ class Cluster:
                 stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
                 export_stack_events(self.stack_name, stack_events_file)
 
-                archive_path = create_logs_archive(root_archive_dir, output_file)
                 if output_file:
+                    create_logs_archive(root_archive_dir, output_file)
                     return output_file
                 else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
+                    s3_path = upload_logs_archive(root_archive_dir, bucket, bucket_prefix)
                     return create_s3_presigned_url(s3_path)
         except Exception as e:
             raise ClusterActionError(f"Unexpected error when exporting cluster's logs: {e}")
@@ -0,0 +1,207 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import base64
+import binascii
+import logging
+import os
+import threading
+import time
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.aws_resources import StackInfo
+from pcluster.aws.common import PersistentCache, StackNotFoundError, get_region
+from pcluster.constants import PCLUSTER_IMAGE_ID_TAG, PCLUSTER_VERSION_TAG
+
+LOGGER = logging.getLogger(__name__)
+
+CLUSTER_INVENTORY_PAGE_SIZE = 100
+# Pages following the first one are served without refreshing the index if it is more recent than this interval
+CLUSTER_INVENTORY_REFRESH_INTERVAL_SEC = 30
+# Above this number of new or updated stacks a full describe_stacks sweep is cheaper than describing them one by one
+CLUSTER_INVENTORY_FULL_SWEEP_THRESHOLD = 50
+CLUSTER_INVENTORY_CACHE_TTL_SEC = 7 * 24 * 60 * 60
+
+
+class InvalidNextTokenError(Exception):
+    """Error raised when the next token given to the inventory is not valid."""
+
+    def __init__(self, next_token: str):
+        super().__init__(f"Invalid next token: {next_token}")
+
+
+class ClusterInventory:
+    """
+    Compact index of the cluster stacks of a region, used to answer list-clusters without describing every stack.
+
+    The index is enabled by setting the PCLUSTER_CLUSTER_INVENTORY_ENABLED environment variable. It is kept in memory,
+    so that it is reused across warm invocations of the API Lambda, and in the persistent cache when enabled.
+    Each refresh lists the stack summaries of the region and describes only the stacks created or updated since the
+    previous refresh; the status of the other cluster stacks is updated from their summary.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, region: str):
+        self._region = region
+        self._lock = threading.Lock()
+        # Stack id -> {"updated": creation or last update time, "stack": compact cluster stack or None}
+        self._entries = {}
+        self._refreshed_at = 0.0
+        self._loaded = False
+
+    @staticmethod
+    def is_enabled():
+        """Tell if list-clusters must be answered from the inventory."""
+        return os.environ.get("PCLUSTER_CLUSTER_INVENTORY_ENABLED", "false").lower() in ["true", "1", "yes"]
+
+    @staticmethod
+    def instance():
+        """Return the inventory of the current region."""
+        region = get_region()
+        with ClusterInventory._instances_lock:
+            if region not in ClusterInventory._instances:
+                ClusterInventory._instances[region] = ClusterInventory(region)
+            return ClusterInventory._instances[region]
+
+    @staticmethod
+    def reset():
+        """Drop the in-memory inventories."""
+        with ClusterInventory._instances_lock:
+            ClusterInventory._instances = {}
+
+    def list_cluster_stacks(
+        self, next_token: str = None, stack_filter=None, page_size: int = CLUSTER_INVENTORY_PAGE_SIZE
+    ):
+        """
+        Return a page of compact cluster stacks, sorted by name, and the token to retrieve the following page.
+
+        :param next_token: token returned by the previous call, None to retrieve the first page
+        :param stack_filter: optional predicate applied before paginating, so that every page but the last is full
+        :param page_size: maximum number of stacks returned
+        """
+        start_after = self._decode_token(next_token) if next_token else None
+        with self._lock:
+            if not next_token or time.time() - self._refreshed_at > CLUSTER_INVENTORY_REFRESH_INTERVAL_SEC:
+                self._refresh()
+            stacks = sorted(
+                (dict(entry["stack"]) for entry in self._entries.values() if entry["stack"]),
+                key=lambda stack: stack["StackName"],
+            )
+
+        matching = [
+            stack
+            for stack in stacks
+            if (start_after is None or stack["StackName"] > start_after) and (not stack_filter or stack_filter(stack))
+        ]
+        page = matching[:page_size]
+        result_token = self._encode_token(page[-1]["StackName"]) if len(matching) > page_size else None
+        return page, result_token
+
+    def _refresh(self):
+        if not self._loaded:
+            self._load()
+            self._loaded = True
+
+        entries = {}
+        changed_summaries = []
+        for summary in AWSApi.instance().cfn.list_stack_summaries():
+            if summary.get("ParentId"):
+                continue
+            entry = self._entries.get(summary["StackId"])
+            if entry and entry["updated"] == self._get_updated_time(summary):
+                if entry["stack"]:
+                    entry["stack"]["StackStatus"] = summary["StackStatus"]
+                entries[summary["StackId"]] = entry
+            else:
+                changed_summaries.append(summary)
+
+        if len(changed_summaries) > CLUSTER_INVENTORY_FULL_SWEEP_THRESHOLD:
+            swept_stacks = self._describe_all_cluster_stacks()
+            get_cluster_stack = swept_stacks.get
+        else:
+            get_cluster_stack = self._describe_cluster_stack
+        for summary in changed_summaries:
+            stack = get_cluster_stack(summary["StackId"])
+            entries[summary["StackId"]] = {
+                "updated": self._get_updated_time(summary),
+                "stack": self._to_compact_stack(stack) if stack else None,
+            }
+        LOGGER.debug("Cluster inventory refreshed, %d stacks described", len(changed_summaries))
+
+        self._entries = entries
+        self._refreshed_at = time.time()
+        self._store()
+
+    @staticmethod
+    def _get_updated_time(summary):
+        return str(summary.get("LastUpdatedTime", summary.get("CreationTime")))
+
+    @staticmethod
+    def _is_cluster_stack(stack):
+        stack_info = StackInfo(stack)
+        return bool(stack_info.get_tag(PCLUSTER_VERSION_TAG)) and stack_info.get_tag(PCLUSTER_IMAGE_ID_TAG) is None
+
+    def _describe_cluster_stack(self, stack_id):
+        try:
+            stack = AWSApi.instance().cfn.describe_stack(stack_id)
+        except StackNotFoundError:
+            return None
+        return stack if self._is_cluster_stack(stack) else None
+
+    @staticmethod
+    def _describe_all_cluster_stacks():
+        stacks = {}
+        next_token = None
+        while True:
+            page, next_token = AWSApi.instance().cfn.list_pcluster_stacks(next_token=next_token)
+            stacks.update({stack["StackId"]: stack for stack in page})
+            if not next_token:
+                return stacks
+
+    @staticmethod
+    def _to_compact_stack(stack):
+        """Keep only the stack data needed to build a cluster summary."""
+        return {
+            "StackId": stack["StackId"],
+            "StackName": stack["StackName"],
+            "StackStatus": stack["StackStatus"],
+            "Tags": [tag for tag in stack.get("Tags", []) if tag["Key"] == PCLUSTER_VERSION_TAG],
+            "Parameters": [param for param in stack.get("Parameters", []) if param["ParameterKey"] == "Scheduler"],
+        }
+
+    @staticmethod
+    def _encode_token(stack_name):
+        return base64.urlsafe_b64encode(stack_name.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_token(next_token):
+        try:
+            return base64.urlsafe_b64decode(next_token.encode("ascii")).decode("utf-8")
+        except (binascii.Error, UnicodeError):
+            raise InvalidNextTokenError(next_token)
+
+    def _load(self):
+        if not PersistentCache.is_enabled():
+            return
+        found, value = PersistentCache.get("ClusterInventory", {"region": self._region})
+        if found:
+            self._entries = value["entries"]
+            self._refreshed_at = value["refreshed_at"]
+
+    def _store(self):
+        if PersistentCache.is_enabled():
+            PersistentCache.put(
+                "ClusterInventory",
+                {"region": self._region},
+                {"entries": self._entries, "refreshed_at": self._refreshed_at},
+                ttl=CLUSTER_INVENTORY_CACHE_TTL_SEC,
+            )
@@ -11,8 +11,9 @@
 import datetime
 import itertools
 import re
+from collections import Counter
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, List
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceInfo, StackInfo
@@ -214,6 +215,32 @@ class ClusterInstance(InstanceInfo):
         return next(iter([tag["Value"] for tag in self._tags if tag["Key"] == tag_key]), None)
 
 
+class ClusterInstancesSummary:
+    """Counts of the cluster instances by queue, compute resource, instance type and state, computed in one pass."""
+
+    def __init__(self, instances: Iterable[ClusterInstance] = ()):
+        self.total = 0
+        self.queues = Counter()
+        # Compute resource names are unique only within a queue, so they are counted by (queue, compute resource)
+        self.compute_resources = Counter()
+        self.instance_types = Counter()
+        self.states = Counter()
+        for instance in instances:
+            self.add(instance)
+
+    def add(self, instance: ClusterInstance):
+        """Count the given instance."""
+        self.total += 1
+        self.instance_types[instance.instance_type] += 1
+        self.states[instance.state] += 1
+        queue_name = instance.queue_name
+        if queue_name:
+            self.queues[queue_name] += 1
+            compute_resource_name = instance.compute_resource_name
+            if compute_resource_name:
+                self.compute_resources[(queue_name, compute_resource_name)] += 1
+
+
 class ClusterLogsFiltersParser:
     """Class to parse filters."""
 
@@ -12,21 +12,35 @@ import datetime
 import gzip
 import json
 import logging
+import math
 import os
 import os.path
+import shutil
 import tarfile
-import time
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
 
 import configparser
 
-from pcluster.api.encoder import JSONEncoder
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import AWSClientError, get_region
+from pcluster.aws.common import AWSClientError, Waiter, get_region
 from pcluster.utils import datetime_to_epoch, to_utc_datetime, yaml_load
 
 LOGGER = logging.getLogger(__name__)
 
+# CloudWatch allows a single running export task per account, so long intervals are exported one time window
+# at a time, downloading the logs of a window while the next one is being exported.
+EXPORT_LOGS_WINDOW = datetime.timedelta(days=1)
+EXPORT_TASK_MIN_POLLING_INTERVAL_SEC = 1
+EXPORT_TASK_MAX_POLLING_INTERVAL_SEC = 15
+# Exported objects are downloaded and decompressed concurrently, streaming from S3 with bounded memory
+EXPORT_LOGS_DOWNLOAD_WORKERS = 8
+EXPORT_LOGS_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Logs archives are uploaded while being created, buffering in memory at most a part per concurrent upload
+ARCHIVE_UPLOAD_PART_SIZE = 16 * 1024 * 1024
+ARCHIVE_UPLOAD_MAX_CONCURRENT_PARTS = 4
+
 
 class LimitExceeded(Exception):
     """Base exception type for errors caused by exceeding the limit of some underlying AWS service."""
@@ -137,7 +151,16 @@ class LogsExporterError(Exception):
 class CloudWatchLogsExporter:
     """Utility class used to export log group logs."""
 
-    def __init__(self, resource_id, log_group_name, bucket, output_dir, bucket_prefix=None, keep_s3_objects=False):
+    def __init__(
+        self,
+        resource_id,
+        log_group_name,
+        bucket,
+        output_dir,
+        bucket_prefix=None,
+        keep_s3_objects=False,
+        progress_callback: Callable[[int, int], None] = None,
+    ):
         # check bucket
         bucket_region = AWSApi.instance().s3.get_bucket_region(bucket_name=bucket)
         if bucket_region != get_region():
@@ -149,6 +172,8 @@ class CloudWatchLogsExporter:
         self.log_group_name = log_group_name
         self.output_dir = output_dir
         self.keep_s3_objects = keep_s3_objects
+        self.progress_callback = progress_callback
+        self._downloaded_paths = set()
 
         if bucket_prefix:
             self.bucket_prefix = bucket_prefix
@@ -161,25 +186,56 @@ class CloudWatchLogsExporter:
             self.delete_everything_under_prefix = AWSApi.instance().s3_resource.is_empty(bucket, self.bucket_prefix)
 
     def execute(self, log_stream_prefix=None, start_time: datetime.datetime = None, end_time: datetime.datetime = None):
-        """Start export task. Returns logs streams folder."""
-        # Export logs to S3
-        task_id = self._export_logs_to_s3(log_stream_prefix=log_stream_prefix, start_time=start_time, end_time=end_time)
-        LOGGER.info("Log export task id: %s", task_id)
-        # Download exported S3 objects to output dir subfolder
+        """Start export tasks, one per time window, and download their results. Returns logs streams folder."""
+        windows = self._split_time_range(start_time, end_time)
+        log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
+        task_ids = []
         try:
-            log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
-            self._download_s3_objects_with_prefix(task_id, log_streams_dir)
+            # A single download worker keeps the logs of the same stream appended in chronological order
+            with ThreadPoolExecutor(max_workers=1) as download_executor:
+                download = None
+                for window_start, window_end in windows:
+                    # Export logs to S3
+                    task_id = self._export_logs_to_s3(
+                        log_stream_prefix=log_stream_prefix, start_time=window_start, end_time=window_end
+                    )
+                    task_ids.append(task_id)
+                    LOGGER.info("Log export task id: %s", task_id)
+                    if download:
+                        download.result()
+                        self._report_progress(len(task_ids) - 1, len(windows))
+                    # Download exported S3 objects to output dir subfolder while the next window is exported
+                    download = download_executor.submit(self._download_s3_objects_with_prefix, task_id, log_streams_dir)
+                download.result()
+                self._report_progress(len(task_ids), len(windows))
             LOGGER.info("Archive of CloudWatch logs saved to %s", self.output_dir)
         except OSError:
             raise LogsExporterError("Unable to download archive logs from S3, double check your filters are correct.")
         finally:
-            if not self.keep_s3_objects:
+            if task_ids and not self.keep_s3_objects:
                 if self.delete_everything_under_prefix:
-                    delete_key = self.bucket_prefix
+                    delete_keys = [self.bucket_prefix]
                 else:
-                    delete_key = "/".join((self.bucket_prefix, task_id))
-                LOGGER.debug("Cleaning up S3 bucket %s. Deleting all objects under %s", self.bucket, delete_key)
-                AWSApi.instance().s3_resource.delete_objects(bucket_name=self.bucket, prefix=delete_key)
+                    delete_keys = ["/".join((self.bucket_prefix, task_id)) for task_id in task_ids]
+                for delete_key in delete_keys:
+                    LOGGER.debug("Cleaning up S3 bucket %s. Deleting all objects under %s", self.bucket, delete_key)
+                    AWSApi.instance().s3_resource.delete_objects(bucket_name=self.bucket, prefix=delete_key)
+
+    @staticmethod
+    def _split_time_range(start_time: datetime.datetime = None, end_time: datetime.datetime = None):
+        """Split the given time range in consecutive windows of at most EXPORT_LOGS_WINDOW."""
+        if not start_time or not end_time or end_time - start_time <= EXPORT_LOGS_WINDOW:
+            return [(start_time, end_time)]
+        windows_count = math.ceil((end_time - start_time) / EXPORT_LOGS_WINDOW)
+        return [
+            (start_time + index * EXPORT_LOGS_WINDOW, min(start_time + (index + 1) * EXPORT_LOGS_WINDOW, end_time))
+            for index in range(windows_count)
+        ]
+
+    def _report_progress(self, completed_windows, total_windows):
+        LOGGER.info("Exported logs for %s of %s time windows", completed_windows, total_windows)
+        if self.progress_callback:
+            self.progress_callback(completed_windows, total_windows)
 
     def _export_logs_to_s3(
         self, log_stream_prefix=None, start_time: datetime.datetime = None, end_time: datetime.datetime = None
@@ -212,37 +268,56 @@ class CloudWatchLogsExporter:
 
     @staticmethod
     def _wait_for_task_completion(task_id):
-        """Wait for the CloudWatch logs export task given by task_id to finish."""
+        """Wait for the CloudWatch logs export task given by task_id to finish, polling with exponential backoff."""
         LOGGER.debug("Waiting for export task with task ID=%s to finish...", task_id)
-        status = "PENDING"
         still_running_statuses = ("PENDING", "PENDING_CANCEL", "RUNNING")
-        while status in still_running_statuses:
-            time.sleep(1)
-            status = AWSApi.instance().logs.get_export_task_status(task_id)
-        return status
+        waiter = Waiter(
+            f"export task {task_id}",
+            min_delay=EXPORT_TASK_MIN_POLLING_INTERVAL_SEC,
+            max_delay=EXPORT_TASK_MAX_POLLING_INTERVAL_SEC,
+        )
+        return waiter.wait(
+            lambda: AWSApi.instance().logs.get_export_task_status(task_id),
+            until=lambda status: status not in still_running_statuses,
+        )
 
     def _download_s3_objects_with_prefix(self, task_id, destdir):
-        """Download all object in bucket with given prefix into destdir."""
+        """
+        Download all object in bucket with given prefix into destdir.
+
+        Objects of a log stream already downloaded for a previous time window are appended to the same file.
+        """
         prefix = f"{self.bucket_prefix}/{task_id}"
         LOGGER.debug("Downloading exported logs from s3 bucket %s (under key %s) to %s", self.bucket, prefix, destdir)
+        # Objects of the same log stream are extracted in order by the same worker, since they go to the same file
+        keys_by_path = {}
         for archive_object in AWSApi.instance().s3_resource.get_objects(bucket_name=self.bucket, prefix=prefix):
             decompressed_path = os.path.dirname(os.path.join(destdir, archive_object.key))
             decompressed_path = decompressed_path.replace(
                 r"{unwanted_path_segment}{sep}".format(unwanted_path_segment=prefix, sep=os.path.sep), ""
             )
-            compressed_path = f"{decompressed_path}.gz"
-
-            LOGGER.debug("Downloading object with key=%s to %s", archive_object.key, compressed_path)
-            os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
-            AWSApi.instance().s3_resource.download_file(
-                bucket_name=self.bucket, key=archive_object.key, output=compressed_path
-            )
-
-            # Create a decompressed copy of the downloaded archive and remove the original
-            LOGGER.debug("Extracting object at %s to %s", compressed_path, decompressed_path)
-            with gzip.open(compressed_path) as gfile, open(decompressed_path, "wb") as outfile:
-                outfile.write(gfile.read())
-            os.remove(compressed_path)
+            keys_by_path.setdefault(decompressed_path, []).append(archive_object.key)
+
+        if keys_by_path:
+            with ThreadPoolExecutor(max_workers=min(len(keys_by_path), EXPORT_LOGS_DOWNLOAD_WORKERS)) as executor:
+                downloads = [
+                    executor.submit(self._download_log_stream, keys, decompressed_path)
+                    for decompressed_path, keys in keys_by_path.items()
+                ]
+                for download in downloads:
+                    download.result()
+
+    def _download_log_stream(self, keys, decompressed_path):
+        """Download the given gzipped objects and extract them into a single file, streaming in fixed-size chunks."""
+        os.makedirs(os.path.dirname(decompressed_path), exist_ok=True)
+        mode = "ab" if decompressed_path in self._downloaded_paths else "wb"
+        with open(decompressed_path, mode) as outfile:
+            for key in keys:
+                LOGGER.debug("Extracting object with key=%s to %s", key, decompressed_path)
+                body = AWSApi.instance().s3.get_object(bucket_name=self.bucket, key=key)["Body"]
+                with gzip.GzipFile(fileobj=body) as gfile:
+                    shutil.copyfileobj(gfile, outfile, EXPORT_LOGS_DOWNLOAD_CHUNK_SIZE)
+        self._downloaded_paths.add(decompressed_path)
 
 
 def get_all_stack_events(stack_name: str):
@@ -258,6 +333,9 @@ def get_all_stack_events(stack_name: str):
 
 def export_stack_events(stack_name: str, output_file: str):
     """Save CFN stack events into a file."""
+    # The API encoder pulls in connexion, import it only when exporting events
+    from pcluster.api.encoder import JSONEncoder  # pylint: disable=import-outside-toplevel
+
     stack_events = get_all_stack_events(stack_name)
 
     with open(output_file, "w", encoding="utf-8") as cfn_events_file:
@@ -274,12 +352,83 @@ def create_logs_archive(directory: str, output_file: str = None):
     return output_file
 
 
-def upload_archive(bucket: str, bucket_prefix: str, archive_path: str):
-    archive_filename = os.path.basename(archive_path)
-    with open(archive_path, "rb") as archive_file:
-        archive_data = archive_file.read()
+class _MultipartUploadStream:
+    """Writable file object uploading the data written to it as the parts of an S3 multipart upload."""
+
+    def __init__(self, bucket: str, key: str):
+        self._bucket = bucket
+        self._key = key
+        self._buffer = bytearray()
+        self._parts = []
+        self._error = None
+        self._slots = threading.BoundedSemaphore(ARCHIVE_UPLOAD_MAX_CONCURRENT_PARTS)
+        self._executor = ThreadPoolExecutor(max_workers=ARCHIVE_UPLOAD_MAX_CONCURRENT_PARTS)
+        self._upload_id = AWSApi.instance().s3.create_multipart_upload(bucket, key)
+
+    def write(self, data):
+        """Buffer the given data, uploading a part every time the buffer reaches ARCHIVE_UPLOAD_PART_SIZE."""
+        self._buffer += data
+        while len(self._buffer) >= ARCHIVE_UPLOAD_PART_SIZE:
+            self._submit_part(bytes(self._buffer[:ARCHIVE_UPLOAD_PART_SIZE]))
+            del self._buffer[:ARCHIVE_UPLOAD_PART_SIZE]
+        return len(data)
+
+    def _submit_part(self, data):
+        # Wait for a free slot, so that no more than ARCHIVE_UPLOAD_MAX_CONCURRENT_PARTS parts are kept in memory
+        self._slots.acquire()
+        if self._error:
+            self._slots.release()
+            raise self._error
+        self._parts.append(self._executor.submit(self._upload_part, len(self._parts) + 1, data))
+
+    def _upload_part(self, part_number, data):
+        try:
+            LOGGER.debug("Uploading part %s of %s (%s bytes)", part_number, self._key, len(data))
+            etag = AWSApi.instance().s3.upload_part(self._bucket, self._key, self._upload_id, part_number, data)
+            return {"ETag": etag, "PartNumber": part_number}
+        except Exception as e:
+            self._error = e
+            raise
+        finally:
+            self._slots.release()
+
+    def complete(self):
+        """Upload the remaining data and complete the multipart upload."""
+        # The last part can be smaller than the minimum part size allowed by S3
+        if self._buffer or not self._parts:
+            self._submit_part(bytes(self._buffer))
+            self._buffer.clear()
+        parts = [part.result() for part in self._parts]
+        self._executor.shutdown()
+        AWSApi.instance().s3.complete_multipart_upload(self._bucket, self._key, self._upload_id, parts)
+
+    def abort(self):
+        """Abort the multipart upload, removing the parts already uploaded."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        try:
+            AWSApi.instance().s3.abort_multipart_upload(self._bucket, self._key, self._upload_id)
+        except AWSClientError as e:
+            LOGGER.warning("Unable to abort multipart upload of %s: %s", self._key, e)
+
+
+def upload_logs_archive(directory: str, bucket: str, bucket_prefix: str = None):
+    """
+    Create a tar.gz archive of the given directory straight into an S3 multipart upload.
+
+    The archive is not written to disk and its size is not limited by the available memory.
+    """
+    base_name = os.path.basename(directory)
+    archive_filename = f"{base_name}.tar.gz"
     bucket_path = f"{bucket_prefix}/{archive_filename}" if bucket_prefix else archive_filename
-    AWSApi.instance().s3.put_object(bucket, archive_data, bucket_path)
+    LOGGER.debug("Uploading archive of logs to s3://%s/%s", bucket, bucket_path)
+    upload = _MultipartUploadStream(bucket, bucket_path)
+    try:
+        with tarfile.open(fileobj=upload, mode="w|gz") as tar:
+            tar.add(directory, arcname=base_name)
+        upload.complete()
+    except BaseException:
+        upload.abort()
+        raise
     return f"s3://{bucket}/{bucket_path}"
 
 
@@ -9,16 +9,14 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
-import time
 from abc import ABCMeta, abstractmethod
 from datetime import datetime, timezone
 from enum import Enum
 
 from boto3.dynamodb.conditions import Attr
-from pkg_resources import packaging
 
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, Waiter
 from pcluster.constants import PCLUSTER_DYNAMODB_PREFIX
 
 LOGGER = logging.getLogger(__name__)
@@ -74,22 +72,42 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
     def __init__(self, table_name):
         self._table_name = table_name
 
+    @property
+    def table_name(self):
+        """Return the name of the DynamoDB table storing the compute fleet status."""
+        return self._table_name
+
+    @property
+    @abstractmethod
+    def status_item_key(self):
+        """Return the key of the DynamoDB item storing the compute fleet status."""
+        pass
+
+    @abstractmethod
+    def parse_status_item(self, item):
+        """Return compute fleet status and last updated time stored in the given DynamoDB item."""
+        pass
+
+    def get_status_from_item(self, item, status_fallback=ComputeFleetStatus.UNKNOWN):
+        """Get compute fleet status from an already retrieved DynamoDB item, e.g. from a batch request."""
+        try:
+            if not item:
+                raise Exception("COMPUTE_FLEET item not found in db table")
+            status, _ = self.parse_status_item(item)
+            return status
+        except Exception as e:
+            LOGGER.warning("Failed when parsing fleet status from DynamoDB with error %s.", e)
+            return status_fallback
+
     def get_status(self, fallback=ComputeFleetStatus.UNKNOWN):
         """Get compute fleet status."""
         status, _ = self.get_status_with_last_updated_time(status_fallback=fallback)
         return status
 
-    def _wait_for_status_transition(self, wait_on_status, timeout=300, retry_every_seconds=15):
-        current_status = self.get_status()
-        start_time = time.time()
-        while current_status == wait_on_status and not self._timeout_expired(start_time, timeout):
-            current_status = self.get_status()
-            time.sleep(retry_every_seconds)
-
-        if current_status == wait_on_status:
-            raise TimeoutError("Timeout expired while waiting for status transition.")
-
-        return current_status
+    def _wait_for_status_transition(self, wait_on_status, timeout=300):
+        return Waiter("status transition", min_delay=2, max_delay=15, max_wait=timeout).wait(
+            self.get_status, until=lambda status: status != wait_on_status
+        )
 
     def update_status(self, request_status, in_progress_status, final_status, wait_transition=False):
         """
@@ -146,15 +164,13 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
     @staticmethod
     def get_manager(cluster_name, version):
         """Return compute fleet status manager based on version and plugin."""
+        from pkg_resources import packaging  # pylint: disable=import-outside-toplevel
+
         if packaging.version.parse(version) < packaging.version.parse("3.2.0a0"):
             return PlainTextComputeFleetStatusManager(cluster_name)
         else:
             return JsonComputeFleetStatusManager(cluster_name)
 
-    @staticmethod
-    def _timeout_expired(start_time, timeout):
-        return (time.time() - start_time) > timeout
-
 
 class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
     """
@@ -185,15 +201,10 @@ class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
     ):
         """Get compute fleet status and the last compute fleet status updated time."""
         try:
-            compute_fleet_item = AWSApi.instance().ddb_resource.get_item(self._table_name, {"Id": self.DB_KEY})
+            compute_fleet_item = AWSApi.instance().ddb_resource.get_item(self._table_name, self.status_item_key)
             if not compute_fleet_item or "Item" not in compute_fleet_item:
                 raise Exception("COMPUTE_FLEET data not found in db table")
-            return (
-                ComputeFleetStatus(
-                    compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_STATUS_ATTRIBUTE)
-                ),
-                compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_LAST_UPDATED_TIME_ATTRIBUTE),
-            )
+            return self.parse_status_item(compute_fleet_item["Item"])
         except Exception as e:
             LOGGER.warning(
                 "Failed when retrieving fleet status from DynamoDB with error %s. "
@@ -202,6 +213,18 @@ class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
             )
             return status_fallback, last_updated_time_fallback
 
+    @property
+    def status_item_key(self):
+        """Return the key of the DynamoDB item storing the compute fleet status."""
+        return {"Id": self.DB_KEY}
+
+    def parse_status_item(self, item):
+        """Return compute fleet status and last updated time stored in the given DynamoDB item."""
+        return (
+            ComputeFleetStatus(item.get(self.DB_DATA).get(self.COMPUTE_FLEET_STATUS_ATTRIBUTE)),
+            item.get(self.DB_DATA).get(self.COMPUTE_FLEET_LAST_UPDATED_TIME_ATTRIBUTE),
+        )
+
     def _put_status(self, current_status, next_status):
         """Set compute fleet status on DB."""
         try:
@@ -248,15 +271,10 @@ class PlainTextComputeFleetStatusManager(ComputeFleetStatusManager):
     ):
         """Get compute fleet status and the last compute fleet status updated time."""
         try:
-            compute_fleet_status = AWSApi.instance().ddb_resource.get_item(
-                self._table_name, {"Id": self.COMPUTE_FLEET_STATUS_KEY}
-            )
+            compute_fleet_status = AWSApi.instance().ddb_resource.get_item(self._table_name, self.status_item_key)
             if not compute_fleet_status or "Item" not in compute_fleet_status:
                 raise Exception("COMPUTE_FLEET status not found in db table")
-            return (
-                ComputeFleetStatus(compute_fleet_status["Item"][self.COMPUTE_FLEET_STATUS_ATTRIBUTE]),
-                compute_fleet_status["Item"].get(self.LAST_UPDATED_TIME_ATTRIBUTE),
-            )
+            return self.parse_status_item(compute_fleet_status["Item"])
         except Exception as e:
             LOGGER.warning(
                 "Failed when retrieving fleet status from DynamoDB with error %s. "
@@ -265,6 +283,15 @@ class PlainTextComputeFleetStatusManager(ComputeFleetStatusManager):
             )
             return status_fallback, last_updated_time_fallback
 
+    @property
+    def status_item_key(self):
+        """Return the key of the DynamoDB item storing the compute fleet status."""
+        return {"Id": self.COMPUTE_FLEET_STATUS_KEY}
+
+    def parse_status_item(self, item):
+        """Return compute fleet status and last updated time stored in the given DynamoDB item."""
+        return ComputeFleetStatus(item[self.COMPUTE_FLEET_STATUS_ATTRIBUTE]), item.get(self.LAST_UPDATED_TIME_ATTRIBUTE)
+
     def _put_status(self, current_status, next_status):
         """Set compute fleet status on DB."""
         try:
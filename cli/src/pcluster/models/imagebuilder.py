@@ -18,15 +18,16 @@ import os
 import os.path
 import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Set
+from typing import Dict, List, Set
 
-import pkg_resources
 from marshmallow.exceptions import ValidationError
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import ImageInfo
 from pcluster.aws.common import (
+    AdaptiveRateLimiter,
     AWSClientError,
     BadRequestError,
     ImageNotFoundError,
@@ -61,7 +62,7 @@ from pcluster.models.common import (
     create_logs_archive,
     export_stack_events,
     parse_config,
-    upload_archive,
+    upload_logs_archive,
 )
 from pcluster.models.imagebuilder_resources import (
     BadRequestStackError,
@@ -71,11 +72,12 @@ from pcluster.models.imagebuilder_resources import (
     StackError,
 )
 from pcluster.models.s3_bucket import S3Bucket, S3BucketFactory, S3FileFormat, create_s3_presigned_url
-from pcluster.schemas.imagebuilder_schema import ImageBuilderSchema
-from pcluster.templates.cdk_builder import CDKTemplateBuilder
 from pcluster.utils import datetime_to_epoch, generate_random_name_with_prefix, get_installed_version, get_partition
 from pcluster.validators.common import FailureLevel, ValidationResult
 
+# The image configuration schema and the CDK templates are imported only by the operations using them
+# pylint: disable=import-outside-toplevel
+
 ImageBuilderStatusMapping = {
     "BUILD_IN_PROGRESS": [
         "CREATE_IN_PROGRESS",
@@ -103,6 +105,13 @@ ImageBuilderStatusMapping = {
     "DELETE_COMPLETE": ["DELETE_COMPLETE"],
 }
 
+# The bulk image deletion checks and deletes the images concurrently. The snapshots of the images are deleted in
+# parallel, under a rate limit (requests per second) that can be overridden with the
+# PCLUSTER_DELETE_SNAPSHOTS_RATE_LIMIT environment variable
+DELETE_IMAGES_MAX_WORKERS = 8
+DELETE_SNAPSHOTS_MAX_WORKERS = 4
+DELETE_SNAPSHOTS_DEFAULT_RATE_LIMIT = 5
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -211,6 +220,24 @@ def _imagebuilder_error_mapper(error, message=None):
         return ImageBuilderActionError(message)
 
 
+def _get_snapshots_rate_limiter():
+    return AdaptiveRateLimiter(
+        float(os.environ.get("PCLUSTER_DELETE_SNAPSHOTS_RATE_LIMIT") or DELETE_SNAPSHOTS_DEFAULT_RATE_LIMIT)
+    )
+
+
+def _delete_snapshots(snapshot_ids, rate_limiter: AdaptiveRateLimiter = None):
+    """Delete the given snapshots in parallel, raising the first error once all the deletions are completed."""
+    rate_limiter = rate_limiter or _get_snapshots_rate_limiter()
+    with ThreadPoolExecutor(max_workers=DELETE_SNAPSHOTS_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(rate_limiter.call, AWSApi.instance().ec2.delete_snapshot, snapshot_id)
+            for snapshot_id in snapshot_ids
+        ]
+    for future in futures:
+        future.result()
+
+
 class ImageBuilder:
     """Represent a building image, composed by an ImageBuilder config and an ImageBuilderStack."""
 
@@ -321,6 +348,8 @@ class ImageBuilder:
     def config(self):
         """Return ImageBuilder Config object, only called by build image process."""
         if not self.__config and self.__source_config_text:
+            from pcluster.schemas.imagebuilder_schema import ImageBuilderSchema
+
             self.__config = ImageBuilderSchema().load(parse_config(self.__source_config_text))
         return self.__config
 
@@ -462,6 +491,8 @@ class ImageBuilder:
             LOGGER.info("Building ParallelCluster image: %s", self.image_id)
 
             # Generate cdk cfn template
+            from pcluster.templates.cdk_builder import CDKTemplateBuilder
+
             self.template_body = CDKTemplateBuilder().build_imagebuilder_template(
                 image_config=self.config, image_id=self.image_id, bucket=self.bucket
             )
@@ -532,6 +563,8 @@ class ImageBuilder:
                 # upload cfn template
                 self.bucket.upload_cfn_template(self.template_body, self._s3_artifacts_dict.get("template_name"))
 
+            import pkg_resources
+
             resources = pkg_resources.resource_filename(__name__, "../resources/custom_resources")
             self.bucket.upload_resources(
                 resource_dir=resources, custom_artifacts_name=self._s3_artifacts_dict.get("custom_artifacts_name")
@@ -542,8 +575,12 @@ class ImageBuilder:
                 f"Unable to upload imagebuilder cfn template to the S3 bucket {self.bucket.name} due to exception: {e}",
             )
 
-    def delete(self, force=False):  # noqa: C901
-        """Delete CFN Stack and associate resources and deregister the image."""
+    def delete(self, force=False, snapshots_rate_limiter: AdaptiveRateLimiter = None):  # noqa: C901
+        """
+        Delete CFN Stack and associate resources and deregister the image.
+
+        :param snapshots_rate_limiter: rate limiter of the snapshot deletions, shared when deleting multiple images
+        """
         if force or (not self._check_instance_using_image() and not self._check_image_is_shared()):
             try:
                 if AWSApi.instance().cfn.stack_exists(self.image_id):
@@ -559,15 +596,13 @@ class ImageBuilder:
                     AWSApi.instance().ec2.deregister_image(self.image.id)
 
                     # Delete snapshot
-                    for snapshot_id in self.image.snapshot_ids:
-                        AWSApi.instance().ec2.delete_snapshot(snapshot_id)
+                    _delete_snapshots(self.image.snapshot_ids, snapshots_rate_limiter)
                 elif AWSApi.instance().ec2.failed_image_exists(image_id=self.image_id):
                     # Deregister image
                     AWSApi.instance().ec2.deregister_image(self.failed_image.id)
 
                     # Delete snapshot
-                    for snapshot_id in self.failed_image.snapshot_ids:
-                        AWSApi.instance().ec2.delete_snapshot(snapshot_id)
+                    _delete_snapshots(self.failed_image.snapshot_ids, snapshots_rate_limiter)
 
                 # Delete s3 image directory
                 try:
@@ -724,11 +759,11 @@ class ImageBuilder:
                     # Get stack events and write them into a file
                     stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
                     export_stack_events(self.stack.name, stack_events_file)
-                archive_path = create_logs_archive(root_archive_dir, output_file)
                 if output_file:
+                    create_logs_archive(root_archive_dir, output_file)
                     return output_file
                 else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
+                    s3_path = upload_logs_archive(root_archive_dir, bucket, bucket_prefix)
                     return create_s3_presigned_url(s3_path)
         except Exception as e:
             raise ImageBuilderActionError(f"Unexpected error when exporting image's logs: {e}")
@@ -836,3 +871,113 @@ class ImageBuilder:
     def _stack_events_stream_name(self):
         """Return the name of the stack events log stream."""
         return STACK_EVENTS_LOG_STREAM_NAME_FORMAT.format(self.image_id)
+
+
+class ImagesDeletion:
+    """
+    Delete multiple images, with the safety checks batched across the images.
+
+    The available images are retrieved with batched DescribeImages requests and the instances using them with a single
+    DescribeInstances sweep, while the launch permissions and the stacks of the images are checked concurrently.
+    The images are then deleted concurrently, with the snapshot deletions of all the images sharing the same rate limit.
+    An image that cannot be deleted does not stop the deletion of the other ones, it is reported in the failures.
+    """
+
+    def __init__(self, image_ids: List[str], force: bool = False):
+        self.image_ids = list(dict.fromkeys(image_ids))
+        self.force = force
+        # Available images and stacks of the images to delete, by image id
+        self.images: Dict[str, ImageInfo] = {}
+        self.stacks: Dict[str, ImageBuilderStack] = {}
+        # Reasons why the images cannot be deleted, by image id
+        self.failures: Dict[str, str] = {}
+
+    def delete(self, dryrun: bool = False) -> List[str]:
+        """
+        Delete the images that pass the safety checks.
+
+        :param dryrun: only check the images, reporting the ones that would be deleted
+        :return: the ids of the deleted images, or of the images that would be deleted when dryrun is set
+        """
+        self._load_images()
+        self._check_images()
+        image_ids = self._get_deletable_image_ids()
+        if dryrun:
+            return image_ids
+
+        rate_limiter = _get_snapshots_rate_limiter()
+        self._run_concurrently(
+            lambda image_id: self._get_imagebuilder(image_id).delete(force=True, snapshots_rate_limiter=rate_limiter),
+            image_ids,
+        )
+        return self._get_deletable_image_ids()
+
+    def _get_imagebuilder(self, image_id):
+        return ImageBuilder(image=self.images.get(image_id), image_id=image_id, stack=self.stacks.get(image_id))
+
+    def _get_deletable_image_ids(self):
+        return [image_id for image_id in self.image_ids if image_id not in self.failures]
+
+    def _load_images(self):
+        """Retrieve the available images with batched requests, and the stacks of the images not available."""
+        try:
+            images = AWSApi.instance().ec2.describe_images_by_id_tags(self.image_ids)
+        except AWSClientError as e:
+            raise _imagebuilder_error_mapper(e, f"Unable to retrieve images, due to {e}.")
+        self.images = {image.pcluster_image_id: image for image in images}
+
+        def _load_stack(image_id):
+            try:
+                self.stacks[image_id] = self._get_imagebuilder(image_id).stack
+            except NonExistingStackError:
+                if image_id not in self.images:
+                    self.failures[image_id] = f"No image or stack associated with ParallelCluster image id: {image_id}."
+
+        self._run_concurrently(_load_stack, self.image_ids)
+
+    def _check_images(self):
+        """Check that the images are not being built and, unless forced, that they are neither shared nor in use."""
+
+        def _check_image(image_id):
+            stack = self.stacks.get(image_id)
+            if stack and stack.imagebuilder_image_is_building:
+                raise BadRequestImageBuilderActionError(
+                    "Image cannot be deleted because EC2 ImageBuilder Image has a running workflow."
+                )
+            image = self.images.get(image_id)
+            if image and not self.force:
+                shared_account_ids = AWSApi.instance().ec2.get_image_shared_account_ids(image.id)
+                if shared_account_ids:
+                    raise BadRequestImageBuilderActionError(
+                        f"Image {image_id} is shared with accounts or group {shared_account_ids}."
+                    )
+
+        self._run_concurrently(_check_image, self._get_deletable_image_ids())
+        if self.force:
+            return
+
+        amis = {
+            self.images[image_id].id: image_id
+            for image_id in self._get_deletable_image_ids()
+            if image_id in self.images
+        }
+        try:
+            instance_ids = AWSApi.instance().ec2.get_instance_ids_by_ami_ids(list(amis))
+        except AWSClientError as e:
+            raise _imagebuilder_error_mapper(e, f"Unable to retrieve the instances using the images, due to {e}.")
+        for ami_id, image_id in amis.items():
+            if instance_ids.get(ami_id):
+                self.failures[image_id] = f"Image {image_id} is used by instances {instance_ids[ami_id]}."
+
+    def _run_concurrently(self, func, image_ids):
+        """Call func on each of the given images concurrently, reporting the errors as failures of the images."""
+
+        def _call(image_id):
+            try:
+                func(image_id)
+            except (AWSClientError, ImageError, StackError, ImageBuilderActionError) as e:
+                LOGGER.error("Image %s cannot be deleted: %s", image_id, e)
+                self.failures[image_id] = str(e)
+
+        with ThreadPoolExecutor(max_workers=DELETE_IMAGES_MAX_WORKERS) as executor:
+            list(executor.map(_call, image_ids))
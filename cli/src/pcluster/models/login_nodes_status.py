@@ -9,6 +9,7 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 from pcluster.aws.aws_api import AWSApi
@@ -16,6 +17,8 @@ from pcluster.utils import get_chunks
 
 LOGGER = logging.getLogger(__name__)
 
+LOGIN_NODES_STATUS_MAX_WORKERS = 5
+
 
 class LoginNodesPoolState(Enum):
     """Represents the internal status of the login nodes pools."""
@@ -195,8 +198,12 @@ class LoginNodesStatus:
 
     def retrieve_data(self, login_node_pool_names):
         """Initialize the class with the information related to the login node fleet."""
-        for pool_name in login_node_pool_names:
-            self._pool_status_dict[pool_name] = PoolStatus(self._stack_name, pool_name)
+        pool_names = list(login_node_pool_names)
+        if pool_names:
+            # The status of each pool is built from several ELB calls, retrieve the pools concurrently
+            with ThreadPoolExecutor(max_workers=min(len(pool_names), LOGIN_NODES_STATUS_MAX_WORKERS)) as executor:
+                pool_statuses = executor.map(lambda pool_name: PoolStatus(self._stack_name, pool_name), pool_names)
+            self._pool_status_dict.update(zip(pool_names, pool_statuses))
         self._total_healthy_nodes = sum(
             (
                 pool_status.get_healthy_nodes()
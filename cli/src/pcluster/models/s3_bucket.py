@@ -17,6 +17,7 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 import yaml
@@ -28,6 +29,12 @@ from pcluster.utils import format_arn, get_partition, get_service_principal, get
 
 LOGGER = logging.getLogger(__name__)
 
+ARTIFACTS_UPLOAD_MAX_WORKERS = 8
+# User-defined metadata storing the SHA-256 of the content of the uploaded artifacts. The ETag cannot be used to
+# identify the content, because it is not the MD5 of the content for multipart uploads and for encrypted objects.
+CONTENT_HASH_METADATA_KEY = "content-sha256"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class S3FileFormat(Enum):
     """Define S3 file format."""
@@ -320,32 +327,71 @@ class S3Bucket:
         )
 
     def upload_cfn_asset(self, asset_file_content, asset_name: str, format=S3FileFormat.YAML):
-        """Upload cloudformation assets to S3 bucket."""
+        """Upload cloudformation assets to S3 bucket, skipping the upload if the asset is unchanged."""
         return self.upload_file(
-            file_type=S3FileType.ASSETS, content=asset_file_content, file_name=asset_name, format=format
+            file_type=S3FileType.ASSETS,
+            content=asset_file_content,
+            file_name=asset_name,
+            format=format,
+            skip_if_unchanged=True,
+        )
+
+    def upload_cfn_assets(self, assets, format=S3FileFormat.YAML):
+        """
+        Upload cloudformation assets to S3 bucket concurrently, skipping the unchanged ones.
+
+        :param assets: dict of asset content by asset name.
+        """
+        _run_uploads_concurrently(
+            self.upload_cfn_asset,
+            [
+                {"asset_file_content": asset_file_content, "asset_name": asset_name, "format": format}
+                for asset_name, asset_file_content in assets.items()
+            ],
         )
 
     def upload_resources(self, resource_dir, custom_artifacts_name):
         """
         Upload custom resources to S3 bucket.
 
+        The resources are identified by the hash of their content, stored in the object metadata: the resources
+        unchanged since the last upload are skipped and the other ones are uploaded concurrently.
+
         :param resource_dir: resource directory containing the resources to upload.
         :param custom_artifacts_name: custom_artifacts_name for zipped dir
         """
-        for res in os.listdir(resource_dir):
+        uploads = []
+        for res in sorted(os.listdir(resource_dir)):
             path = os.path.join(resource_dir, res)
             if os.path.isdir(path):
-                AWSApi.instance().s3.upload_fileobj(
-                    file_obj=zip_dir(os.path.join(resource_dir, res)),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name),
+                uploads.append(
+                    {"key": self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name), "dir_path": path}
                 )
             elif os.path.isfile(path):
-                AWSApi.instance().s3.upload_file(
-                    file_path=os.path.join(resource_dir, res),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, res),
-                )
+                uploads.append({"key": self.get_object_key(S3FileType.CUSTOM_RESOURCES, res), "file_path": path})
+        _run_uploads_concurrently(self._upload_resource, uploads)
+
+    def _upload_resource(self, key, dir_path=None, file_path=None):
+        """Upload the given file, or the zip archive of the given dir, if its content differs from the uploaded one."""
+        with zip_dir(dir_path) if dir_path else open(file_path, "rb") as file_obj:
+            content_hash = _get_content_hash(file_obj)
+            if self._is_object_unchanged(key, content_hash):
+                LOGGER.info("Skipping upload of unchanged resource %s", key)
+                return
+            file_obj.seek(0)
+            AWSApi.instance().s3.upload_fileobj(
+                file_obj=file_obj, bucket_name=self.name, key=key, metadata={CONTENT_HASH_METADATA_KEY: content_hash}
+            )
+
+    def _is_object_unchanged(self, key, content_hash):
+        """Return True if the object at the given key has been uploaded with the given content hash."""
+        try:
+            metadata = AWSApi.instance().s3.head_object(bucket_name=self.name, object_name=key).get("Metadata", {})
+        except AWSClientError as e:
+            if e.error_code not in ("404", "NoSuchKey"):
+                LOGGER.debug("Unable to retrieve the metadata of %s, uploading it: %s", key, e)
+            return False
+        return metadata.get(CONTENT_HASH_METADATA_KEY) == content_hash
 
     def get_config(self, config_name, version_id=None, format=S3FileFormat.TEXT):
         """Get config file from S3 bucket."""
@@ -381,12 +427,24 @@ class S3Bucket:
 
     # --------------------------------------- S3 private functions --------------------------------------- #
 
-    def upload_file(self, content, file_name, file_type, format=S3FileFormat.YAML):
-        """Upload file to S3 bucket."""
+    def upload_file(self, content, file_name, file_type, format=S3FileFormat.YAML, skip_if_unchanged=False):
+        """
+        Upload file to S3 bucket.
+
+        If skip_if_unchanged is True, the hash of the content is stored in the object metadata and the upload is
+        skipped when the object has already been uploaded with the same content.
+        """
+        body = format_content(content, format)
+        key = self.get_object_key(file_type, file_name)
+        if not skip_if_unchanged:
+            return AWSApi.instance().s3.put_object(bucket_name=self.name, body=body, key=key)
+
+        content_hash = hashlib.sha256(body if isinstance(body, bytes) else body.encode("utf-8")).hexdigest()
+        if self._is_object_unchanged(key, content_hash):
+            LOGGER.info("Skipping upload of unchanged file %s", key)
+            return None
         return AWSApi.instance().s3.put_object(
-            bucket_name=self.name,
-            body=format_content(content, format),
-            key=self.get_object_key(file_type, file_name),
+            bucket_name=self.name, body=body, key=key, metadata={CONTENT_HASH_METADATA_KEY: content_hash}
         )
 
     def _get_file(self, file_name, file_type, version_id=None, format=S3FileFormat.YAML):
@@ -422,6 +480,25 @@ class S3Bucket:
         )
 
 
+def _get_content_hash(file_obj):
+    """Return the SHA-256 of the content of the given binary file object, reading it in chunks."""
+    content_hash = hashlib.sha256()
+    for chunk in iter(lambda: file_obj.read(_HASH_CHUNK_SIZE), b""):
+        content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+
+def _run_uploads_concurrently(upload_function, uploads):
+    """Call the upload function with each of the given keyword arguments concurrently, raising the first failure."""
+    if not uploads:
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(len(uploads), ARTIFACTS_UPLOAD_MAX_WORKERS), thread_name_prefix="artifacts-upload"
+    ) as executor:
+        for future in [executor.submit(upload_function, **upload) for upload in uploads]:
+            future.result()
+
+
 class S3BucketFactory:
     """S3 bucket factory to return a bucket object with existence check and creation."""
 
@@ -135,6 +135,7 @@ class CDKArtifactsManager:
         """
         cdk_assets = self.cluster_cdk_assembly.get_assets()
         assets_metadata = []
+        assets_content = {}
 
         for cdk_asset in cdk_assets:
             asset_file_path = os.path.join(self.cluster_cdk_assembly.get_cloud_assembly_directory(), cdk_asset.path)
@@ -153,10 +154,10 @@ class CDKArtifactsManager:
                     "content": asset_file_content,
                 }
             )
-            LOGGER.info(f"Uploading asset {asset_id} to S3")
+            assets_content[asset_id] = asset_file_content
 
-            bucket.upload_cfn_asset(
-                asset_file_content=asset_file_content, asset_name=asset_id, format=S3FileFormat.MINIFIED_JSON
-            )
+        # The asset id is the hash of the asset, the assets already uploaded for the cluster are skipped
+        LOGGER.info(f"Uploading assets {', '.join(assets_content)} to S3")
+        bucket.upload_cfn_assets(assets_content, format=S3FileFormat.MINIFIED_JSON)
 
         return assets_metadata
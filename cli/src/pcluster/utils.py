@@ -11,19 +11,21 @@
 import asyncio
 import datetime
 import functools
+import importlib.metadata
 import itertools
 import json
 import logging
 import os
 import random
 import re
+import shutil
 import string
 import sys
+import tempfile
 import time
 import urllib
 import zipfile
 from concurrent.futures import ThreadPoolExecutor
-from io import BytesIO
 from shlex import quote
 from typing import Callable, NoReturn
 from urllib.error import URLError
@@ -31,7 +33,6 @@ from urllib.parse import urlparse
 
 import boto3
 import dateutil.parser
-import pkg_resources
 import yaml
 from yaml import SafeLoader
 from yaml.constructor import ConstructorError
@@ -62,6 +63,12 @@ DOMAIN_MAP = {
     "aws-iso-b": "sc2s.sgov.gov",
 }
 
+# Archives created by zip_dir are kept in memory up to this size, then they are moved to a temporary file
+ZIP_DIR_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+_ZIP_COPY_CHUNK_SIZE = 1024 * 1024
+# Timestamp of the archive entries, the minimum supported by the zip format
+_ZIP_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
 DEFAULT_DOCS_URL = "docs.aws.amazon.com"
 DOCS_URL_MAP = {
     "aws-cn": "docs.amazonaws.cn",
@@ -129,33 +136,46 @@ def _add_file_to_zip(zip_file, path, arcname):
     """
     Add the file at path under the name arcname to the archive represented by zip_file.
 
+    The file is copied into the archive in chunks, with a fixed timestamp and permissions so that the entry only
+    depends on the file content.
+
     :param zip_file: zipfile.ZipFile object
     :param path: string; path to file being added
     :param arcname: string; filename to put bytes from path under in created archive
     """
-    with open(path, "rb") as input_file:
-        zinfo = zipfile.ZipInfo(filename=arcname)
-        zinfo.external_attr = 0o644 << 16
-        zip_file.writestr(zinfo, input_file.read())
+    zinfo = zipfile.ZipInfo(filename=arcname, date_time=_ZIP_ENTRY_DATE_TIME)
+    zinfo.external_attr = 0o644 << 16
+    zinfo.compress_type = zip_file.compression
+    # The size is needed in advance to write the entry with the ZIP64 extension if required
+    zinfo.file_size = os.path.getsize(path)
+    with open(path, "rb") as input_file, zip_file.open(zinfo, "w") as entry_file:
+        shutil.copyfileobj(input_file, entry_file, _ZIP_COPY_CHUNK_SIZE)
 
 
 def zip_dir(path):
     """
     Create a zip archive containing all files and dirs rooted in path.
 
-    The archive is created in memory and a file handler is returned by the function.
+    The archive is created in a spooled temporary file, kept in memory up to ZIP_DIR_SPOOL_MAX_SIZE and moved to disk
+    beyond that size, and a file handler is returned by the function. The caller is responsible for closing it.
+    Files are added in a stable order with a fixed timestamp, so that the archive is the same across runs.
     :param path: directory containing the resources to archive.
     :return: file handler pointing to the compressed archive.
     """
-    file_out = BytesIO()
-    with zipfile.ZipFile(file_out, "w", zipfile.ZIP_DEFLATED) as ziph:
-        for root, _, files in os.walk(path):
-            for file in files:
-                _add_file_to_zip(
-                    ziph,
-                    os.path.join(root, file),
-                    os.path.relpath(os.path.join(root, file), start=path),
-                )
+    file_out = tempfile.SpooledTemporaryFile(max_size=ZIP_DIR_SPOOL_MAX_SIZE)  # pylint: disable=consider-using-with
+    try:
+        with zipfile.ZipFile(file_out, "w", zipfile.ZIP_DEFLATED) as ziph:
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for file in sorted(files):
+                    _add_file_to_zip(
+                        ziph,
+                        os.path.join(root, file),
+                        os.path.relpath(os.path.join(root, file), start=path),
+                    )
+    except Exception:
+        file_out.close()
+        raise
     file_out.seek(0)
     return file_out
 
@@ -305,8 +325,13 @@ def get_templates_bucket_path():
 
 def get_installed_version(base_version_only: bool = False):
     """Get the version of the installed aws-parallelcluster package."""
-    pkg_distribution = pkg_resources.get_distribution("aws-parallelcluster")
-    return pkg_distribution.version if not base_version_only else pkg_distribution.parsed_version.base_version
+    version = importlib.metadata.version("aws-parallelcluster")
+    if base_version_only:
+        # pkg_resources is slow to import, load it only when the version must be parsed
+        from pkg_resources import packaging  # pylint: disable=import-outside-toplevel
+
+        version = packaging.version.parse(version).base_version
+    return version
 
 
 def warn(message):
@@ -576,6 +601,8 @@ def retrieve_supported_regions():
                 retrieve_supported_regions.cache = f.read().decode("utf-8").split("\n")
         except URLError:
             # When the file is not found on the URL, use local file. This is useful when developing new versions.
+            import pkg_resources  # pylint: disable=import-outside-toplevel
+
             with open(pkg_resources.resource_filename(__name__, "/resources/supported-regions"), encoding="utf-8") as f:
                 retrieve_supported_regions.cache = f.read().split("\n")
     return retrieve_supported_regions.cache
@@ -14,14 +14,21 @@
 # pylint: disable=protected-access
 
 import asyncio
+import contextlib
 import functools
+import threading
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import List
 
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSCallsCounter, AWSClientError
 
 ASYNC_TIMED_VALIDATORS_DEFAULT_TIMEOUT_SEC = 10
+# Limits applied when executing all the validators of a configuration concurrently
+VALIDATORS_MAX_WORKERS = 16
+VALIDATOR_TIMEOUT_SEC = 180
+VALIDATION_DEADLINE_SEC = 900
 
 
 class FailureLevel(Enum):
@@ -47,6 +54,90 @@ class ValidationResult:
         return f"ValidationResult(level={self.level}, message={self.message})"
 
 
+class ValidatorTiming:
+    """Represent the time spent and the AWS calls made by the execution of a validator."""
+
+    def __init__(self, validator_type: str, duration: float, aws_calls: int, cache_hits: int, failures: int):
+        self.validator_type = validator_type
+        self.duration = duration
+        self.aws_calls = aws_calls
+        self.cache_hits = cache_hits
+        self.failures = failures
+
+    def to_dict(self):
+        """Return the timing as a dict, as reported in the CLI output."""
+        return {
+            "validatorType": self.validator_type,
+            "durationSeconds": round(self.duration, 3),
+            "awsCalls": self.aws_calls,
+            "cacheHits": self.cache_hits,
+            "failures": self.failures,
+        }
+
+
+class ValidatorsProfiler:
+    """
+    Record the timing of every validator executed while the profiler is active.
+
+    Validators are executed concurrently, so the durations of the single validators can add up to more than the
+    overall validation time.
+    """
+
+    _active = None
+
+    def __init__(self):
+        self._timings: List[ValidatorTiming] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def active():
+        """Return the active profiler, if any."""
+        return ValidatorsProfiler._active
+
+    @staticmethod
+    @contextlib.contextmanager
+    def profile():
+        """Return a context manager activating a new profiler for the validators executed within it."""
+        profiler = ValidatorsProfiler()
+        previous, ValidatorsProfiler._active = ValidatorsProfiler._active, profiler
+        try:
+            yield profiler
+        finally:
+            ValidatorsProfiler._active = previous
+
+    def execute(self, validator, validation_executor, validator_args):
+        """Execute the validator through the given executor, recording its timing."""
+        if isinstance(validator, AsyncValidator):
+            validator_type, coroutine = validation_executor(validator_args, validator)
+            return validator_type, self._profile_async(validator_type, coroutine)
+
+        with AWSCallsCounter.count() as counter:
+            start = time.monotonic()
+            failures = validation_executor(validator_args, validator)
+            self._record(validator.type, start, counter, failures)
+        return failures
+
+    async def _profile_async(self, validator_type, coroutine):
+        with AWSCallsCounter.count() as counter:
+            start = time.monotonic()
+            failures = await coroutine
+            self._record(validator_type, start, counter, failures)
+        return failures
+
+    def _record(self, validator_type, start, counter, failures):
+        timing = ValidatorTiming(
+            validator_type, time.monotonic() - start, counter.aws_calls, counter.cache_hits, len(failures or [])
+        )
+        with self._lock:
+            self._timings.append(timing)
+
+    def report(self, limit: int = None):
+        """Return the recorded timings as a list of dicts, slowest validators first."""
+        with self._lock:
+            timings = sorted(self._timings, key=lambda timing: timing.duration, reverse=True)
+        return [timing.to_dict() for timing in timings[:limit]]
+
+
 class Validator(ABC):
     """Abstract validator. The children must implement the _validate method."""
 
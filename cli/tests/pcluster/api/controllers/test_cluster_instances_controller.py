@@ -181,6 +181,73 @@ class TestDescribeClusterInstances:
             assert_that(response.get_json()).is_equal_to(expected_response)
 
 
+class TestGetClusterInstancesSummary:
+    url = "/v3/clusters/{cluster_name}/instances/summary"
+    method = "GET"
+
+    def _send_test_request(self, client, cluster_name="clustername", region="us-east-1", node_type=None):
+        query_string = []
+        if region:
+            query_string.append(("region", region))
+        if node_type:
+            query_string.append(("nodeType", node_type))
+
+        headers = {
+            "Accept": "application/json",
+        }
+        return client.open(
+            self.url.format(cluster_name=cluster_name), method=self.method, headers=headers, query_string=query_string
+        )
+
+    def test_successful_request(self, mocker, client):
+        instances = [cfn_describe_instances_mock_response()]
+        for instance_type, compute_resource_name in [("c5.xlarge", "cr2"), ("t3.micro", "cr1"), ("t3.micro", "cr1")]:
+            instance = cfn_describe_instances_mock_response(
+                instance_type=instance_type, queue_name="queue1", node_type="Compute"
+            )
+            instance["Tags"].append({"Key": "parallelcluster:compute-resource-name", "Value": compute_resource_name})
+            instances.append(instance)
+        iter_instances_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.iter_instances", return_value=iter(instances))
+
+        response = self._send_test_request(client, node_type=NodeType.COMPUTENODE)
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()).is_equal_to(
+                {
+                    "totalInstances": 4,
+                    "queues": [{"name": "queue1", "count": 3}],
+                    "computeResources": [
+                        {"queueName": "queue1", "computeResourceName": "cr1", "count": 2},
+                        {"queueName": "queue1", "computeResourceName": "cr2", "count": 1},
+                    ],
+                    "instanceTypes": [{"name": "c5.xlarge", "count": 1}, {"name": "t3.micro", "count": 3}],
+                    "states": [{"name": "running", "count": 4}],
+                }
+            )
+            assert_that(iter_instances_mock.call_args[0][0]).contains(
+                {"Name": "tag:parallelcluster:node-type", "Values": ["Compute"]}
+            )
+
+    @pytest.mark.parametrize(
+        "params, expected_response",
+        [
+            (
+                {"node_type": "wrong_node_type"},
+                {"message": "Bad Request: 'wrong_node_type' is not one of ['HeadNode', 'ComputeNode', 'LoginNode']"},
+            ),
+            (
+                {"region": None},
+                {"message": "Bad Request: region needs to be set"},
+            ),
+        ],
+    )
+    def test_malformed_request(self, client, params, expected_response):
+        response = self._send_test_request(client, **params)
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()).is_equal_to(expected_response)
+
+
 def cfn_describe_stack_mock_response(scheduler="slurm", version="3.0.0", **kwargs):
     stack_data = {
         "StackName": "clustername",
@@ -218,12 +285,15 @@ class TestDeleteClusterInstances:
                 side_effect=StackNotFoundError(function_name="describestack", stack_name="stack_name"),
             )
         instance_ids = ["fakeinstanceid1", "fakeinstanceid2"]
-        mocker.patch("pcluster.aws.ec2.Ec2Client.list_instance_ids", return_value=instance_ids)
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.iter_instances",
+            return_value=iter([{"InstanceId": instance_id} for instance_id in instance_ids]),
+        )
         terminate_instance_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.terminate_instances")
         response = self._send_test_request(client, force=force)
         with soft_assertions():
             assert_that(response.status_code).is_equal_to(202)
-            terminate_instance_mock.assert_called_with(tuple(instance_ids))
+            terminate_instance_mock.assert_called_with(instance_ids)
 
     @pytest.mark.parametrize(
         "stack_param, force, expected_response",
@@ -6,6 +6,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
+import time
 from datetime import datetime
 
 import pytest
@@ -866,6 +867,39 @@ class TestDescribeCluster:
             assert_that(response.status_code).is_equal_to(200)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    def test_slow_lookup_degrades_single_field(self, mocker, client):
+        """Verify that a lookup exceeding the timeout degrades only its field of the response."""
+        mocker.patch("pcluster.api.controllers.cluster_operations_controller.DESCRIBE_CLUSTER_LOOKUP_TIMEOUT_SEC", 0.5)
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            return_value=cfn_describe_stack_mock_response(
+                {"Parameters": [{"ParameterKey": "Scheduler", "ParameterValue": "slurm"}]}
+            ),
+        )
+        mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances", return_value=([], ""))
+
+        def _slow_fleet_status():
+            time.sleep(2)
+            return ComputeFleetStatus.RUNNING
+
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status", new_callable=mocker.PropertyMock
+        ).side_effect = _slow_fleet_status
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).return_value = "presigned-url"
+
+        start = time.monotonic()
+        response = self._send_test_request(client)
+
+        with soft_assertions():
+            assert_that(time.monotonic() - start).is_less_than(2)
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()).contains_entry(
+                {"computeFleetStatus": "UNKNOWN"}, {"clusterConfiguration": {"url": "presigned-url"}}
+            )
+            assert_that(response.get_json()).does_not_contain_key("headNode")
+
     @pytest.mark.parametrize(
         "region, cluster_name, expected_response",
         [
@@ -1573,6 +1607,131 @@ class TestDescribeCluster:
             assert_that(response.get_json()).is_equal_to(expected_response)
 
 
+class TestDescribeClusters:
+    url = "/v3/clusterdescriptions"
+    method = "GET"
+
+    def _send_test_request(self, client, region="us-east-1", cluster_names=None, cluster_status_list=None):
+        query_string = [("region", region)]
+        if cluster_names:
+            query_string.extend([("clusterNames", name) for name in cluster_names])
+        if cluster_status_list:
+            query_string.extend([("clusterStatus", status) for status in cluster_status_list])
+        headers = {"Accept": "application/json"}
+        return client.open(self.url, method=self.method, headers=headers, query_string=query_string)
+
+    @staticmethod
+    def _stack(name, status="CREATE_COMPLETE", version=None, scheduler="slurm"):
+        return {
+            "StackName": name,
+            "StackId": f"arn:{name}",
+            "CreationTime": datetime(2021, 4, 30),
+            "StackStatus": status,
+            "Tags": [{"Key": "parallelcluster:version", "Value": version or get_installed_version()}],
+            "Parameters": [{"ParameterKey": "Scheduler", "ParameterValue": scheduler}],
+            "Outputs": [{"OutputKey": "BatchComputeEnvironmentArn", "OutputValue": f"arn:ce-{name}"}],
+        }
+
+    def test_successful_request(self, mocker, client):
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.list_pcluster_stacks",
+            side_effect=[
+                ([self._stack("slurm1"), self._stack("slurm2", status="CREATE_IN_PROGRESS")], "token"),
+                ([self._stack("batch1", scheduler="awsbatch"), self._stack("old", version="2.11.0")], None),
+            ],
+        )
+        batch_get_items_mock = mocker.patch(
+            "pcluster.aws.dynamo.DynamoResource.batch_get_items",
+            return_value={"parallelcluster-slurm1": [{"Id": "COMPUTE_FLEET", "Data": {"status": "RUNNING"}}]},
+        )
+        mocker.patch(
+            "pcluster.aws.batch.BatchClient.get_compute_environments_states",
+            return_value={"arn:ce-batch1": "ENABLED"},
+        )
+        describe_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            return_value=(
+                [
+                    {
+                        "InstanceId": "i-123",
+                        "InstanceType": "t2.micro",
+                        "LaunchTime": datetime(2021, 5, 1),
+                        "PrivateIpAddress": "10.0.0.1",
+                        "State": {"Name": "running"},
+                        "Tags": [{"Key": "parallelcluster:cluster-name", "Value": "slurm1"}],
+                    }
+                ],
+                None,
+            ),
+        )
+
+        response = self._send_test_request(client, cluster_names=["slurm1", "slurm2", "batch1", "old", "missing"])
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            body = response.get_json()
+            assert_that([cluster["clusterName"] for cluster in body["clusters"]]).is_equal_to(
+                ["slurm1", "slurm2", "batch1"]
+            )
+            assert_that([cluster["computeFleetStatus"] for cluster in body["clusters"]]).is_equal_to(
+                ["RUNNING", "UNKNOWN", "ENABLED"]
+            )
+            assert_that(body["clusters"][0]["headNode"]).is_equal_to(
+                {
+                    "instanceId": "i-123",
+                    "instanceType": "t2.micro",
+                    "launchTime": to_iso_timestr(datetime(2021, 5, 1)),
+                    "privateIpAddress": "10.0.0.1",
+                    "state": "running",
+                }
+            )
+            assert_that(body["clusters"][1]).does_not_contain_key("headNode")
+            assert_that(body["failures"]).is_equal_to(
+                [
+                    {
+                        "clusterName": "old",
+                        "message": "Cluster 'old' belongs to an incompatible ParallelCluster major version.",
+                    },
+                    {
+                        "clusterName": "missing",
+                        "message": "Cluster 'missing' does not exist or belongs to an incompatible ParallelCluster "
+                        "major version.",
+                    },
+                ]
+            )
+        # Only clusters in a working status are looked up, with a single batch request
+        batch_get_items_mock.assert_called_once_with({"parallelcluster-slurm1": [{"Id": "COMPUTE_FLEET"}]})
+        describe_instances_mock.assert_called_once()
+        assert_that(describe_instances_mock.call_args[0][0][0]["Values"]).is_equal_to(["slurm1", "slurm2", "batch1"])
+
+    def test_status_filter_and_ddb_fallback(self, mocker, client):
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.list_pcluster_stacks",
+            return_value=([self._stack("slurm2"), self._stack("slurm1"), self._stack("failed", "CREATE_FAILED")], None),
+        )
+        mocker.patch(
+            "pcluster.aws.dynamo.DynamoResource.batch_get_items",
+            side_effect=AWSClientError("batch_get_items", "Requested resource not found"),
+        )
+        get_item_mock = mocker.patch(
+            "pcluster.aws.dynamo.DynamoResource.get_item",
+            return_value={"Item": {"Id": "COMPUTE_FLEET", "Data": {"status": "STOPPED"}}},
+        )
+        mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances", return_value=([], None))
+
+        response = self._send_test_request(client, cluster_status_list=[ClusterStatus.CREATE_COMPLETE])
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            body = response.get_json()
+            assert_that([cluster["clusterName"] for cluster in body["clusters"]]).is_equal_to(["slurm1", "slurm2"])
+            assert_that([cluster["computeFleetStatus"] for cluster in body["clusters"]]).is_equal_to(
+                ["STOPPED", "STOPPED"]
+            )
+            assert_that(body["failures"]).is_empty()
+            assert_that(get_item_mock.call_count).is_equal_to(2)
+
+
 class TestListClusters:
     url = "/v3/clusters"
     method = "GET"
@@ -1754,6 +1913,59 @@ class TestListClusters:
             assert_that(response.status_code).is_equal_to(200)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    def test_inventory_request(self, mocker, client, monkeypatch):
+        monkeypatch.setenv("PCLUSTER_CLUSTER_INVENTORY_ENABLED", "true")
+        list_pcluster_stacks = mocker.patch("pcluster.aws.cfn.CfnClient.list_pcluster_stacks")
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.list_stack_summaries",
+            return_value=[
+                {
+                    "StackName": name,
+                    "StackId": f"arn:{name}",
+                    "CreationTime": datetime(2021, 4, 30),
+                    "StackStatus": status,
+                }
+                for name, status in [
+                    ("name1", CloudFormationStackStatus.CREATE_IN_PROGRESS),
+                    ("name2", CloudFormationStackStatus.CREATE_COMPLETE),
+                ]
+            ],
+        )
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            side_effect=lambda stack_id: {
+                "StackName": stack_id[4:],
+                "StackId": stack_id,
+                "StackStatus": "CREATE_IN_PROGRESS" if stack_id == "arn:name1" else "CREATE_COMPLETE",
+                "Tags": [{"Key": "parallelcluster:version", "Value": "3.12.0"}],
+                "Parameters": [{"ParameterKey": "Scheduler", "ParameterValue": "slurm"}],
+            },
+        )
+
+        response = self._send_test_request(client, "eu-west-1", None, [ClusterStatus.CREATE_COMPLETE])
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()).is_equal_to(
+                {
+                    "clusters": [
+                        {
+                            "cloudformationStackArn": "arn:name2",
+                            "cloudformationStackStatus": CloudFormationStackStatus.CREATE_COMPLETE,
+                            "clusterName": "name2",
+                            "clusterStatus": ClusterStatus.CREATE_COMPLETE,
+                            "region": "eu-west-1",
+                            "version": "3.12.0",
+                            "scheduler": {"type": "slurm"},
+                        }
+                    ]
+                }
+            )
+            list_pcluster_stacks.assert_not_called()
+
+        response = self._send_test_request(client, "eu-west-1", "not-a-token!")
+        assert_that(response.status_code).is_equal_to(400)
+
     @pytest.mark.parametrize(
         "region, next_token, cluster_status, expected_response",
         [
@@ -84,7 +84,7 @@ class TestListImages:
     url = "v3/images/custom"
     method = "GET"
 
-    def _send_test_request(self, client, image_status, next_token=None, region="us-east-1"):
+    def _send_test_request(self, client, image_status, next_token=None, region="us-east-1", max_results=None):
         query_string = []
 
         if region:
@@ -96,6 +96,9 @@ class TestListImages:
         if next_token:
             query_string.append(("nextToken", next_token))
 
+        if max_results:
+            query_string.append(("maxResults", max_results))
+
         headers = {"Accept": "application/json"}
 
         return client.open(self.url, method=self.method, headers=headers, query_string=query_string)
@@ -120,7 +123,7 @@ class TestListImages:
                 },
             ]
         }
-        mocker.patch("pcluster.aws.ec2.Ec2Client.get_images", return_value=describe_result)
+        mocker.patch("pcluster.aws.ec2.Ec2Client.list_images", return_value=(describe_result, None))
 
         # Ensure we don't hit AWS when creating ImageBuilderStack(s)
         mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack_resource", return_value=None)
@@ -131,6 +134,21 @@ class TestListImages:
             assert_that(response.status_code).is_equal_to(200)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    def test_list_available_images_paginated(self, client, mocker):
+        list_images_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.list_images", return_value=([_create_image_info("image2")], "nextPage")
+        )
+
+        response = self._send_test_request(
+            client, ImageStatusFilteringOption.AVAILABLE, next_token="currentPage", max_results=5
+        )
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()["nextToken"]).is_equal_to("nextPage")
+            assert_that([image["imageId"] for image in response.get_json()["images"]]).is_equal_to(["image2"])
+        list_images_mock.assert_called_once_with(next_token="currentPage", max_results=5)
+
     @pytest.mark.parametrize("next_token", [None, "nextToken"], ids=["nextToken is None", "nextToken is not None"])
     def test_list_pending_images_successful(self, client, mocker, next_token):
         describe_result = [
@@ -139,12 +157,17 @@ class TestListImages:
             _create_stack("image3", CloudFormationStackStatus.CREATE_IN_PROGRESS),
             _create_stack("image4", CloudFormationStackStatus.DELETE_IN_PROGRESS),
         ]
-        mocker.patch("pcluster.aws.cfn.CfnClient.get_imagebuilder_stacks", return_value=(describe_result, "nextPage"))
+        get_imagebuilder_stacks_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.get_imagebuilder_stacks_by_status", return_value=(describe_result, "nextPage")
+        )
 
         # Ensure we don't hit AWS when creating ImageBuilderStack(s)
         mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack_resource", return_value=None)
 
         response = self._send_test_request(client, ImageStatusFilteringOption.PENDING, next_token)
+        get_imagebuilder_stacks_mock.assert_called_once_with(
+            [CloudFormationStackStatus.CREATE_IN_PROGRESS], next_token=next_token
+        )
 
         expected_response = {
             "images": [
@@ -177,7 +200,9 @@ class TestListImages:
             _create_stack("image8", CloudFormationStackStatus.ROLLBACK_COMPLETE),
             _create_stack("image9", CloudFormationStackStatus.ROLLBACK_IN_PROGRESS),
         ]
-        mocker.patch("pcluster.aws.cfn.CfnClient.get_imagebuilder_stacks", return_value=(describe_result, "nextPage"))
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.get_imagebuilder_stacks_by_status", return_value=(describe_result, "nextPage")
+        )
 
         # Ensure we don't hit AWS when creating ImageBuilderStack(s)
         mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack_resource", return_value=None)
@@ -270,7 +295,8 @@ class TestListImages:
     )
     def test_that_errors_are_converted(self, client, mocker, error, status_code):
         mocker.patch(
-            "pcluster.aws.ec2.Ec2Client.get_images", side_effect=error(function_name="get_images", message="test error")
+            "pcluster.aws.ec2.Ec2Client.list_images",
+            side_effect=error(function_name="list_images", message="test error"),
         )
         expected_error = {"message": "test error"}
         if error == BadRequestError:
@@ -483,6 +509,202 @@ class TestDeleteImage:
         )
 
 
+class TestDeleteImages:
+    url = "/v3/images/custom"
+    method = "DELETE"
+
+    def _send_test_request(self, client, image_ids, region="us-east-1", force=None, dryrun=None):
+        query_string = [("region", region)] + [("imageIds", image_id) for image_id in image_ids]
+        if force is not None:
+            query_string.append(("force", force))
+        if dryrun is not None:
+            query_string.append(("dryrun", dryrun))
+        headers = {"Accept": "application/json"}
+        return client.open(self.url, method=self.method, headers=headers, query_string=query_string)
+
+    @staticmethod
+    def _mock_images(mocker, instances=None, shared_account_ids=None):
+        """Mock image1 and image3 as available images, image2 as a failed build with only its stack left."""
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_images_by_id_tags",
+            return_value=[_create_image_info("image1"), _create_image_info("image3")],
+        )
+
+        def _describe_stack(stack_name):
+            if stack_name == "image2":
+                return _create_stack("image2", CloudFormationStackStatus.CREATE_FAILED)
+            raise StackNotFoundError("describe_stack", stack_name)
+
+        mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", side_effect=_describe_stack)
+        mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack_resource", return_value=None)
+        instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.get_instance_ids_by_ami_ids", return_value=instances or {}
+        )
+        shared_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.get_image_shared_account_ids",
+            side_effect=lambda image_id: (shared_account_ids or {}).get(image_id, []),
+        )
+        delete_mock = mocker.patch("pcluster.models.imagebuilder.ImageBuilder.delete", autospec=True)
+        return instances_mock, shared_mock, delete_mock
+
+    def test_successful_request(self, mocker, client):
+        instances_mock, _, delete_mock = self._mock_images(
+            mocker, instances={"image1": [], "image3": ["i-1"]}, shared_account_ids={"image1": []}
+        )
+
+        response = self._send_test_request(client, ["image1", "image2", "image3", "image4"])
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(202)
+            assert_that(response.get_json()).is_equal_to(
+                {
+                    "images": [
+                        {
+                            "imageId": "image1",
+                            "imageBuildStatus": ImageBuildStatus.DELETE_IN_PROGRESS,
+                            "region": "us-east-1",
+                            "version": "3.0.0",
+                        },
+                        {
+                            "imageId": "image2",
+                            "imageBuildStatus": ImageBuildStatus.DELETE_IN_PROGRESS,
+                            "cloudformationStackStatus": CloudFormationStackStatus.DELETE_IN_PROGRESS,
+                            "cloudformationStackArn": "arn:image2",
+                            "region": "us-east-1",
+                            "version": "3.0.0",
+                        },
+                    ],
+                    "failures": [
+                        {
+                            "imageId": "image4",
+                            "message": "No image or stack associated with ParallelCluster image id: image4.",
+                        },
+                        {"imageId": "image3", "message": "Image image3 is used by instances ['i-1']."},
+                    ],
+                }
+            )
+        # The instances using the images are retrieved once for all the images
+        instances_mock.assert_called_once_with(["image1", "image3"])
+        assert_that([call[0][0].image_id for call in delete_mock.call_args_list]).contains_only("image1", "image2")
+        for call in delete_mock.call_args_list:
+            assert_that(call[1]).contains_entry({"force": True})
+
+    def test_shared_image(self, mocker, client):
+        _, _, delete_mock = self._mock_images(mocker, shared_account_ids={"image3": ["111111111111"]})
+
+        response = self._send_test_request(client, ["image1", "image3"])
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(202)
+            assert_that(response.get_json()["failures"]).is_equal_to(
+                [{"imageId": "image3", "message": "Image image3 is shared with accounts or group ['111111111111']."}]
+            )
+        assert_that(delete_mock.call_count).is_equal_to(1)
+
+    def test_dryrun(self, mocker, client):
+        _, _, delete_mock = self._mock_images(mocker, instances={"image3": ["i-1"]})
+
+        response = self._send_test_request(client, ["image1", "image2", "image3"], dryrun=True)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(202)
+            assert_that(response.get_json()).is_equal_to(
+                {
+                    "images": [
+                        {
+                            "imageId": "image1",
+                            "imageBuildStatus": ImageBuildStatus.BUILD_COMPLETE,
+                            "ec2AmiInfo": {"amiId": "image1"},
+                            "region": "us-east-1",
+                            "version": "3.0.0",
+                        },
+                        {
+                            "imageId": "image2",
+                            "imageBuildStatus": ImageBuildStatus.BUILD_FAILED,
+                            "cloudformationStackStatus": CloudFormationStackStatus.CREATE_FAILED,
+                            "cloudformationStackArn": "arn:image2",
+                            "region": "us-east-1",
+                            "version": "3.0.0",
+                        },
+                    ],
+                    "failures": [{"imageId": "image3", "message": "Image image3 is used by instances ['i-1']."}],
+                }
+            )
+        delete_mock.assert_not_called()
+
+    def test_force(self, mocker, client):
+        instances_mock, shared_mock, delete_mock = self._mock_images(mocker, instances={"image3": ["i-1"]})
+
+        response = self._send_test_request(client, ["image1", "image3"], force=True)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(202)
+            assert_that(response.get_json()["failures"]).is_empty()
+        instances_mock.assert_not_called()
+        shared_mock.assert_not_called()
+        assert_that(delete_mock.call_count).is_equal_to(2)
+
+    def test_deletion_failure(self, mocker, client):
+        _, _, delete_mock = self._mock_images(mocker)
+
+        def _delete(imagebuilder, **_):
+            if imagebuilder.image_id == "image1":
+                raise BadRequestImageBuilderActionError("Unable to delete image and stack, due to test error")
+
+        delete_mock.side_effect = _delete
+
+        response = self._send_test_request(client, ["image1", "image3"])
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(202)
+            assert_that(response.get_json()["images"]).extracting("imageId").is_equal_to(["image3"])
+            assert_that(response.get_json()["failures"]).is_equal_to(
+                [{"imageId": "image1", "message": "Unable to delete image and stack, due to test error"}]
+            )
+
+    @pytest.mark.parametrize(
+        "region, image_ids, expected_response",
+        [
+            pytest.param(
+                "us-east-",
+                ["imageId"],
+                {"message": "Bad Request: invalid or unsupported region 'us-east-'"},
+                id="bad_region",
+            ),
+            pytest.param(
+                "us-east-1",
+                ["_malformedImageId"],
+                {"message": "Bad Request: '_malformedImageId' does not match '^[a-zA-Z][a-zA-Z0-9-]+$'"},
+                id="invalid_image_id",
+            ),
+            pytest.param(
+                "us-east-1",
+                [],
+                {"message": "Bad Request: Missing query parameter 'imageIds'"},
+                id="missing_image_ids",
+            ),
+        ],
+    )
+    def test_malformed_request(self, client, region, image_ids, expected_response):
+        response = self._send_test_request(client, image_ids, region)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()).is_equal_to(expected_response)
+
+    def test_unsupported_operation_error(self, client, mocker):
+        mocked_assert_supported_operation = mock_assert_supported_operation(
+            mocker, "pcluster.api.controllers.image_operations_controller.assert_supported_operation"
+        )
+        response = self._send_test_request(client, ["image1"])
+        verify_unsupported_operation(
+            mocked_assertion=mocked_assert_supported_operation,
+            operation=Operation.DELETE_IMAGES,
+            region="us-east-1",
+            response=response,
+        )
+
+
 class TestBuildImage:
     url = "/v3/images/custom"
     method = "POST"
@@ -17,7 +17,15 @@ from datetime import datetime
 import pytest
 from assertpy import assert_that
 
-from pcluster.aws.common import AWSExceptionHandler, ImageNotFoundError, StackNotFoundError
+from pcluster.aws.common import (
+    AdaptiveRateLimiter,
+    AWSExceptionHandler,
+    ImageNotFoundError,
+    LimitExceededError,
+    StackNotFoundError,
+    Waiter,
+    WaiterTimeoutError,
+)
 from tests.pcluster.aws.dummy_aws_api import _DummyAWSApi, mock_aws_api
 from tests.pcluster.test_utils import FAKE_NAME
 from tests.utils import MockedBoto3Request
@@ -72,7 +80,8 @@ def test_retry_on_boto3_throttling(boto3_stubber, mocker):
     def describe_stack_resources(client):
         client.describe_stack_resources(StackName=FAKE_NAME)
 
-    sleep_mock = mocker.patch("pcluster.utils.time.sleep")
+    sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+    mocker.patch("pcluster.aws.common.random.uniform", side_effect=lambda low, high: high)
     mocked_requests = [
         MockedBoto3Request(
             method="describe_stack_resources",
@@ -92,7 +101,80 @@ def test_retry_on_boto3_throttling(boto3_stubber, mocker):
     ]
     client = boto3_stubber("cloudformation", mocked_requests)
     describe_stack_resources(client)
-    sleep_mock.assert_called_with(5)
+    # Every throttled call doubles the delay, on top of the doubling between attempts
+    assert_that([call[0][0] for call in sleep_mock.call_args_list]).is_equal_to([2, 8])
+
+
+def test_adaptive_rate_limiter(mocker):
+    sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+    mocker.patch("pcluster.aws.common.time.monotonic", return_value=100.0)
+    throttling_error = LimitExceededError("terminate_instances", "Rate exceeded", "RequestLimitExceeded")
+    func = mocker.MagicMock(__name__="terminate_instances", side_effect=[throttling_error, throttling_error, "ok"])
+
+    rate_limiter = AdaptiveRateLimiter(max_rate=4, min_rate=0.5, max_attempts=3)
+    assert_that(rate_limiter.call(func, "arg")).is_equal_to("ok")
+    func.assert_called_with("arg")
+    # The rate is halved on every throttled call and increased by every successful one
+    assert_that(rate_limiter.rate).is_equal_to(1.5)
+    # Calls are spaced by the current rate and retried with exponential backoff
+    assert_that([call[0][0] for call in sleep_mock.call_args_list]).is_equal_to([1, 0.25, 4, 0.75])
+
+    func = mocker.MagicMock(__name__="terminate_instances", side_effect=throttling_error)
+    with pytest.raises(LimitExceededError):
+        rate_limiter.call(func)
+    assert_that(func.call_count).is_equal_to(3)
+    assert_that(rate_limiter.rate).is_equal_to(0.5)
+
+
+def test_waiter(mocker):
+    sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+    mocker.patch("pcluster.aws.common.random.uniform", side_effect=lambda low, high: low)
+    throttling_error = LimitExceededError("describe_stack", "Rate exceeded", "Throttling")
+    poll = mocker.MagicMock(side_effect=["IN_PROGRESS", throttling_error, "IN_PROGRESS", "IN_PROGRESS", "COMPLETE"])
+
+    waiter = Waiter("stack", min_delay=2, max_delay=10)
+    assert_that(waiter.wait(poll, until=lambda status: status == "COMPLETE")).is_equal_to("COMPLETE")
+    assert_that(waiter.attempts).is_equal_to(5)
+    assert_that(waiter.throttled_attempts).is_equal_to(1)
+    # Half of the delay is slept when the jitter is minimal, the delay is capped to max_delay
+    assert_that([call[0][0] for call in sleep_mock.call_args_list]).is_equal_to([1, 4, 5, 5])
+    assert_that(waiter.slept_time).is_equal_to(15)
+
+
+@pytest.mark.parametrize(
+    "poll_results, expected_error, expected_message",
+    [
+        (["IN_PROGRESS"], WaiterTimeoutError, "Timeout expired while waiting for stack."),
+        (
+            [LimitExceededError("describe_stack", "Rate exceeded", "Throttling")],
+            LimitExceededError,
+            "Rate exceeded",
+        ),
+        ([StackNotFoundError("describe_stack", "stack")], StackNotFoundError, "Stack with id stack does not exist"),
+    ],
+)
+def test_waiter_errors(mocker, poll_results, expected_error, expected_message):
+    clock = [0]
+    mocker.patch("pcluster.aws.common.time.monotonic", side_effect=lambda: clock[0])
+
+    def _sleep(seconds):
+        clock[0] += seconds
+
+    mocker.patch("pcluster.aws.common.time.sleep", side_effect=_sleep)
+
+    def _poll():
+        result = poll_results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    waiter = Waiter("stack", min_delay=1, max_delay=8, max_wait=30)
+    with pytest.raises(expected_error, match=expected_message):
+        waiter.wait(_poll, until=lambda status: status == "COMPLETE")
+    # The waiter gives up before exceeding max_wait, non throttling errors are raised at the first attempt
+    assert_that(waiter.slept_time).is_less_than_or_equal_to(30)
+    if expected_error is StackNotFoundError:
+        assert_that(waiter.attempts).is_equal_to(1)
 
 
 FAKE_SSM_PARAMETER = "fake-ssm-parameter-name"
@@ -12,7 +12,7 @@ from assertpy import assert_that
 
 from pcluster import utils as utils
 from pcluster.aws.cfn import CfnClient
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, StackNotFoundError
 from tests.pcluster.test_utils import FAKE_NAME, _generate_stack_event
 from tests.utils import MockedBoto3Request
 
@@ -100,6 +100,7 @@ class TestCfnClient:
 
     def test_get_stack_events_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+        mocker.patch("pcluster.aws.common.random.uniform", side_effect=lambda low, high: high)
         expected_events = [_generate_stack_event()]
         mocked_requests = [
             MockedBoto3Request(
@@ -117,10 +118,11 @@ class TestCfnClient:
         ]
         boto3_stubber("cloudformation", mocked_requests)
         assert_that(CfnClient().get_stack_events(FAKE_NAME)["StackEvents"]).is_equal_to(expected_events)
-        sleep_mock.assert_called_with(5)
+        sleep_mock.assert_called_once_with(2)
 
     def test_get_stack_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+        mocker.patch("pcluster.aws.common.random.uniform", side_effect=lambda low, high: high)
         expected_stack = {"StackName": FAKE_NAME, "CreationTime": 0, "StackStatus": "CREATED"}
         mocked_requests = [
             MockedBoto3Request(
@@ -139,7 +141,7 @@ class TestCfnClient:
         boto3_stubber("cloudformation", mocked_requests)
         stack = CfnClient().describe_stack(FAKE_NAME)
         assert_that(stack).is_equal_to(expected_stack)
-        sleep_mock.assert_called_with(5)
+        sleep_mock.assert_called_once_with(2)
 
     def test_verify_stack_status_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
@@ -242,3 +244,48 @@ class TestCfnClient:
             with pytest.raises(AWSClientError) as e:
                 CfnClient().list_pcluster_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
+
+    def test_get_imagebuilder_stacks_by_status(self, set_env, boto3_stubber, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        boto3_stubber(
+            "cloudformation",
+            [
+                MockedBoto3Request(
+                    method="list_stacks",
+                    response={
+                        "StackSummaries": [
+                            {
+                                "StackId": stack_id,
+                                "StackName": stack_id,
+                                "CreationTime": datetime.now(),
+                                "StackStatus": "CREATE_IN_PROGRESS",
+                                **({"ParentId": "parent"} if stack_id == "nested" else {}),
+                            }
+                            for stack_id in ["image", "cluster", "nested", "deleted"]
+                        ],
+                        "NextToken": "next-token",
+                    },
+                    expected_params={"StackStatusFilter": ["CREATE_IN_PROGRESS"], "NextToken": "token"},
+                )
+            ],
+        )
+        stacks = {
+            "image": {"StackName": "image", "Tags": [{"Key": "parallelcluster:image_id", "Value": "image"}]},
+            "cluster": {"StackName": "cluster", "Tags": [{"Key": "parallelcluster:version", "Value": "3.0.0"}]},
+        }
+
+        def _describe_stack(stack_name):
+            if stack_name not in stacks:
+                raise StackNotFoundError(function_name="describe_stack", stack_name=stack_name)
+            return stacks[stack_name]
+
+        describe_stack_mock = mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", side_effect=_describe_stack)
+
+        result, next_token = CfnClient().get_imagebuilder_stacks_by_status(["CREATE_IN_PROGRESS"], next_token="token")
+
+        assert_that(result).is_equal_to([stacks["image"]])
+        assert_that(next_token).is_equal_to("next-token")
+        # Nested stacks are not described
+        assert_that([call.args[0] for call in describe_stack_mock.call_args_list]).contains_only(
+            "image", "cluster", "deleted"
+        )
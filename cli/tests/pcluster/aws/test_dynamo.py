@@ -66,3 +66,31 @@ class TestDynamoDBResource:
             ExpressionAttributeValues=expression_attribute_values,
             ConditionExpression=condition_expression,
         )
+
+    def test_batch_get_items(self, set_env, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch("pcluster.aws.dynamo.time.sleep")
+        mocker.patch("pcluster.aws.dynamo.BATCH_GET_ITEM_MAX_KEYS", 2)
+        batch_get_item_mock = mocker.patch("boto3.resource").return_value.batch_get_item
+        key = {"Id": "COMPUTE_FLEET"}
+        batch_get_item_mock.side_effect = [
+            {"Responses": {"table1": [{"Id": "1"}]}, "UnprocessedKeys": {"table2": {"Keys": [key]}}},
+            {"Responses": {"table2": [{"Id": "2"}]}, "UnprocessedKeys": {}},
+            {"Responses": {"table3": [{"Id": "3"}]}},
+        ]
+
+        items = DynamoResource().batch_get_items({"table1": [key], "table2": [key], "table3": [key]})
+
+        assert items == {"table1": [{"Id": "1"}], "table2": [{"Id": "2"}], "table3": [{"Id": "3"}]}
+        batch_get_item_mock.assert_has_calls(
+            [
+                mocker.call(
+                    RequestItems={
+                        "table1": {"Keys": [key], "ConsistentRead": True},
+                        "table2": {"Keys": [key], "ConsistentRead": True},
+                    }
+                ),
+                mocker.call(RequestItems={"table2": {"Keys": [key]}}),
+                mocker.call(RequestItems={"table3": {"Keys": [key], "ConsistentRead": True}}),
+            ]
+        )
@@ -16,7 +16,7 @@ from assertpy import assert_that, soft_assertions
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import CapacityReservationInfo, ImageInfo, InstanceTypeInfo
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, LimitExceededError
 from pcluster.aws.ec2 import Ec2Client
 from pcluster.config.cluster_config import AmiSearchFilters, Tag
 from pcluster.constants import OS_TO_IMAGE_NAME_PART_MAP
@@ -405,6 +405,71 @@ def test_get_official_image_id_with_deprecation(boto3_stubber, boto3_response, e
     assert_that(ami_id).is_equal_to(expected_ami_id)
 
 
+@pytest.mark.parametrize(
+    "next_token, max_results, expected_params, response_next_token",
+    [
+        pytest.param(None, None, {}, None, id="all images"),
+        pytest.param("token", 5, {"NextToken": "token", "MaxResults": 5}, "next-token", id="page of images"),
+    ],
+)
+def test_list_images(boto3_stubber, mocker, monkeypatch, next_token, max_results, expected_params, response_next_token):
+    monkeypatch.setenv("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+    persistent_cache_put = mocker.patch("pcluster.aws.common.PersistentCache.put")
+    response = {
+        "Images": [
+            {
+                "ImageId": "ami-1",
+                "Name": "image-1",
+                "BlockDeviceMappings": [{"DeviceName": "/dev/xvda", "Ebs": {"SnapshotId": "snap-1"}}],
+                "Tags": [
+                    {"Key": "parallelcluster:image_id", "Value": "image-1"},
+                    {"Key": "parallelcluster:version", "Value": "3.0.0"},
+                    {"Key": "owner", "Value": "team"},
+                ],
+            },
+            {"ImageId": "ami-2", "Name": "image-2"},
+        ]
+    }
+    if response_next_token:
+        response["NextToken"] = response_next_token
+    boto3_stubber(
+        "ec2",
+        [
+            MockedBoto3Request(
+                method="describe_images",
+                expected_params={
+                    "Filters": [
+                        {"Name": "tag-key", "Values": ["parallelcluster:image_id"]},
+                        {"Name": "tag:parallelcluster:build_status", "Values": ["available"]},
+                    ],
+                    "Owners": ["self"],
+                    **expected_params,
+                },
+                response=response,
+            )
+        ],
+    )
+
+    images, result_next_token = Ec2Client().list_images(next_token=next_token, max_results=max_results)
+    # The result is cached in memory only, images built or deleted by other invocations are listed after the TTL
+    assert_that(Ec2Client().list_images(next_token=next_token, max_results=max_results)[0]).is_length(2)
+    persistent_cache_put.assert_not_called()
+
+    assert_that(result_next_token).is_equal_to(response_next_token)
+    assert_that([image.pcluster_image_id for image in images]).is_equal_to(["image-1", None])
+    assert_that([image.version for image in images]).is_equal_to(["3.0.0", None])
+    assert_that(images[0]._image_data).is_equal_to(
+        {
+            "ImageId": "ami-1",
+            "Name": "image-1",
+            "Tags": [
+                {"Key": "parallelcluster:image_id", "Value": "image-1"},
+                {"Key": "parallelcluster:version", "Value": "3.0.0"},
+            ],
+        }
+    )
+
+
 @pytest.mark.parametrize(
     "snapshot_id, error_message",
     [("snap-1234567890abcdef0", None), ("snap-1234567890abcdef0", "Some error message")],
@@ -509,13 +574,98 @@ def test_describe_subnets_cache(boto3_stubber):
 def test_get_subnet_ids_az_mapping(boto3_stubber):
     subnet_ids = ["subnet-123", "subnet-456"]
     avail_zones = {"subnet-123": "us-east-1a", "subnet-456": "us-east-1b"}
-    mocked_requests = [
-        get_describe_subnets_mocked_request([subnet_id], "available", avail_zones) for subnet_id in subnet_ids
-    ]
+    # All the subnets are described with a single call, later lookups are served from the cache
+    mocked_requests = [get_describe_subnets_mocked_request(subnet_ids, "available", avail_zones)]
     boto3_stubber("ec2", mocked_requests)
     response = AWSApi.instance().ec2.get_subnets_az_mapping(subnet_ids)
     assert_that(response["subnet-123"]).is_equal_to("us-east-1a")
     assert_that(response["subnet-456"]).is_equal_to("us-east-1b")
+    assert_that(AWSApi.instance().ec2.get_subnet_avail_zone("subnet-456")).is_equal_to("us-east-1b")
+
+
+def get_describe_instance_types_mocked_request(instance_types):
+    return MockedBoto3Request(
+        method="describe_instance_types",
+        response={"InstanceTypes": [{"InstanceType": instance_type} for instance_type in instance_types]},
+        expected_params={"InstanceTypes": instance_types},
+    )
+
+
+def test_describe_instance_types_batches_and_cache(boto3_stubber, mocker):
+    # Force a single worker so that the stubbed requests are received in order
+    mocker.patch("pcluster.aws.ec2.MAX_CONCURRENT_REQUESTS", 1)
+    instance_types = [f"c5.{index}xlarge" for index in range(150)]
+    mocked_requests = [
+        get_describe_instance_types_mocked_request(instance_types[:100]),
+        get_describe_instance_types_mocked_request(instance_types[100:]),
+        get_describe_instance_types_mocked_request(["t3.micro"]),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+
+    # Duplicated instance types are requested only once
+    AWSApi.instance().ec2.prefetch_instance_types_info(instance_types + instance_types[:10])
+
+    # Already described instance types are served from the cache, only the missing one is requested
+    response = AWSApi.instance().ec2.describe_instance_types(["c5.0xlarge", "t3.micro"])
+    assert_that([instance_type_data["InstanceType"] for instance_type_data in response]).is_equal_to(
+        ["c5.0xlarge", "t3.micro"]
+    )
+    assert_that(AWSApi.instance().ec2.get_instance_type_info("c5.149xlarge").instance_type()).is_equal_to(
+        "c5.149xlarge"
+    )
+
+
+def test_get_instance_type_info_not_found(boto3_stubber):
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instance_types",
+            response={"InstanceTypes": []},
+            expected_params={"InstanceTypes": ["unsupported.xlarge"]},
+        )
+    ]
+    boto3_stubber("ec2", mocked_requests)
+
+    with pytest.raises(AWSClientError, match="Instance type unsupported.xlarge not found"):
+        AWSApi.instance().ec2.get_instance_type_info("unsupported.xlarge")
+
+
+def get_describe_instance_type_offerings_mocked_request(instance_types, offerings):
+    return MockedBoto3Request(
+        method="describe_instance_type_offerings",
+        response={
+            "InstanceTypeOfferings": [
+                {"InstanceType": instance_type, "Location": location, "LocationType": "availability-zone"}
+                for instance_type, location in offerings
+            ]
+        },
+        expected_params={
+            "Filters": [{"Name": "instance-type", "Values": instance_types}],
+            "LocationType": "availability-zone",
+        },
+    )
+
+
+def test_get_supported_az_for_instance_types(boto3_stubber):
+    mocked_requests = [
+        get_describe_instance_type_offerings_mocked_request(
+            ["t3.micro", "c5.xlarge", "p4d.24xlarge"],
+            [("t3.micro", "us-east-1a"), ("c5.xlarge", "us-east-1b"), ("t3.micro", "us-east-1b")],
+        ),
+        get_describe_instance_type_offerings_mocked_request(["m5.large"], [("m5.large", "us-east-1c")]),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+
+    response = AWSApi.instance().ec2.get_supported_az_for_instance_types(["t3.micro", "c5.xlarge", "p4d.24xlarge"])
+    assert_that(response).is_equal_to(
+        {"t3.micro": ("us-east-1a", "us-east-1b"), "c5.xlarge": ("us-east-1b",), "p4d.24xlarge": ()}
+    )
+
+    # Only the instance types not in cache are requested
+    response = AWSApi.instance().ec2.get_supported_az_for_instance_types(["c5.xlarge", "m5.large"])
+    assert_that(response).is_equal_to({"c5.xlarge": ("us-east-1b",), "m5.large": ("us-east-1c",)})
+    assert_that(AWSApi.instance().ec2.get_supported_az_for_instance_type("t3.micro")).is_equal_to(
+        ("us-east-1a", "us-east-1b")
+    )
 
 
 def get_describe_capacity_reservation_mocked_request(capacity_reservations, state):
@@ -699,3 +849,131 @@ def test_is_subnet_public(boto3_stubber):
 
     # Third boto3 call. The result should be from the latest response even if the gateway id of the subnet is different
     assert AWSApi.instance().ec2.is_subnet_public(subnet_id) is True
+
+
+def _describe_instances_page(instance_ids, next_token=None):
+    response = {
+        "Reservations": [
+            {
+                "Instances": [
+                    {
+                        "InstanceId": instance_id,
+                        "InstanceType": "c5.xlarge",
+                        "ImageId": "ami-12345678",
+                        "State": {"Code": 16, "Name": "running"},
+                        "PrivateIpAddress": "10.0.0.1",
+                        "Tags": [
+                            {"Key": "parallelcluster:queue-name", "Value": "queue1"},
+                            {"Key": "Name", "Value": "Compute"},
+                        ],
+                    }
+                    for instance_id in instance_ids
+                ]
+            }
+        ]
+    }
+    if next_token:
+        response["NextToken"] = next_token
+    return response
+
+
+def test_iter_instances(boto3_stubber):
+    filters = [{"Name": "tag:parallelcluster:cluster-name", "Values": ["cluster"]}]
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instances",
+            response=_describe_instances_page(["i-1", "i-2"], next_token="token"),
+            expected_params={"Filters": filters, "MaxResults": 1000},
+        ),
+        MockedBoto3Request(
+            method="describe_instances",
+            response=_describe_instances_page(["i-3"]),
+            expected_params={"Filters": filters, "MaxResults": 1000, "NextToken": "token"},
+        ),
+        MockedBoto3Request(
+            method="describe_instances",
+            response="error",
+            expected_params={"Filters": filters, "MaxResults": 1000},
+            generate_error=True,
+        ),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+
+    instances = list(AWSApi.instance().ec2.iter_instances(filters))
+    assert_that([instance["InstanceId"] for instance in instances]).is_equal_to(["i-1", "i-2", "i-3"])
+    # Instances are projected on the fields used by ParallelCluster
+    assert_that(instances[0]).does_not_contain_key("ImageId")
+    assert_that(instances[0]["Tags"]).is_equal_to([{"Key": "parallelcluster:queue-name", "Value": "queue1"}])
+    assert_that(instances[0]["State"]).is_equal_to({"Code": 16, "Name": "running"})
+
+    with pytest.raises(AWSClientError, match="error"):
+        list(AWSApi.instance().ec2.iter_instances(filters))
+
+
+def test_get_instance_ids_by_ami_ids(boto3_stubber, mocker):
+    mocker.patch("pcluster.aws.ec2.DESCRIBE_MAX_FILTER_VALUES", 2)
+    state_filter = {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]}
+
+    def _page(instances, next_token=None):
+        response = {
+            "Reservations": [
+                {"Instances": [{"InstanceId": instance_id, "ImageId": ami_id} for instance_id, ami_id in instances]}
+            ]
+        }
+        if next_token:
+            response["NextToken"] = next_token
+        return response
+
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instances",
+            response=_page([("i-1", "ami-1"), ("i-2", "ami-1")], next_token="token"),
+            expected_params={
+                "Filters": [{"Name": "image-id", "Values": ["ami-1", "ami-2"]}, state_filter],
+                "MaxResults": 1000,
+            },
+        ),
+        MockedBoto3Request(
+            method="describe_instances",
+            response=_page([("i-3", "ami-2")]),
+            expected_params={
+                "Filters": [{"Name": "image-id", "Values": ["ami-1", "ami-2"]}, state_filter],
+                "MaxResults": 1000,
+                "NextToken": "token",
+            },
+        ),
+        MockedBoto3Request(
+            method="describe_instances",
+            response=_page([]),
+            expected_params={"Filters": [{"Name": "image-id", "Values": ["ami-3"]}, state_filter], "MaxResults": 1000},
+        ),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+
+    instance_ids = AWSApi.instance().ec2.get_instance_ids_by_ami_ids(["ami-1", "ami-2", "ami-3"])
+    assert_that(instance_ids).is_equal_to({"ami-1": ["i-1", "i-2"], "ami-2": ["i-3"], "ami-3": []})
+
+
+def test_terminate_instances_in_batches(mocker, monkeypatch):
+    monkeypatch.setenv("PCLUSTER_TERMINATE_INSTANCES_RATE_LIMIT", "1000")
+    mocker.patch("pcluster.aws.common.time.sleep")
+    mocker.patch("pcluster.aws.ec2.TERMINATE_INSTANCES_BATCH_SIZE", 2)
+    mock_aws_api(mocker)
+    throttled_batches = []
+
+    def _terminate_instances(instance_ids):
+        if "i-2" in instance_ids:
+            raise AWSClientError("terminate_instances", "Instance not found", "InvalidInstanceID.NotFound")
+        if "i-4" in instance_ids and not throttled_batches:
+            throttled_batches.append(instance_ids)
+            raise LimitExceededError("terminate_instances", "Rate exceeded", "RequestLimitExceeded")
+
+    terminate_instances_mock = mocker.patch(
+        "pcluster.aws.ec2.Ec2Client.terminate_instances", side_effect=_terminate_instances
+    )
+
+    terminated, failures = AWSApi.instance().ec2.terminate_instances_in_batches(f"i-{index}" for index in range(7))
+    assert_that(terminated).is_equal_to(5)
+    assert_that(failures).is_equal_to({"i-2": "Instance not found", "i-3": "Instance not found"})
+    # The throttled batch is retried
+    assert_that(terminate_instances_mock.call_count).is_equal_to(5)
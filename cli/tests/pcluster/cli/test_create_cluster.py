@@ -100,8 +100,12 @@ class TestCreateClusterCommand:
         describe_cluster_mock = mocker.patch(
             "pcluster.api.controllers.cluster_operations_controller.describe_cluster", return_value=response
         )
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
         mock_aws_api(mocker)
+        describe_stack_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            side_effect=[{"StackStatus": "CREATE_IN_PROGRESS"}, {"StackStatus": "CREATE_COMPLETE"}],
+        )
+        mocker.patch("pcluster.aws.common.time.sleep")
 
         path = str(test_datadir / "config.yaml")
         command = ["create-cluster", "-n", "cluster", "-c", path, "-r", "eu-west-1", "--wait"]
@@ -119,7 +123,7 @@ class TestCreateClusterCommand:
             "create_cluster_request_content": {"clusterName": "cluster", "clusterConfiguration": ""},
         }
         create_cluster_mock.assert_called_with(**expected_args)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        describe_stack_mock.assert_called_with("cluster")
         describe_cluster_mock.assert_called_with(cluster_name="cluster")
 
     @pytest.mark.parametrize("cluster_name_arg, region_arg", [("--cluster-name", "--region"), ("-n", "-r")])
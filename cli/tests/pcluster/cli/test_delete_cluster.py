@@ -9,6 +9,7 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.api.models import DeleteClusterResponseContent
+from pcluster.aws.common import StackNotFoundError
 from pcluster.cli.entrypoint import run
 from pcluster.cli.exceptions import APIOperationException
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
@@ -62,8 +63,12 @@ class TestDeleteClusterCommand:
             autospec=True,
         )
 
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
         mock_aws_api(mocker)
+        describe_stack_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            side_effect=[{"StackStatus": "DELETE_IN_PROGRESS"}, StackNotFoundError("describe_stack", "cluster")],
+        )
+        mocker.patch("pcluster.aws.common.time.sleep")
 
         command = ["delete-cluster", "--cluster-name", "cluster", "--wait"]
         out = run(command)
@@ -72,7 +77,7 @@ class TestDeleteClusterCommand:
         assert_that(delete_cluster_mock.call_args).is_length(2)
         args_expected = {"region": None, "cluster_name": "cluster"}
         delete_cluster_mock.assert_called_with(**args_expected)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        describe_stack_mock.assert_called_with("cluster")
 
     def test_execute(self, mocker):
         response_dict = {
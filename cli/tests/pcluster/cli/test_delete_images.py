@@ -0,0 +1,83 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+from assertpy import assert_that
+
+from pcluster.api.models import DeleteImagesResponseContent, ImageBuildStatus, ImageDeletionFailure, ImageInfoSummary
+from pcluster.cli.entrypoint import run
+from pcluster.cli.exceptions import APIOperationException
+
+
+class TestDeleteImagesCommand:
+    def test_helper(self, test_datadir, run_cli, assert_out_err):
+        command = ["pcluster", "delete-images", "--help"]
+        run_cli(command, expect_failure=False)
+
+        assert_out_err(expected_out=(test_datadir / "pcluster-help.txt").read_text().strip(), expected_err="")
+
+    @pytest.mark.parametrize(
+        "args, error_message",
+        [
+            ([""], "error: the following arguments are required: --image-ids"),
+            (["--image-ids", "image", "--invalid"], "Invalid arguments ['--invalid']"),
+            (["--image-ids", "image", "--region", "eu-west-"], "Bad Request: invalid or unsupported region 'eu-west-'"),
+        ],
+    )
+    def test_invalid_args(self, args, error_message, run_cli, capsys):
+        command = ["pcluster", "delete-images"] + args
+        run_cli(command, expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains(error_message)
+
+    def test_execute(self, mocker):
+        response = DeleteImagesResponseContent(
+            images=[
+                ImageInfoSummary(
+                    image_id="image1",
+                    image_build_status=ImageBuildStatus.BUILD_COMPLETE,
+                    region="us-east-1",
+                    version="3.12.0",
+                )
+            ],
+            failures=[ImageDeletionFailure(image_id="image2", message="Image image2 is used by instances ['id1'].")],
+        )
+        delete_images_mock = mocker.patch(
+            "pcluster.api.controllers.image_operations_controller.delete_images",
+            return_value=response,
+            autospec=True,
+        )
+
+        out = run(["delete-images", "--region", "us-east-1", "--image-ids", "image1", "image2", "--dryrun", "true"])
+        assert_that(out).is_equal_to(
+            {
+                "images": [
+                    {
+                        "imageId": "image1",
+                        "imageBuildStatus": "BUILD_COMPLETE",
+                        "region": "us-east-1",
+                        "version": "3.12.0",
+                    }
+                ],
+                "failures": [{"imageId": "image2", "message": "Image image2 is used by instances ['id1']."}],
+            }
+        )
+        assert_that(delete_images_mock.call_args[1].get("image_ids")).contains_only("image1", "image2")
+        assert_that(delete_images_mock.call_args[1].get("dryrun")).is_true()
+
+    def test_error(self, mocker):
+        api_response = {"message": "error"}, 400
+        mocker.patch(
+            "pcluster.api.controllers.image_operations_controller.delete_images",
+            return_value=api_response,
+            autospec=True,
+        )
+
+        with pytest.raises(APIOperationException) as exc_info:
+            run(["delete-images", "--region", "eu-west-1", "--image-ids", "image1"])
+        assert_that(exc_info.value.data).is_equal_to(api_response[0])
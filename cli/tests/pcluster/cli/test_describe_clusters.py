@@ -0,0 +1,65 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+from assertpy import assert_that
+
+from pcluster.api.models import ClusterDescriptionFailure, DescribeClustersResponseContent
+from pcluster.cli.entrypoint import run
+from pcluster.cli.exceptions import APIOperationException
+
+
+class TestDescribeClustersCommand:
+    def test_helper(self, test_datadir, run_cli, assert_out_err):
+        command = ["pcluster", "describe-clusters", "--help"]
+        run_cli(command, expect_failure=False)
+
+        assert_out_err(expected_out=(test_datadir / "pcluster-help.txt").read_text().strip(), expected_err="")
+
+    @pytest.mark.parametrize(
+        "args, error_message",
+        [
+            (["--invalid"], "Invalid arguments ['--invalid']"),
+            (["--region", "eu-west-"], "Bad Request: invalid or unsupported region 'eu-west-'"),
+            (["--cluster-status", "invalid"], "argument --cluster-status: invalid choice: 'invalid'"),
+        ],
+    )
+    def test_invalid_args(self, args, error_message, run_cli, capsys):
+        command = ["pcluster", "describe-clusters"] + args
+        run_cli(command, expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains(error_message)
+
+    def test_execute(self, mocker):
+        response = DescribeClustersResponseContent(
+            clusters=[],
+            failures=[ClusterDescriptionFailure(cluster_name="cluster2", message="Cluster 'cluster2' does not exist")],
+        )
+        describe_clusters_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.describe_clusters",
+            return_value=response,
+            autospec=True,
+        )
+
+        out = run(["describe-clusters", "--region", "us-east-1", "--cluster-names", "cluster1", "cluster2"])
+        assert_that(out).is_equal_to(
+            {"clusters": [], "failures": [{"clusterName": "cluster2", "message": "Cluster 'cluster2' does not exist"}]}
+        )
+        assert_that(describe_clusters_mock.call_args[1].get("cluster_names")).contains_only("cluster1", "cluster2")
+
+    def test_error(self, mocker):
+        api_response = {"message": "error"}, 400
+        mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.describe_clusters",
+            return_value=api_response,
+            autospec=True,
+        )
+
+        with pytest.raises(APIOperationException) as exc_info:
+            run(["describe-clusters", "--region", "eu-west-1"])
+        assert_that(exc_info.value.data).is_equal_to(api_response[0])
@@ -6,6 +6,8 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 import os
+import subprocess
+import sys
 import tempfile
 
 from assertpy import assert_that
@@ -53,3 +55,18 @@ class TestParallelClusterCli:
             log.close()
             assert_that(new[0]).contains("Handling CLI command version")
             assert_that(len(new)).is_equal_to(1)
+
+    def test_controllers_imported_on_demand(self):
+        # API controllers pull in most of the package and must be imported only when running their operations
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, pcluster.cli.entrypoint; "
+                "print([module for module in sys.modules if module.startswith('pcluster.api.controllers.')])",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert_that(result.stdout.strip()).is_equal_to("[]")
@@ -11,6 +11,7 @@ import os.path
 import pytest
 from assertpy import assert_that
 
+from pcluster.cli.commands.cluster_logs import _print_export_progress
 from pcluster.cli.entrypoint import run
 from pcluster.constants import PCLUSTER_BUCKET_PROTECTED_PREFIX
 from pcluster.utils import to_kebab_case, to_utc_datetime
@@ -116,7 +117,7 @@ class TestExportClusterLogsCommand:
     )
     def test_execute(self, mocker, set_env, args):
         export_logs_mock = mocker.patch(
-            "pcluster.cli.commands.cluster_logs.Cluster.export_logs",
+            "pcluster.models.cluster.Cluster.export_logs",
             return_value=args.get("output_file", "https://u.r.l."),
         )
         set_env("AWS_DEFAULT_REGION", "us-east-1")
@@ -146,6 +147,7 @@ class TestExportClusterLogsCommand:
                 "start_time": args.get("start_time") and to_utc_datetime(args["start_time"]),
                 "end_time": args.get("end_time") and to_utc_datetime(args["end_time"]),
                 "filters": [args.get("filters")] if args.get("filters") else None,
+                "progress_callback": _print_export_progress,
             }
         )
         export_logs_mock.assert_called_with(**expected_params)
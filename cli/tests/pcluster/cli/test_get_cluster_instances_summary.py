@@ -0,0 +1,67 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+from assertpy import assert_that
+
+from pcluster.api.models import GetClusterInstancesSummaryResponseContent, InstancesCount
+from pcluster.cli.entrypoint import run
+
+
+class TestGetClusterInstancesSummaryCommand:
+    def test_helper(self, test_datadir, run_cli, assert_out_err):
+        command = ["pcluster", "get-cluster-instances-summary", "--help"]
+        run_cli(command, expect_failure=False)
+
+        assert_out_err(expected_out=(test_datadir / "pcluster-help.txt").read_text().strip(), expected_err="")
+
+    @pytest.mark.parametrize(
+        "args, error_message",
+        [
+            ([""], "error: the following arguments are required: -n/--cluster-name"),
+            (["--cluster-name", "cluster", "--invalid"], "Invalid arguments ['--invalid']"),
+            (
+                ["--cluster-name", "cluster", "--node-type", "invalid"],
+                "error: argument --node-type: invalid choice: 'invalid' (choose from 'HeadNode', 'ComputeNode', "
+                "'LoginNode')",
+            ),
+            (
+                ["--cluster-name", "cluster", "--region", "eu-west-"],
+                "Bad Request: invalid or unsupported region 'eu-west-'",
+            ),
+        ],
+    )
+    def test_invalid_args(self, args, error_message, run_cli, capsys):
+        command = ["pcluster", "get-cluster-instances-summary"] + args
+        run_cli(command, expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains(error_message)
+
+    def test_execute(self, mocker):
+        response = GetClusterInstancesSummaryResponseContent(
+            total_instances=2, states=[InstancesCount(name="running", count=2)]
+        )
+        summary_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_instances_controller.get_cluster_instances_summary",
+            return_value=response,
+            autospec=True,
+        )
+
+        out = run(
+            [
+                "get-cluster-instances-summary",
+                "--cluster-name",
+                "cluster",
+                "--region",
+                "us-east-1",
+                "--queue-name",
+                "q1",
+            ]
+        )
+        assert_that(out).is_equal_to({"totalInstances": 2, "states": [{"name": "running", "count": 2}]})
+        assert_that(summary_mock.call_args[1].get("queue_name")).is_equal_to("q1")
@@ -81,7 +81,11 @@ class TestListImagesCommand:
         out = run(["list-images", "--image-status", "AVAILABLE"])
         assert_that(out).is_equal_to(response_dict)
         assert_that(list_images_mock.call_args).is_length(2)  # this is due to the decorator on list_clusters
-        expected_args = {"region": None, "next_token": None, "image_status": "AVAILABLE"}
+        expected_args = {"region": None, "next_token": None, "max_results": None, "image_status": "AVAILABLE"}
+        list_images_mock.assert_called_with(**expected_args)
+
+        run(["list-images", "--image-status", "AVAILABLE", "--max-results", "10", "--next-token", "token"])
+        expected_args = {"region": None, "next_token": "token", "max_results": 10, "image_status": "AVAILABLE"}
         list_images_mock.assert_called_with(**expected_args)
 
     def test_error(self, mocker):
@@ -11,7 +11,9 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.cli.entrypoint import ParameterException, gen_parser
-from pcluster.cli.middleware import queryable
+from pcluster.cli.exceptions import APIOperationException
+from pcluster.cli.middleware import profilable, queryable
+from pcluster.validators.common import ValidatorsProfiler
 
 
 def _model(params):
@@ -84,3 +86,26 @@ class TestCliMIddlware:
         with pytest.raises(ParameterException) as exc_info:
             _run_model(model, ["op", "--param", "1", "--query", "["])
         assert_that(exc_info.value.data).is_equal_to({"message": "Invalid query string.", "query": "["})
+
+    @pytest.mark.parametrize("fail", [False, True])
+    def test_profilable(self, mocker, fail):
+        report = [{"validatorType": "FakeValidator", "durationSeconds": 1.0}]
+        mocker.patch.object(ValidatorsProfiler, "report", return_value=report)
+
+        def op_middle(func, _body, kwargs):
+            assert_that(ValidatorsProfiler.active()).is_not_none()
+            if fail:
+                raise APIOperationException({"message": "failure"})
+            return func(**kwargs)
+
+        middleware = profilable(op_middle)
+        if fail:
+            with pytest.raises(APIOperationException) as exc_info:
+                middleware(lambda **kwargs: {}, {}, {"validators_timing": True})
+            assert_that(exc_info.value.data).is_equal_to({"message": "failure", "validatorsTiming": report})
+        else:
+            ret = middleware(lambda **kwargs: dict(kwargs), {}, {"validators_timing": True, "param": 1})
+            assert_that(ret).is_equal_to({"param": 1, "validatorsTiming": report})
+
+        ret = profilable(lambda func, _body, kwargs: func(**kwargs))(lambda **kwargs: dict(kwargs), {}, {"param": 1})
+        assert_that(ret).is_equal_to({"param": 1})
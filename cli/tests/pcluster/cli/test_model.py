@@ -10,6 +10,7 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.cli.entrypoint import ParameterException, gen_parser
+from pcluster.cli.model import load_model, load_precompiled_model, package_spec
 
 
 def _model(params):
@@ -93,3 +94,10 @@ class TestCliModel:
         path = str(test_datadir / "notfound")
         with pytest.raises(ParameterException):
             _run_model(model, ["op", "--file", path])
+
+    def test_precompiled_model(self, mocker):
+        # The precompiled model must be regenerated with "python -m pcluster.cli.model" when the specification changes
+        assert_that(load_precompiled_model()).is_equal_to(load_model(package_spec()))
+
+        mocker.patch("pcluster.cli.model.PRECOMPILED_MODEL", "not-found.json")
+        assert_that(load_precompiled_model()).is_equal_to(load_model(package_spec()))
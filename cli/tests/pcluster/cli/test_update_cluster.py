@@ -107,8 +107,12 @@ class TestUpdateClusterCommand:
             "pcluster.api.controllers.cluster_operations_controller.describe_cluster", return_value=response
         )
 
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
         mock_aws_api(mocker)
+        describe_stack_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            side_effect=[{"StackStatus": "UPDATE_IN_PROGRESS"}, {"StackStatus": "UPDATE_COMPLETE"}],
+        )
+        mocker.patch("pcluster.aws.common.time.sleep")
 
         path = str(test_datadir / "config.yaml")
         command = ["update-cluster", "--cluster-name", "cluster", "--cluster-configuration", path, "--wait"]
@@ -127,7 +131,7 @@ class TestUpdateClusterCommand:
             "validation_failure_level": None,
         }
         update_cluster_mock.assert_called_with(**expected_args)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        describe_stack_mock.assert_called_with("cluster")
         describe_cluster_mock.assert_called_with(cluster_name="cluster")
 
     def test_execute(self, mocker, test_datadir):
@@ -2,6 +2,7 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.aws.aws_resources import CapacityReservationInfo, InstanceTypeInfo
+from pcluster.aws.common import AWSClientError
 from pcluster.config.cluster_config import (
     AmiSearchFilters,
     BaseClusterConfig,
@@ -27,6 +28,7 @@ from pcluster.config.cluster_config import (
     PlacementGroup,
     QueueImage,
     SharedEbs,
+    SharedFsxLustre,
     SlurmClusterConfig,
     SlurmComputeResource,
     SlurmComputeResourceNetworking,
@@ -644,6 +646,69 @@ class TestBaseClusterConfig:
         actual = queue.get_managed_placement_group_keys()
         assert_that(actual).is_equal_to(expected_result)
 
+    def test_prefetch_instance_types_info(self, aws_api_mock, base_slurm_cluster_config):
+        base_slurm_cluster_config.scheduling.queues[0].compute_resources.append(
+            SlurmFlexibleComputeResource(
+                name="compute_resource_2",
+                instances=[FlexibleInstanceType("c5.xlarge"), FlexibleInstanceType("c5n.18xlarge")],
+            )
+        )
+        base_slurm_cluster_config.login_nodes = LoginNodes(
+            pools=[
+                LoginNodesPool(
+                    name="pool",
+                    instance_type="t3.xlarge",
+                    networking=LoginNodesNetworking(subnet_ids=["subnet"]),
+                )
+            ]
+        )
+        base_slurm_cluster_config.prefetch_instance_types_info()
+        aws_api_mock.ec2.prefetch_instance_types_info.assert_called_once_with(
+            ["c5.xlarge", "c5n.18xlarge", "t3.xlarge"]
+        )
+
+    def test_prefetch_instance_types_info_error(self, aws_api_mock, base_slurm_cluster_config, caplog):
+        aws_api_mock.ec2.prefetch_instance_types_info.side_effect = AWSClientError(
+            "describe_instance_types", "Invalid instance type"
+        )
+        base_slurm_cluster_config.prefetch_instance_types_info()
+        assert_that(caplog.text).contains("Unable to cache describe_instance_types results")
+
+    def test_prefetch_subnets_info(self, aws_api_mock, base_slurm_cluster_config):
+        base_slurm_cluster_config.scheduling.queues.append(
+            SlurmQueue(
+                name="queue1",
+                networking=SlurmQueueNetworking(subnet_ids=["subnet-1"]),
+                compute_resources=[SlurmComputeResource(name="compute_resource_1", instance_type="c5.xlarge")],
+            )
+        )
+        base_slurm_cluster_config.login_nodes = LoginNodes(
+            pools=[
+                LoginNodesPool(
+                    name="pool",
+                    instance_type="t3.xlarge",
+                    networking=LoginNodesNetworking(subnet_ids=["subnet-2"]),
+                )
+            ]
+        )
+        base_slurm_cluster_config.prefetch_subnets_info()
+        aws_api_mock.ec2.describe_subnets.assert_called_once()
+        assert_that(aws_api_mock.ec2.describe_subnets.call_args[0][0]).contains_only("subnet", "subnet-1", "subnet-2")
+
+    def test_prefetch_subnets_info_file_system_not_found(self, aws_api_mock, base_slurm_cluster_config, caplog):
+        base_slurm_cluster_config.shared_storage = [
+            SharedFsxLustre(mount_dir="/fsx", name="fsx", file_system_id="fs-123456789")
+        ]
+        aws_api_mock.fsx.get_file_systems_info.return_value = []
+        base_slurm_cluster_config.prefetch_subnets_info()
+        aws_api_mock.ec2.describe_subnets.assert_not_called()
+        assert_that(caplog.text).contains("Unable to cache describe_subnets results for all subnet ids.")
+
+    def test_prefetch_subnets_info_unexpected_error(self, aws_api_mock, base_slurm_cluster_config):
+        aws_api_mock.ec2.describe_subnets.side_effect = KeyError("SubnetId")
+        with pytest.raises(KeyError, match="SubnetId"):
+            base_slurm_cluster_config.prefetch_subnets_info()
+
     def test_get_instance_types_data(self, base_cluster_config):
         assert_that(base_cluster_config.get_instance_types_data()).is_equal_to({})
 
@@ -9,18 +9,21 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import time
 from typing import List
 from unittest.mock import MagicMock
 
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws.common import AWSCallsCounter
 from pcluster.config.common import Resource, TypeMatchValidatorsSuppressor
 from pcluster.validators.common import (
     AsyncValidator,
     FailureLevel,
     Validator,
     ValidatorContext,
+    ValidatorsProfiler,
     get_async_timed_validator_type_for,
 )
 
@@ -64,6 +67,23 @@ class FakeAsyncMultiErrorValidator(AsyncValidator):
         self._add_failure(f"Error async 2 {param}.", FailureLevel.ERROR)
 
 
+class FakeSlowValidator(Validator):
+    """Dummy validator taking some time to complete."""
+
+    def _validate(self, param, duration):
+        time.sleep(duration)
+        self._add_failure(f"Slow {param}.", FailureLevel.INFO)
+
+
+class FakeAwsCallsValidator(Validator):
+    """Dummy validator making AWS calls."""
+
+    def _validate(self, calls):
+        for _ in range(calls):
+            AWSCallsCounter.record_aws_call()
+        AWSCallsCounter.record_cache_hit()
+
+
 class FakeComplexValidator(Validator):
     """Dummy validator requiring multiple parameters as input."""
 
@@ -256,6 +276,93 @@ def test_async_resource_validation_with_timeout():
     assert_validation_result(validation_failures[3], FailureLevel.INFO, "Wrong async value other-value.")
 
 
+def test_sync_resource_validation_concurrent():
+    """Verify that sync validators are executed concurrently and their failures are returned in order."""
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self, name):
+            super().__init__()
+            self.name = name
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeSlowValidator, param=f"{self.name}-1", duration=0.5)
+            self._register_validator(FakeErrorValidator, param=self.name)
+            self._register_validator(FakeSlowValidator, param=f"{self.name}-2", duration=0.2)
+
+    fake_resource = FakeResource("root")
+    fake_resource.nested = FakeResource("nested")
+
+    start = time.monotonic()
+    validation_failures = fake_resource.validate()
+
+    assert_that(time.monotonic() - start).is_less_than(1.5)
+    assert_that([failure.message for failure in validation_failures]).is_equal_to(
+        [
+            "Slow nested-1.",
+            "Error nested.",
+            "Slow nested-2.",
+            "Slow root-1.",
+            "Error root.",
+            "Slow root-2.",
+        ]
+    )
+
+
+def test_sync_resource_validation_with_timeout(mocker):
+    """Verify that a sync validator taking too long is reported as an error without blocking the others."""
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeSlowValidator, param="slow", duration=2)
+            self._register_validator(FakeErrorValidator, param="fast")
+
+    mocker.patch("pcluster.config.common.VALIDATOR_TIMEOUT_SEC", 0.2)
+    start = time.monotonic()
+    validation_failures = FakeResource().validate()
+
+    assert_that(time.monotonic() - start).is_less_than(1.5)
+    assert_that(validation_failures).is_length(2)
+    assert_validation_result(validation_failures[0], FailureLevel.ERROR, "Validation timed out after")
+    assert_that(validation_failures[0].message).contains("--suppress-validators type:FakeSlowValidator")
+    assert_that(validation_failures[0].validator_type).is_equal_to("FakeSlowValidator")
+    assert_validation_result(validation_failures[1], FailureLevel.ERROR, "Error fast.")
+
+
+def test_resource_validation_profiled():
+    """Verify that the profiler records the timing of every validator executed while it is active."""
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeAwsCallsValidator, calls=3)
+            self._register_validator(FakeSlowValidator, param="slow", duration=0.3)
+            self._register_validator(FakeAsyncInfoValidator, param="async")
+
+    fake_resource = FakeResource()
+    fake_resource.validate()
+
+    with ValidatorsProfiler.profile() as profiler:
+        validation_failures = fake_resource.validate(
+            suppressors=[TypeMatchValidatorsSuppressor({"FakeAsyncInfoValidator"})]
+        )
+    assert_that(validation_failures).is_length(1)
+    assert_that(ValidatorsProfiler.active()).is_none()
+
+    report = profiler.report()
+    assert_that([timing["validatorType"] for timing in report]).is_equal_to(
+        ["FakeSlowValidator", "FakeAwsCallsValidator"]
+    )
+    assert_that(report[0]["durationSeconds"]).is_greater_than_or_equal_to(0.3)
+    assert_that(report[0]).contains_entry({"awsCalls": 0}, {"cacheHits": 0}, {"failures": 1})
+    assert_that(report[1]).contains_entry({"awsCalls": 3}, {"cacheHits": 1}, {"failures": 0})
+    assert_that(profiler.report(limit=1)).is_length(1)
+
+
 def test_dynamic_property_validate():
     """Verify that validators of dynamic parameters are working as expected."""
 
@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import os
 import shutil
 
@@ -1133,3 +1134,56 @@ def test_patch_check_cluster_resource_bucket(
         line = ["{0}".format(element) if isinstance(element, str) else element for element in line]
         assert_that(expected_message_rows).contains(line)
     assert_that(patch_allowed).is_equal_to(not expected_error_row)
+
+
+def _large_slurm_config(queues, compute_resources, max_count=10):
+    return {
+        "HeadNode": {"InstanceType": "t3.micro", "Networking": {"SubnetId": "subnet-12345678"}},
+        "Scheduling": {
+            "Scheduler": "slurm",
+            "SlurmQueues": [
+                {
+                    "Name": f"queue{queue}",
+                    "Networking": {"SubnetIds": ["subnet-12345678"]},
+                    "ComputeResources": [
+                        {"Name": f"cr{resource}", "InstanceType": "c5.xlarge", "MinCount": 0, "MaxCount": max_count}
+                        for resource in range(compute_resources)
+                    ],
+                }
+                for queue in range(queues)
+            ],
+        },
+    }
+
+
+def test_large_config_patch(mocker):
+    """Verify that the patch of a config with 100 queues of 50 compute resources compares every section once."""
+    base_conf = _large_slurm_config(queues=100, compute_resources=50)
+    target_conf = _large_slurm_config(queues=100, compute_resources=50, max_count=20)
+    # Reordered, added and removed queues are matched by name
+    target_queues = target_conf["Scheduling"]["SlurmQueues"]
+    target_queues.reverse()
+    target_queues[0] = {**target_queues[0], "Name": "new-queue"}
+    base_conf_copy, target_conf_copy = copy.deepcopy(base_conf), copy.deepcopy(target_conf)
+
+    compare_section_spy = mocker.spy(ConfigPatch, "_compare_section")
+    patch = ConfigPatch(dummy_cluster(), base_config=base_conf, target_config=target_conf)
+
+    max_count_changes = [change for change in patch.changes if change.key == "MaxCount"]
+    assert_that(max_count_changes).is_length(99 * 50)
+    assert_that(max_count_changes[0].path).is_equal_to(["Scheduling", "SlurmQueues[queue98]", "ComputeResources[cr0]"])
+    queue_changes = [(change.old_value, change.new_value) for change in patch.changes if change.is_list]
+    assert_that(queue_changes).is_equal_to(
+        [(None, target_queues[0]), (base_conf["Scheduling"]["SlurmQueues"][99], None)]
+    )
+    # The configurations are not copied, changes do not share their path and the configurations are left untouched
+    assert_that(patch.base_config).is_same_as(base_conf)
+    assert_that(patch.target_config).is_same_as(target_conf)
+    max_count_changes[0].path.append("modified")
+    assert_that(max_count_changes[1].path).is_length(3)
+    assert_that(base_conf).is_equal_to(base_conf_copy)
+    assert_that(target_conf).is_equal_to(target_conf_copy)
+    # List items are matched by name through an index: every section is compared once, with the matching one only
+    compared_paths = [call.kwargs.get("param_path", call.args[-1]) for call in compare_section_spy.call_args_list]
+    assert_that(compared_paths).does_not_contain_duplicates()
+    assert_that(compared_paths).contains(("Scheduling", "SlurmQueues[queue98]", "ComputeResources[cr49]"))
@@ -24,9 +24,16 @@ from pcluster.aws.common import AWSClientError
 from pcluster.config.cluster_config import Tag
 from pcluster.config.common import AllValidatorsSuppressor
 from pcluster.config.update_policy import UpdatePolicy
-from pcluster.constants import PCLUSTER_CLUSTER_NAME_TAG, PCLUSTER_NODE_TYPE_TAG, PCLUSTER_VERSION_TAG
+from pcluster.constants import (
+    PCLUSTER_CLUSTER_NAME_TAG,
+    PCLUSTER_COMPUTE_RESOURCE_NAME_TAG,
+    PCLUSTER_NODE_TYPE_TAG,
+    PCLUSTER_QUEUE_NAME_TAG,
+    PCLUSTER_VERSION_TAG,
+)
 from pcluster.models.cluster import BadRequestClusterActionError, Cluster, ClusterActionError, NodeType
 from pcluster.models.cluster_resources import ClusterStack
+from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus
 from pcluster.models.s3_bucket import S3Bucket, S3FileFormat
 from pcluster.schemas.cluster_schema import ClusterSchema
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
@@ -87,6 +94,54 @@ class TestCluster:
         instances, _ = cluster.describe_instances(node_type=node_type)
         assert_that(instances).is_length(expected_instances)
 
+    def test_instances_summary(self, cluster, mocker):
+        mock_aws_api(mocker)
+
+        def _instance(instance_type, state, queue_name=None, compute_resource_name=None):
+            tags = [{"Key": PCLUSTER_NODE_TYPE_TAG, "Value": "Compute"}]
+            if queue_name:
+                tags.append({"Key": PCLUSTER_QUEUE_NAME_TAG, "Value": queue_name})
+            if compute_resource_name:
+                tags.append({"Key": PCLUSTER_COMPUTE_RESOURCE_NAME_TAG, "Value": compute_resource_name})
+            return {"InstanceId": "i-1", "InstanceType": instance_type, "State": {"Name": state}, "Tags": tags}
+
+        instances = [
+            _instance("c5.xlarge", "running", "q1", "cr1"),
+            _instance("c5.xlarge", "pending", "q1", "cr1"),
+            _instance("t3.micro", "running", "q2", "cr1"),
+            _instance("t3.micro", "running"),
+        ]
+        iter_instances_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.iter_instances", return_value=iter(instances))
+
+        summary = cluster.get_instances_summary(node_type=NodeType.COMPUTE, queue_name="q1")
+        iter_instances_mock.assert_called_with(
+            [
+                {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": [FAKE_NAME]},
+                {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
+                {"Name": f"tag:{PCLUSTER_NODE_TYPE_TAG}", "Values": ["Compute"]},
+                {"Name": f"tag:{PCLUSTER_QUEUE_NAME_TAG}", "Values": ["q1"]},
+            ]
+        )
+        assert_that(summary.total).is_equal_to(4)
+        assert_that(dict(summary.queues)).is_equal_to({"q1": 2, "q2": 1})
+        assert_that(dict(summary.compute_resources)).is_equal_to({("q1", "cr1"): 2, ("q2", "cr1"): 1})
+        assert_that(dict(summary.instance_types)).is_equal_to({"c5.xlarge": 2, "t3.micro": 2})
+        assert_that(dict(summary.states)).is_equal_to({"running": 3, "pending": 1})
+
+        mocker.patch("pcluster.aws.ec2.Ec2Client.iter_instances", side_effect=AWSClientError("iter_instances", "error"))
+        with pytest.raises(ClusterActionError, match="Failed to retrieve cluster instances"):
+            cluster.get_instances_summary()
+
+    def test_get_running_capacity_counts_all_pages(self, cluster, mocker):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.cluster.ClusterStack.scheduler", new_callable=PropertyMock(return_value="slurm"))
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.iter_instances",
+            return_value=iter([{"InstanceId": f"i-{index}"} for index in range(2500)]),
+        )
+
+        assert_that(cluster.get_running_capacity()).is_equal_to(2500)
+
     @pytest.mark.parametrize(
         "existing_tags",
         [
@@ -158,7 +213,6 @@ class TestCluster:
                 "UPDATE_IN_PROGRESS",
                 "UPDATE_IN_PROGRESS",
                 "UPDATE_COMPLETE",
-                "UPDATE_COMPLETE",
             ],
             [
                 "UPDATE_IN_PROGRESS",
@@ -166,7 +220,6 @@ class TestCluster:
                 "UPDATE_IN_PROGRESS",
                 "UPDATE_IN_PROGRESS",
                 "anything other than UPDATE_IN_PROGRESS",
-                "anything other than UPDATE_IN_PROGRESS",
             ],
             [
                 "UPDATE_IN_PROGRESS",
@@ -175,7 +228,7 @@ class TestCluster:
                 "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS",
                 "UPDATE_COMPLETE",
             ],
-            ["UPDATE_COMPLETE", "UPDATE_COMPLETE"],
+            ["UPDATE_COMPLETE"],
         ],
     )
     def test_wait_for_stack_update(self, cluster, mocker, stack_statuses):
@@ -188,7 +241,7 @@ class TestCluster:
         """
         expected_call_count = len(stack_statuses)
         updated_status_mock = mocker.patch.object(cluster, "_get_updated_stack_status", side_effect=stack_statuses)
-        mocker.patch("pcluster.models.cluster.time.sleep")  # so we don't actually have to wait
+        mocker.patch("pcluster.aws.common.time.sleep")  # so we don't actually have to wait
 
         cluster._wait_for_stack_update()
         assert_that(updated_status_mock.call_count).is_equal_to(expected_call_count)
@@ -292,6 +345,23 @@ class TestCluster:
 
         assert_that(persist_cloudwatch_log_groups_mock.called).is_equal_to(persist_called)
 
+    def test_terminate_nodes_partial_failures(self, cluster, mocker):
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.iter_instances",
+            return_value=iter([{"InstanceId": "i-1"}, {"InstanceId": "i-2"}]),
+        )
+        terminate_instances_in_batches_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.terminate_instances_in_batches",
+            side_effect=lambda instance_ids: (len(list(instance_ids)) - 1, {"i-2": "Instance not found"}),
+        )
+
+        with pytest.raises(
+            ClusterActionError, match="Unable to delete 1 running EC2 instances with error: i-2: Instance"
+        ):
+            cluster.terminate_nodes()
+        terminate_instances_in_batches_mock.assert_called_once()
+
     @pytest.mark.parametrize(
         "template, expected_retain, fail_on_persist",
         [
@@ -480,7 +550,7 @@ class TestCluster:
         stack_exists_mock = mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=stack_exists)
         download_stack_events_mock = mocker.patch("pcluster.models.cluster.export_stack_events")
         create_logs_archive_mock = mocker.patch("pcluster.models.cluster.create_logs_archive")
-        upload_archive_mock = mocker.patch("pcluster.models.cluster.upload_archive")
+        upload_archive_mock = mocker.patch("pcluster.models.cluster.upload_logs_archive")
         presign_mock = mocker.patch("pcluster.models.cluster.create_s3_presigned_url")
         mocker.patch(
             "pcluster.models.cluster.ClusterStack.log_group_name",
@@ -502,7 +572,6 @@ class TestCluster:
             cluster.export_logs(**kwargs)
             # check archive steps
             download_stack_events_mock.assert_called()
-            create_logs_archive_mock.assert_called()
 
             # check preliminary steps
             stack_exists_mock.assert_called_with(cluster.stack_name)
@@ -515,9 +584,12 @@ class TestCluster:
                 logs_filter_mock.assert_not_called()
 
             if "output_file" not in kwargs:
-                print("kwargs", kwargs)
                 upload_archive_mock.assert_called()
                 presign_mock.assert_called()
+                create_logs_archive_mock.assert_not_called()
+            else:
+                create_logs_archive_mock.assert_called()
+                upload_archive_mock.assert_not_called()
 
     @pytest.mark.parametrize(
         "stack_exists, logging_enabled, client_error, expected_error",
@@ -837,6 +909,73 @@ class TestCluster:
         mocker.patch("pcluster.models.login_nodes_status.LoginNodesStatus.get_unhealthy_nodes", return_value=unhealthy)
         assert_that(cluster.has_running_login_nodes()).is_equal_to(expected_result)
 
+    def test_load_runtime_state(self, mocker, cluster):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.cluster.ClusterStack.scheduler", new_callable=PropertyMock(return_value="slurm"))
+        fleet_status_manager = mocker.MagicMock()
+        fleet_status_manager.get_status.return_value = ComputeFleetStatus.RUNNING
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status_manager",
+            new_callable=PropertyMock(return_value=fleet_status_manager),
+        )
+        login_nodes_status = mocker.MagicMock()
+        login_nodes_status.get_pool_status_dict.return_value = {"pool1": None, "pool2": None}
+        healthy_nodes = {None: 1, "pool1": 1, "pool2": 0}
+        login_nodes_status.get_healthy_nodes.side_effect = lambda pool_name: healthy_nodes[pool_name]
+        login_nodes_status.get_unhealthy_nodes.return_value = 0
+        login_nodes_status_property = mocker.patch(
+            "pcluster.models.cluster.Cluster.login_nodes_status",
+            new_callable=PropertyMock,
+            return_value=login_nodes_status,
+        )
+        iter_instances = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.iter_instances", side_effect=AWSClientError("iter_instances", "error")
+        )
+
+        cluster.load_runtime_state()
+        # The compute instances are not listed for Slurm, no check needs the running capacity
+        iter_instances.assert_not_called()
+
+        # The state is shared by all the checks, the pools are retrieved once
+        for _ in range(3):
+            assert_that(cluster.has_running_capacity()).is_true()
+            assert_that(cluster.has_running_login_nodes()).is_true()
+            assert_that(cluster.has_running_login_nodes(pool_name="pool1")).is_true()
+            assert_that(cluster.has_running_login_nodes(pool_name="pool2")).is_false()
+            assert_that(cluster.has_running_login_nodes(pool_name="new-pool")).is_false()
+        fleet_status_manager.get_status.assert_called_once()
+        login_nodes_status_property.assert_called_once()
+        # A value that was not retrieved is retrieved when needed
+        with pytest.raises(ClusterActionError, match="Failed to retrieve cluster instances"):
+            cluster.get_running_capacity()
+        iter_instances.assert_called_once()
+
+    def test_load_runtime_state_awsbatch(self, mocker, cluster):
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.models.cluster.ClusterStack.scheduler", new_callable=PropertyMock(return_value="awsbatch")
+        )
+        mocker.patch(
+            "pcluster.models.cluster.ClusterStack.batch_compute_environment",
+            new_callable=PropertyMock(return_value="ce"),
+        )
+        get_capacity = mocker.patch(
+            "tests.pcluster.aws.dummy_aws_api._DummyBatchClient.get_compute_environment_capacity",
+            create=True,
+            return_value=2,
+        )
+        fleet_status_manager = mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status_manager", new_callable=PropertyMock
+        )
+
+        cluster.load_runtime_state()
+
+        for _ in range(3):
+            assert_that(cluster.get_running_capacity()).is_equal_to(2)
+            assert_that(cluster.has_running_capacity()).is_true()
+        get_capacity.assert_called_once_with(ce_name="ce")
+        fleet_status_manager.assert_not_called()
+
     def test_login_nodes_on_batch(self, mocker, cluster):
         mocker.patch("pcluster.models.cluster_resources.ClusterStack.scheduler", return_value="awsbatch")
         lns = cluster.login_nodes_status
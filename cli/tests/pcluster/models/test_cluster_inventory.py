@@ -0,0 +1,150 @@
+import datetime
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import StackNotFoundError
+from pcluster.models.cluster_inventory import ClusterInventory, InvalidNextTokenError
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+
+CREATION_TIME = datetime.datetime(2026, 1, 1)
+UPDATE_TIME = datetime.datetime(2026, 1, 2)
+
+
+def _summary(name, status="CREATE_COMPLETE", updated=None, parent_id=None):
+    summary = {"StackId": f"id-{name}", "StackName": name, "StackStatus": status, "CreationTime": CREATION_TIME}
+    if updated:
+        summary["LastUpdatedTime"] = updated
+    if parent_id:
+        summary["ParentId"] = parent_id
+    return summary
+
+
+def _stack(name, status="CREATE_COMPLETE", version="3.12.0", image_id=None):
+    tags = [{"Key": "Owner", "Value": "me"}]
+    if version:
+        tags.append({"Key": "parallelcluster:version", "Value": version})
+    if image_id:
+        tags.append({"Key": "parallelcluster:image_id", "Value": image_id})
+    return {
+        "StackId": f"id-{name}",
+        "StackName": name,
+        "StackStatus": status,
+        "Tags": tags,
+        "Parameters": [
+            {"ParameterKey": "Scheduler", "ParameterValue": "slurm"},
+            {"ParameterKey": "ClusterUser", "ParameterValue": "ec2-user"},
+        ],
+    }
+
+
+@pytest.fixture
+def inventory_env(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("PCLUSTER_CLUSTER_INVENTORY_ENABLED", "true")
+
+
+def _mock_cfn(mocker, summaries, stacks):
+    mock_aws_api(mocker)
+    stacks_by_id = {stack["StackId"]: stack for stack in stacks}
+
+    def _describe_stack(stack_id):
+        if stack_id not in stacks_by_id:
+            raise StackNotFoundError("describe_stack", stack_id)
+        return stacks_by_id[stack_id]
+
+    list_summaries = mocker.patch("pcluster.aws.cfn.CfnClient.list_stack_summaries", return_value=summaries)
+    describe_stack = mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", side_effect=_describe_stack)
+    return list_summaries, describe_stack
+
+
+def test_list_cluster_stacks_incremental_refresh(mocker, inventory_env):
+    summaries = [
+        _summary("c2"),
+        _summary("c1"),
+        _summary("image"),
+        _summary("other"),
+        _summary("nested", parent_id="x"),
+    ]
+    stacks = [_stack("c1"), _stack("c2"), _stack("image", image_id="img"), _stack("other", version=None)]
+    list_summaries, describe_stack = _mock_cfn(mocker, summaries, stacks)
+
+    inventory = ClusterInventory.instance()
+    page, next_token = inventory.list_cluster_stacks()
+    assert_that([stack["StackName"] for stack in page]).is_equal_to(["c1", "c2"])
+    assert_that(next_token).is_none()
+    assert_that(page[0]["Tags"]).is_equal_to([{"Key": "parallelcluster:version", "Value": "3.12.0"}])
+    assert_that(page[0]["Parameters"]).is_equal_to([{"ParameterKey": "Scheduler", "ParameterValue": "slurm"}])
+    # Nested stacks are never described
+    assert_that(describe_stack.call_count).is_equal_to(4)
+
+    # Unchanged stacks only get their status updated from the summary, updated stacks are described again
+    summaries[0:2] = [_summary("c2", status="UPDATE_IN_PROGRESS", updated=UPDATE_TIME), _summary("c1", "DELETE_FAILED")]
+    stacks[1]["StackStatus"] = "UPDATE_IN_PROGRESS"
+    describe_stack.reset_mock()
+    page, _ = inventory.list_cluster_stacks()
+    assert_that([(stack["StackName"], stack["StackStatus"]) for stack in page]).is_equal_to(
+        [("c1", "DELETE_FAILED"), ("c2", "UPDATE_IN_PROGRESS")]
+    )
+    describe_stack.assert_called_once_with("id-c2")
+
+    # Deleted stacks disappear from the index
+    del summaries[1]
+    page, _ = inventory.list_cluster_stacks()
+    assert_that([stack["StackName"] for stack in page]).is_equal_to(["c2"])
+    assert_that(list_summaries.call_count).is_equal_to(3)
+
+
+def test_list_cluster_stacks_pagination_with_filter(mocker, inventory_env):
+    names = [f"cluster-{index:02d}" for index in range(10)]
+    statuses = ["CREATE_COMPLETE" if index % 2 else "CREATE_FAILED" for index in range(10)]
+    summaries = [_summary(name, status) for name, status in zip(names, statuses)]
+    stacks = [_stack(name, status) for name, status in zip(names, statuses)]
+    list_summaries, _ = _mock_cfn(mocker, summaries, stacks)
+
+    def _stack_filter(stack):
+        return stack["StackStatus"] == "CREATE_COMPLETE"
+
+    inventory = ClusterInventory.instance()
+    pages = []
+    next_token = None
+    while True:
+        page, next_token = inventory.list_cluster_stacks(next_token, _stack_filter, page_size=2)
+        pages.append([stack["StackName"] for stack in page])
+        if not next_token:
+            break
+    assert_that(pages).is_equal_to([["cluster-01", "cluster-03"], ["cluster-05", "cluster-07"], ["cluster-09"]])
+    # Only the first page refreshes the index when it is recent
+    assert_that(list_summaries.call_count).is_equal_to(1)
+
+    with pytest.raises(InvalidNextTokenError):
+        inventory.list_cluster_stacks("not-base64!")
+
+
+def test_list_cluster_stacks_full_sweep(mocker, inventory_env):
+    mocker.patch("pcluster.models.cluster_inventory.CLUSTER_INVENTORY_FULL_SWEEP_THRESHOLD", 2)
+    summaries = [_summary("c1"), _summary("c2"), _summary("other")]
+    _, describe_stack = _mock_cfn(mocker, summaries, [])
+    list_pcluster_stacks = mocker.patch(
+        "pcluster.aws.cfn.CfnClient.list_pcluster_stacks",
+        side_effect=[([_stack("c1")], "token"), ([_stack("c2")], None)],
+    )
+
+    page, _ = ClusterInventory.instance().list_cluster_stacks()
+    assert_that([stack["StackName"] for stack in page]).is_equal_to(["c1", "c2"])
+    assert_that(list_pcluster_stacks.call_count).is_equal_to(2)
+    describe_stack.assert_not_called()
+
+
+def test_inventory_persisted(mocker, inventory_env, monkeypatch, tmpdir):
+    monkeypatch.setenv("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+    monkeypatch.setenv("PCLUSTER_PERSISTENT_CACHE_DIR", str(tmpdir))
+    mocker.patch("pcluster.aws.common.PersistentCache._get_account_id", return_value="123456789012")
+    _, describe_stack = _mock_cfn(mocker, [_summary("c1")], [_stack("c1")])
+
+    ClusterInventory.instance().list_cluster_stacks()
+    ClusterInventory.reset()
+    page, _ = ClusterInventory.instance().list_cluster_stacks()
+
+    assert_that([stack["StackName"] for stack in page]).is_equal_to(["c1"])
+    describe_stack.assert_called_once()
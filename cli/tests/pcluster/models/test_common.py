@@ -9,8 +9,12 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import gzip
+import io
 import os
+import tarfile
 import time
+from types import SimpleNamespace
 
 import pytest
 from assertpy import assert_that
@@ -21,6 +25,7 @@ from pcluster.models.common import (
     FiltersParserError,
     LogGroupTimeFiltersParser,
     LogsExporterError,
+    upload_logs_archive,
 )
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
@@ -305,7 +310,7 @@ class TestCloudWatchLogsExporter:
         )
 
         expected_call_count = len(task_statuses)
-        mocker.patch("pcluster.models.cluster.time.sleep")  # so we don't actually have to wait
+        mocker.patch("pcluster.aws.common.time.sleep")  # so we don't actually have to wait
 
         cw_logs_exporter._wait_for_task_completion("task_id")
         assert_that(wait_for_task_mock.call_count).is_equal_to(expected_call_count)
@@ -326,3 +331,189 @@ class TestCloudWatchLogsExporter:
         else:
             task_id = cw_logs_exporter._export_logs_to_s3("log_group_name", "bucket")
             wait_for_completion_mock.assert_called_with(task_id)
+
+    @pytest.mark.parametrize(
+        "start_time, end_time, expected_windows",
+        [
+            (None, None, [(None, None)]),
+            (
+                datetime.datetime(2021, 6, 1, 12, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2021, 6, 2, 12, tzinfo=datetime.timezone.utc),
+                [
+                    (
+                        datetime.datetime(2021, 6, 1, 12, tzinfo=datetime.timezone.utc),
+                        datetime.datetime(2021, 6, 2, 12, tzinfo=datetime.timezone.utc),
+                    )
+                ],
+            ),
+            (
+                datetime.datetime(2021, 6, 1, 12, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2021, 6, 3, 18, tzinfo=datetime.timezone.utc),
+                [
+                    (
+                        datetime.datetime(2021, 6, 1, 12, tzinfo=datetime.timezone.utc),
+                        datetime.datetime(2021, 6, 2, 12, tzinfo=datetime.timezone.utc),
+                    ),
+                    (
+                        datetime.datetime(2021, 6, 2, 12, tzinfo=datetime.timezone.utc),
+                        datetime.datetime(2021, 6, 3, 12, tzinfo=datetime.timezone.utc),
+                    ),
+                    (
+                        datetime.datetime(2021, 6, 3, 12, tzinfo=datetime.timezone.utc),
+                        datetime.datetime(2021, 6, 3, 18, tzinfo=datetime.timezone.utc),
+                    ),
+                ],
+            ),
+        ],
+    )
+    def test_split_time_range(self, start_time, end_time, expected_windows):
+        assert_that(CloudWatchLogsExporter._split_time_range(start_time, end_time)).is_equal_to(expected_windows)
+
+    def test_execute_with_time_windows(self, mocker, set_env, tmpdir):
+        """Verify that each time window is exported and downloaded, appending the logs of the same stream."""
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.s3.S3Client.get_bucket_region", return_value="us-east-2")
+        progress_callback = mocker.MagicMock()
+        cw_logs_exporter = CloudWatchLogsExporter(
+            resource_id="clustername",
+            log_group_name="groupname",
+            bucket="bucket_name",
+            output_dir=str(tmpdir),
+            bucket_prefix="prefix",
+            progress_callback=progress_callback,
+        )
+        export_mock = mocker.patch(
+            "pcluster.models.common.CloudWatchLogsExporter._export_logs_to_s3", side_effect=["task1", "task2"]
+        )
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            side_effect=lambda bucket_name, prefix: [SimpleNamespace(key=f"{prefix}/stream/000000.gz")],
+        )
+        mocker.patch(
+            "pcluster.aws.s3.S3Client.get_object",
+            side_effect=lambda bucket_name, key: {"Body": io.BytesIO(gzip.compress(f"{key.split('/')[1]}\n".encode()))},
+        )
+        delete_objects_mock = mocker.patch("pcluster.aws.s3_resource.S3Resource.delete_objects")
+
+        start_time = datetime.datetime(2021, 6, 1, tzinfo=datetime.timezone.utc)
+        end_time = datetime.datetime(2021, 6, 2, 12, tzinfo=datetime.timezone.utc)
+        cw_logs_exporter.execute(log_stream_prefix="stream", start_time=start_time, end_time=end_time)
+
+        assert_that(export_mock.call_count).is_equal_to(2)
+        export_mock.assert_called_with(
+            log_stream_prefix="stream", start_time=start_time + datetime.timedelta(days=1), end_time=end_time
+        )
+        with open(os.path.join(tmpdir, "cloudwatch-logs", "stream"), encoding="utf-8") as stream_file:
+            assert_that(stream_file.read()).is_equal_to("task1\ntask2\n")
+        assert_that(progress_callback.call_args_list).is_equal_to([mocker.call(1, 2), mocker.call(2, 2)])
+        assert_that(delete_objects_mock.call_args_list).is_equal_to(
+            [
+                mocker.call(bucket_name="bucket_name", prefix="prefix/task1"),
+                mocker.call(bucket_name="bucket_name", prefix="prefix/task2"),
+            ]
+        )
+
+    def test_wait_for_task_completion_backoff(self, cw_logs_exporter, mocker):
+        """Verify that the export task status is polled with an increasing, capped interval."""
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.aws.logs.LogsClient.get_export_task_status", side_effect=["RUNNING"] * 5 + ["COMPLETED"])
+        sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+        mocker.patch("pcluster.aws.common.random.uniform", side_effect=lambda low, high: high)
+
+        assert_that(cw_logs_exporter._wait_for_task_completion("task_id")).is_equal_to("COMPLETED")
+        assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to([1, 2, 4, 8, 15])
+
+    def test_download_s3_objects_with_prefix(self, cw_logs_exporter, mocker, tmpdir):
+        """Verify that the objects of each log stream are extracted in order into a single file."""
+        mock_aws_api(mocker)
+        cw_logs_exporter.bucket_prefix = "prefix"
+        keys = [
+            "prefix/task_id/stream-a/000000.gz",
+            "prefix/task_id/stream-a/000001.gz",
+            "prefix/task_id/stream-b/000000.gz",
+        ]
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects", return_value=[SimpleNamespace(key=key) for key in keys]
+        )
+        get_object_mock = mocker.patch(
+            "pcluster.aws.s3.S3Client.get_object",
+            side_effect=lambda bucket_name, key: {"Body": io.BytesIO(gzip.compress(f"{key}\n".encode()))},
+        )
+
+        cw_logs_exporter._download_s3_objects_with_prefix("task_id", str(tmpdir))
+
+        assert_that(get_object_mock.call_count).is_equal_to(3)
+        with open(os.path.join(tmpdir, "stream-a"), encoding="utf-8") as stream_file:
+            assert_that(stream_file.read()).is_equal_to(f"{keys[0]}\n{keys[1]}\n")
+        with open(os.path.join(tmpdir, "stream-b"), encoding="utf-8") as stream_file:
+            assert_that(stream_file.read()).is_equal_to(f"{keys[2]}\n")
+
+
+class TestUploadLogsArchive:
+    @pytest.fixture()
+    def logs_dir(self, tmpdir):
+        logs_dir = os.path.join(tmpdir, "cluster-logs")
+        os.makedirs(os.path.join(logs_dir, "cloudwatch-logs"))
+        for index in range(3):
+            with open(os.path.join(logs_dir, "cloudwatch-logs", f"stream-{index}"), "wb") as stream_file:
+                stream_file.write(os.urandom(3000))
+        return logs_dir
+
+    @pytest.mark.parametrize(
+        "bucket_prefix, expected_key", [(None, "cluster-logs.tar.gz"), ("prefix", "prefix/cluster-logs.tar.gz")]
+    )
+    def test_upload(self, mocker, logs_dir, tmpdir, bucket_prefix, expected_key):
+        """Verify that the archive is uploaded in parts and the parts compose the expected archive."""
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.common.ARCHIVE_UPLOAD_PART_SIZE", 1000)
+        mocker.patch("pcluster.aws.s3.S3Client.create_multipart_upload", return_value="upload-id")
+        uploaded_parts = {}
+
+        def _upload_part(bucket_name, key, upload_id, part_number, body):
+            uploaded_parts[part_number] = body
+            return f"etag-{part_number}"
+
+        mocker.patch("pcluster.aws.s3.S3Client.upload_part", side_effect=_upload_part)
+        complete_mock = mocker.patch("pcluster.aws.s3.S3Client.complete_multipart_upload")
+        abort_mock = mocker.patch("pcluster.aws.s3.S3Client.abort_multipart_upload")
+
+        s3_path = upload_logs_archive(logs_dir, "bucket_name", bucket_prefix)
+
+        assert_that(s3_path).is_equal_to(f"s3://bucket_name/{expected_key}")
+        assert_that(len(uploaded_parts)).is_greater_than(1)
+        assert_that(all(len(uploaded_parts[number]) == 1000 for number in range(1, len(uploaded_parts)))).is_true()
+        complete_mock.assert_called_once_with(
+            "bucket_name",
+            expected_key,
+            "upload-id",
+            [{"ETag": f"etag-{number}", "PartNumber": number} for number in range(1, len(uploaded_parts) + 1)],
+        )
+        abort_mock.assert_not_called()
+
+        archive_path = os.path.join(tmpdir, "archive.tar.gz")
+        with open(archive_path, "wb") as archive_file:
+            for number in sorted(uploaded_parts):
+                archive_file.write(uploaded_parts[number])
+        with tarfile.open(archive_path) as tar:
+            assert_that(tar.getnames()).contains(
+                "cluster-logs/cloudwatch-logs/stream-0", "cluster-logs/cloudwatch-logs/stream-2"
+            )
+            with open(os.path.join(logs_dir, "cloudwatch-logs", "stream-1"), "rb") as stream_file:
+                expected_content = stream_file.read()
+            assert_that(tar.extractfile("cluster-logs/cloudwatch-logs/stream-1").read()).is_equal_to(expected_content)
+
+    def test_upload_failure(self, mocker, logs_dir):
+        """Verify that the multipart upload is aborted when a part fails to upload."""
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.common.ARCHIVE_UPLOAD_PART_SIZE", 1000)
+        mocker.patch("pcluster.aws.s3.S3Client.create_multipart_upload", return_value="upload-id")
+        mocker.patch("pcluster.aws.s3.S3Client.upload_part", side_effect=AWSClientError("upload_part", "error"))
+        complete_mock = mocker.patch("pcluster.aws.s3.S3Client.complete_multipart_upload")
+        abort_mock = mocker.patch("pcluster.aws.s3.S3Client.abort_multipart_upload")
+
+        with pytest.raises(AWSClientError, match="error"):
+            upload_logs_archive(logs_dir, "bucket_name", "prefix")
+
+        complete_mock.assert_not_called()
+        abort_mock.assert_called_once_with("bucket_name", "prefix/cluster-logs.tar.gz", "upload-id")
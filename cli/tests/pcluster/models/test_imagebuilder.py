@@ -441,6 +441,50 @@ def test_delete_with_cfn_error(mocker, error, returned_error):
         ImageBuilder("imageId").delete(force=True)
 
 
+def test_delete_snapshots_in_parallel(mocker, monkeypatch):
+    monkeypatch.setenv("PCLUSTER_DELETE_SNAPSHOTS_RATE_LIMIT", "1000")
+    mocker.patch("pcluster.aws.common.time.sleep")
+    mock_aws_api(mocker)
+    mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=False)
+    mocker.patch("pcluster.aws.ec2.Ec2Client.image_exists", return_value=True)
+    deregister_image_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.deregister_image")
+    mocker.patch("pcluster.models.imagebuilder.ImageBuilder.bucket", new_callable=mocker.PropertyMock)
+    mocker.patch("pcluster.aws.logs.LogsClient.delete_log_group")
+    image = ImageInfo(
+        {
+            "ImageId": "ami-1",
+            "BlockDeviceMappings": [{"Ebs": {"SnapshotId": f"snap-{index}"}} for index in range(3)],
+        }
+    )
+    throttled_snapshots = []
+
+    def _delete_snapshot(snapshot_id):
+        if snapshot_id == "snap-1" and not throttled_snapshots:
+            throttled_snapshots.append(snapshot_id)
+            raise LimitExceededError("delete_snapshot", "Rate exceeded", "RequestLimitExceeded")
+
+    delete_snapshot_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.delete_snapshot", side_effect=_delete_snapshot)
+
+    ImageBuilder(image=image, image_id="image").delete(force=True)
+    deregister_image_mock.assert_called_once_with("ami-1")
+    # The throttled deletion is retried
+    assert_that([call[0][0] for call in delete_snapshot_mock.call_args_list]).contains_only(
+        "snap-0", "snap-1", "snap-2"
+    )
+    assert_that(delete_snapshot_mock.call_count).is_equal_to(4)
+
+    # A failed deletion is raised once the other deletions are completed
+    def _delete_snapshot_in_use(snapshot_id):
+        if snapshot_id == "snap-0":
+            raise AWSClientError("delete_snapshot", "Snapshot in use", "InvalidSnapshot.InUse")
+
+    delete_snapshot_mock.reset_mock()
+    delete_snapshot_mock.side_effect = _delete_snapshot_in_use
+    with pytest.raises(ImageBuilderActionError, match="Snapshot in use"):
+        ImageBuilder(image=image, image_id="image").delete(force=True)
+    assert_that(delete_snapshot_mock.call_count).is_equal_to(3)
+
+
 @pytest.mark.parametrize(
     "config, expected_result, expected_error_message",
     [
@@ -556,7 +600,7 @@ class TestImageBuilder:
         mocker.patch("pcluster.aws.logs.LogsClient.log_group_exists", return_value=log_group_exists)
         download_stack_events_mock = mocker.patch("pcluster.models.imagebuilder.export_stack_events")
         create_logs_archive_mock = mocker.patch("pcluster.models.imagebuilder.create_logs_archive")
-        upload_archive_mock = mocker.patch("pcluster.models.imagebuilder.upload_archive")
+        upload_archive_mock = mocker.patch("pcluster.models.imagebuilder.upload_logs_archive")
         presign_mock = mocker.patch("pcluster.models.imagebuilder.create_s3_presigned_url")
 
         # Following mocks are used only if CW loggins is enabled
@@ -584,11 +628,13 @@ class TestImageBuilder:
             else:
                 cw_logs_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_not_called()
-            create_logs_archive_mock.assert_called()
 
         if "output_file" not in kwargs:
             upload_archive_mock.assert_called()
             presign_mock.assert_called()
+            create_logs_archive_mock.assert_not_called()
+        elif not expected_error:
+            create_logs_archive_mock.assert_called()
 
     @pytest.mark.parametrize(
         "log_group_exists, client_error, expected_error",
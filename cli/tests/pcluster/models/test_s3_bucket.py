@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import json
 import os
 import textwrap
@@ -224,15 +225,13 @@ def test_get_resource_url(region, bucket_name, cluster_name, resource_name, expe
                 "B": {"B1": "M"},
             },
             S3FileFormat.YAML,
-            textwrap.dedent(
-                """\
+            textwrap.dedent("""\
                 A:
                   A1: X
                   A2: Y
                 B:
                   B1: M
-                """
-            ),
+                """),
         ),
         (
             {
@@ -544,3 +543,78 @@ def test_check_bucket_is_bootstrapped(
     else:
         result = bucket.check_bucket_is_bootstrapped()
         assert_that(result).is_equal_to(expected_result)
+
+
+@pytest.mark.parametrize(
+    "uploaded_metadata, expect_upload",
+    [
+        pytest.param(None, True, id="The object does not exist"),
+        pytest.param({"content-sha256": "other-hash"}, True, id="The object has a different content"),
+        pytest.param({}, True, id="The object has no content hash"),
+        pytest.param({"content-sha256": hashlib.sha256(b"Test: Content\n").hexdigest()}, False, id="Unchanged"),
+    ],
+)
+def test_upload_file_skip_if_unchanged(mocker, uploaded_metadata, expect_upload):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket = dummy_cluster_bucket(bucket_name="test-bucket", artifact_directory="pcluster_artifact_directory")
+    mocker.patch(
+        "pcluster.aws.s3.S3Client.head_object",
+        return_value={"Metadata": uploaded_metadata},
+        side_effect=(
+            None
+            if uploaded_metadata is not None
+            else AWSClientError(function_name="head_object", message="Not Found", error_code="404")
+        ),
+    )
+    s3_put_object_patch = mocker.patch("pcluster.aws.s3.S3Client.put_object")
+
+    bucket.upload_file({"Test": "Content"}, "asset", S3FileType.ASSETS, S3FileFormat.YAML, skip_if_unchanged=True)
+
+    if expect_upload:
+        s3_put_object_patch.assert_called_once_with(
+            bucket_name="test-bucket",
+            body="Test: Content\n",
+            key="pcluster_artifact_directory/assets/asset",
+            metadata={"content-sha256": hashlib.sha256(b"Test: Content\n").hexdigest()},
+        )
+    else:
+        s3_put_object_patch.assert_not_called()
+
+
+def test_upload_resources(mocker, tmpdir):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket = dummy_cluster_bucket(bucket_name="test-bucket", artifact_directory="pcluster_artifact_directory")
+    resource_dir = tmpdir.mkdir("resources")
+    resource_dir.join("unchanged.sh").write("unchanged")
+    resource_dir.join("changed.sh").write("changed")
+    resource_dir.mkdir("custom_resources_code").join("code.py").write("code")
+    uploaded_metadata = {
+        "pcluster_artifact_directory/custom_resources/unchanged.sh": {
+            "content-sha256": hashlib.sha256(b"unchanged").hexdigest()
+        },
+        "pcluster_artifact_directory/custom_resources/changed.sh": {"content-sha256": "other-hash"},
+    }
+    mocker.patch(
+        "pcluster.aws.s3.S3Client.head_object",
+        side_effect=lambda bucket_name, object_name: {"Metadata": uploaded_metadata.get(object_name, {})},
+    )
+    upload_fileobj_patch = mocker.patch("pcluster.aws.s3.S3Client.upload_fileobj")
+
+    bucket.upload_resources(str(resource_dir), "artifacts.zip")
+
+    uploads = {upload.kwargs["key"]: upload.kwargs for upload in upload_fileobj_patch.call_args_list}
+    assert_that(uploads).is_length(2)
+    assert_that(uploads["pcluster_artifact_directory/custom_resources/changed.sh"]["metadata"]).is_equal_to(
+        {"content-sha256": hashlib.sha256(b"changed").hexdigest()}
+    )
+    zip_upload = uploads["pcluster_artifact_directory/custom_resources/artifacts.zip"]
+
+    # The archive of an unchanged directory has the same content hash, so it is not uploaded again
+    uploaded_metadata[zip_upload["key"]] = zip_upload["metadata"]
+    upload_fileobj_patch.reset_mock()
+    bucket.upload_resources(str(resource_dir), "artifacts.zip")
+    assert_that([upload.kwargs["key"] for upload in upload_fileobj_patch.call_args_list]).does_not_contain(
+        zip_upload["key"]
+    )
@@ -0,0 +1,110 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Benchmark of the pcluster CLI startup, reporting the wall time and the import time of each command.
+
+Every command is run in a new interpreter with "python -X importtime". API operations are run with --help, so that
+the startup is measured without calling AWS.
+
+Usage: python tests/pcluster/startup_benchmark.py [--runs N] [--output results.json] [command ...]
+"""
+
+import json
+import statistics
+import subprocess  # nosec B404
+import sys
+import time
+
+import argparse
+
+DEFAULT_COMMANDS = [
+    "version",
+    "list-clusters --help",
+    "describe-cluster --help",
+    "create-cluster --help",
+    "list-images --help",
+    "export-cluster-logs --help",
+    "configure --help",
+]
+
+_RUN_CLI = "import sys; from pcluster.cli.entrypoint import main; sys.argv = ['pcluster'] + sys.argv[1:]; main()"
+
+
+def _parse_importtime_lines(importtime_output):
+    """Yield the cumulative import time, in seconds, and the indented name of every module in the given output."""
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        yield int(cumulative) / 1e6, name
+
+
+def parse_import_times(importtime_output):
+    """
+    Return the cumulative import time, in seconds, of the top level modules in the given "-X importtime" output.
+
+    Modules imported on demand while running the command are reported as top level modules too.
+    """
+    return {
+        name.strip(): cumulative
+        for cumulative, name in _parse_importtime_lines(importtime_output)
+        if not name.startswith("  ")
+    }
+
+
+def parse_imported_modules(importtime_output):
+    """Return the names of all the modules imported in the given "-X importtime" output, nested ones included."""
+    return [name.strip() for _, name in _parse_importtime_lines(importtime_output)]
+
+
+def measure_command(command):
+    """Run the given pcluster command and return its wall time and the import time of its top level modules."""
+    start = time.perf_counter()
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", _RUN_CLI, *command.split()],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return time.perf_counter() - start, parse_import_times(result.stderr)
+
+
+def benchmark(commands, runs):
+    """Return the median wall time and import time of each command, with its slowest top level imports."""
+    results = {}
+    for command in commands:
+        measures = [measure_command(command) for _ in range(runs)]
+        import_times = measures[-1][1]
+        results[command] = {
+            "wall_time": statistics.median(wall_time for wall_time, _ in measures),
+            "import_time": statistics.median(sum(times.values()) for _, times in measures),
+            "slowest_imports": dict(sorted(import_times.items(), key=lambda item: item[1], reverse=True)[:5]),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pcluster CLI startup.")
+    parser.add_argument("commands", nargs="*", default=DEFAULT_COMMANDS, help="Commands to benchmark, quoted.")
+    parser.add_argument("--runs", type=int, default=3, help="Runs of each command, the median is reported.")
+    parser.add_argument("--output", help="Write the results to the given JSON file, to track them across changes.")
+    args = parser.parse_args()
+
+    results = benchmark(args.commands, args.runs)
+    print(f"{'command':40} {'wall (s)':>9} {'imports (s)':>12}")
+    for command, result in results.items():
+        print(f"{command:40} {result['wall_time']:9.3f} {result['import_time']:12.3f}")
+        for module, import_time in result["slowest_imports"].items():
+            print(f"    {module:36} {'':9} {import_time:12.3f}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
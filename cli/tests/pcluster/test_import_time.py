@@ -0,0 +1,72 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+import subprocess
+import sys
+
+import pytest
+from assertpy import assert_that
+
+from tests.pcluster.startup_benchmark import parse_import_times, parse_imported_modules
+
+CONFIG_MODULES = [
+    "pcluster.config.cluster_config",
+    "pcluster.schemas.cluster_schema",
+    "pcluster.validators.cluster_validators",
+    "pcluster.validators.ec2_validators",
+]
+TEMPLATE_MODULES = ["pcluster.templates", "aws_cdk", "pkg_resources"]
+API_MODULES = ["connexion", "pcluster.api.controllers"]
+
+
+def _import(module):
+    """Import the given module in a new interpreter and return its cumulative import time and the imported modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+    return parse_import_times(result.stderr).get(module), parse_imported_modules(result.stderr)
+
+
+@pytest.mark.parametrize(
+    "module, deferred_modules",
+    [
+        ("pcluster.aws.aws_api", ["boto3", "pcluster.aws.ec2", "pcluster.aws.cfn"]),
+        ("pcluster.cli.entrypoint", ["pcluster.models", *CONFIG_MODULES, *TEMPLATE_MODULES, *API_MODULES]),
+        ("pcluster.models.cluster", [*CONFIG_MODULES, *TEMPLATE_MODULES, *API_MODULES]),
+        ("pcluster.models.imagebuilder", ["pcluster.schemas.imagebuilder_schema", *TEMPLATE_MODULES]),
+    ],
+)
+def test_deferred_imports(module, deferred_modules):
+    _, imported_modules = _import(module)
+
+    for deferred_module in deferred_modules:
+        assert_that(
+            [name for name in imported_modules if name == deferred_module or name.startswith(f"{deferred_module}.")]
+        ).described_as(f"{deferred_module} imported by {module}").is_empty()
+
+
+# Wall-clock budgets depend on the machine and on its load, they are checked only when explicitly requested
+@pytest.mark.skipif(
+    os.environ.get("PCLUSTER_CHECK_IMPORT_TIME_BUDGETS", "false").lower() != "true",
+    reason="Set PCLUSTER_CHECK_IMPORT_TIME_BUDGETS=true to check the import time budgets",
+)
+@pytest.mark.parametrize(
+    "module, budget",
+    [
+        ("pcluster.aws.aws_api", 0.1),
+        ("pcluster.cli.entrypoint", 0.8),
+        ("pcluster.models.cluster", 0.9),
+        ("pcluster.models.imagebuilder", 0.9),
+    ],
+)
+def test_import_time_budget(module, budget):
+    # Budgets are about twice the import time measured on a development machine, the best of a few runs is compared
+    # to the budget to absorb the noise of a busy machine
+    import_time = min(_import(module)[0] for _ in range(3))
+
+    assert_that(import_time).is_less_than_or_equal_to(budget)
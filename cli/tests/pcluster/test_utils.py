@@ -10,10 +10,13 @@
 # limitations under the License.
 # This module provides unit tests for the functions in the pcluster.utils module."""
 import asyncio
+import io
 import os
 import time
 import unittest
+import zipfile
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from assertpy import assert_that
@@ -23,7 +26,7 @@ import pcluster.aws.common
 import pcluster.utils as utils
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceTypeInfo
-from pcluster.aws.common import Cache
+from pcluster.aws.common import Cache, PersistentCache
 from pcluster.constants import Feature
 from pcluster.models.cluster import Cluster, ClusterStack
 from pcluster.utils import batch_by_property_callback, yaml_load
@@ -178,6 +181,140 @@ class TestCache:
 
         assert_that(self.invocations).is_length(4)
 
+    @staticmethod
+    @Cache.cached(max_size=2)
+    def _bounded_cached_method(arg1):
+        TestCache.invocations.append(arg1)
+        return arg1
+
+    @staticmethod
+    @Cache.cached(ttl=10)
+    def _expiring_cached_method(arg1):
+        TestCache.invocations.append(arg1)
+        return arg1
+
+    def test_lru_eviction(self):
+        self._bounded_cached_method(1)
+        self._bounded_cached_method(2)
+        # Access 1 so that 2 becomes the least recently used entry
+        self._bounded_cached_method(1)
+        self._bounded_cached_method(3)
+        self._bounded_cached_method(1)
+        self._bounded_cached_method(2)
+
+        assert_that(self.invocations).is_equal_to([1, 2, 3, 2])
+        stats = self._bounded_cached_method.cache.stats()
+        assert_that(stats.size).is_equal_to(2)
+        assert_that(stats.hits).is_equal_to(2)
+        assert_that(stats.misses).is_equal_to(4)
+        assert_that(stats.evictions).is_equal_to(2)
+
+    def test_ttl_expiration(self, mocker):
+        monotonic = mocker.patch("pcluster.aws.common.time.monotonic", return_value=100)
+        self._expiring_cached_method(1)
+        monotonic.return_value = 105
+        self._expiring_cached_method(1)
+        monotonic.return_value = 111
+        self._expiring_cached_method(1)
+
+        assert_that(self.invocations).is_length(2)
+        stats = self._expiring_cached_method.cache.stats()
+        assert_that(stats.hits).is_equal_to(1)
+        assert_that(stats.expirations).is_equal_to(1)
+
+    def test_concurrent_invocations(self):
+        def _slow(arg1):
+            time.sleep(0.2)
+            TestCache.invocations.append(arg1)
+            return arg1
+
+        slow_cached = Cache.cached(_slow)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(slow_cached, [1, 1, 1, 1]))
+
+        assert_that(results).is_equal_to([1, 1, 1, 1])
+        assert_that(self.invocations).is_length(1)
+        stats = slow_cached.cache.stats()
+        assert_that(stats.waits).is_equal_to(3)
+        # Per-key mutexes are released once no caller is using them
+        assert_that(slow_cached.cache._key_locks).is_empty()
+
+    def test_get_stats(self):
+        self._cached_method_1(1, 2)
+        self._cached_method_1(1, 2)
+
+        stats = Cache.get_stats()[self._cached_method_1.__qualname__].to_dict()
+        assert_that(stats).contains_entry({"hits": 1}, {"misses": 1}, {"size": 1})
+
+        Cache.clear_all()
+        assert_that(Cache.get_stats()[self._cached_method_1.__qualname__].to_dict()).contains_entry(
+            {"hits": 0}, {"misses": 0}, {"size": 0}
+        )
+
+
+class TestPersistentCache:
+    invocations = []
+
+    @pytest.fixture(autouse=True)
+    def persistent_cache(self, mocker, tmpdir):
+        del self.invocations[:]
+        Cache.clear_all()
+        mocker.patch.dict(
+            os.environ, {"PCLUSTER_PERSISTENT_CACHE_ENABLED": "true", "PCLUSTER_PERSISTENT_CACHE_DIR": str(tmpdir)}
+        )
+        mocker.patch("pcluster.aws.common.get_region", return_value="us-east-1")
+        mocker.patch("pcluster.aws.common.PersistentCache._get_account_id", return_value="123456789012")
+        return tmpdir
+
+    @staticmethod
+    @Cache.cached(persistent_ttl=60)
+    def _persisted_method(arg1, arg2=None):
+        TestPersistentCache.invocations.append(arg1)
+        return {"arg1": arg1, "arg2": arg2}
+
+    def test_results_are_reused_across_processes(self, persistent_cache):
+        assert_that(self._persisted_method("a", arg2=[1])).is_equal_to({"arg1": "a", "arg2": [1]})
+        # Clearing the in-memory caches simulates a new CLI invocation
+        Cache.clear_all()
+        assert_that(self._persisted_method("a", arg2=[1])).is_equal_to({"arg1": "a", "arg2": [1]})
+        assert_that(self._persisted_method("b")).is_equal_to({"arg1": "b", "arg2": None})
+
+        assert_that(self.invocations).is_equal_to(["a", "b"])
+        assert_that(
+            os.listdir(os.path.join(persistent_cache, "123456789012", "us-east-1", self._persisted_method.__qualname__))
+        ).is_length(2)
+
+    def test_expired_entries(self, mocker):
+        now = mocker.patch("pcluster.aws.common.time.time", return_value=1000)
+        self._persisted_method("a")
+        Cache.clear_all()
+        now.return_value = 1061
+        self._persisted_method("a")
+
+        assert_that(self.invocations).is_length(2)
+
+    def test_corrupted_entries_are_ignored(self, persistent_cache):
+        self._persisted_method("a")
+        for root, _, files in os.walk(persistent_cache):
+            for file in files:
+                with open(os.path.join(root, file), "w", encoding="utf-8") as entry_file:
+                    entry_file.write("{not-json")
+        Cache.clear_all()
+
+        assert_that(self._persisted_method("a")).is_equal_to({"arg1": "a", "arg2": None})
+        assert_that(self.invocations).is_length(2)
+
+    def test_disabled(self, mocker):
+        mocker.patch.dict(os.environ, {"PCLUSTER_PERSISTENT_CACHE_ENABLED": "false"})
+        self._persisted_method("a")
+        Cache.clear_all()
+        self._persisted_method("a")
+
+        assert_that(self.invocations).is_length(2)
+        assert_that(PersistentCache.get("TestPersistentCache._persisted_method", [["a"], {}])).is_equal_to(
+            (False, None)
+        )
+
 
 def test_init_from_instance_type(mocker, caplog):
     mock_aws_api(mocker, mock_instance_type_info=False)
@@ -698,3 +835,21 @@ def test_format_arn(partition, service, region, account, resource, expected_resu
     """Test format_arn with various inputs."""
     result = utils.format_arn(partition, service, region, account, resource)
     assert_that(result).is_equal_to(expected_result)
+
+
+def test_zip_dir(tmpdir):
+    resource_dir = tmpdir.mkdir("resources")
+    resource_dir.join("b.txt").write("b" * 1024)
+    resource_dir.mkdir("a").join("c.txt").write("c")
+
+    with utils.zip_dir(str(resource_dir)) as archive:
+        content = archive.read()
+    # Archives are byte-identical across runs, regardless of the modification time of the files
+    os.utime(str(resource_dir.join("b.txt")), (0, 0))
+    with utils.zip_dir(str(resource_dir)) as archive:
+        assert_that(archive.read()).is_equal_to(content)
+
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert_that(archive.namelist()).is_equal_to(["b.txt", "a/c.txt"])
+        assert_that(archive.read("b.txt")).is_equal_to(b"b" * 1024)
+        assert_that([entry.compress_type for entry in archive.infolist()]).contains_only(zipfile.ZIP_DEFLATED)
@@ -416,7 +416,8 @@ def test_slurm_validators_are_called_with_correct_argument(test_datadir, mocker)
                 subnet="subnet-23456789",
                 capacity_type=CapacityType.CAPACITY_BLOCK,
             ),
-        ]
+        ],
+        any_order=True,
     )
     capacity_type_validator.assert_has_calls(
         [